@@ -5,77 +5,45 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from collections import Counter
-from scipy import stats
 from normalize import normalize_company, standardize_current_placement
+from features import ensure_features, load_features
 
 DATA_PATH = Path(__file__).parent / "data" / "candidates.csv"
 ENRICHED_PATH = Path(__file__).parent / "data" / "candidates_enriched.csv"
 
-# Seniority levels for career progression analysis (ordered from highest to lowest)
-# Note: Director must come before Chief to avoid 'cto' matching 'Director'
-SENIORITY_LEVELS = {
-    'Director': ['director'],
-    'Founder': ['founder', 'co-founder'],
-    'Chief': ['chief', 'ceo', ' cto', 'coo'],
-    'VP': ['vp ', 'vice president'],
-    'Head': ['head of', 'head '],
-    'Manager': ['manager'],
-    'Principal': ['principal'],
-    'Staff': ['staff'],
-    'Lead': ['lead'],
-    'Senior': ['senior', 'sr.', 'sr '],
-}
-
-# Manual overrides for specific people whose titles don't reflect true seniority
-SENIORITY_OVERRIDES = {
-    'Korkut': 'Entry/IC',           # "Principal Consultant" is consulting title
-    'David Mao': 'Entry/IC',        # LinkedIn shows "Applied Scientist", not Senior
-    'Meghanath M Y': 'Senior',      # "Head of AI" at tiny startup != Head at big tech
-    'Shreya Bhattacharya': 'Senior',  # "Research Director (Asst Prof)" is academic, not tech
-}
-
-
-def get_seniority(role: str, name: str = None) -> str:
-    """Extract seniority level from a role title.
-
-    Args:
-        role: Job title string
-        name: Person's name (optional, for manual overrides)
-
-    Returns one of the seniority levels or None if role is empty.
-    """
-    # Check manual overrides first
-    if name and name in SENIORITY_OVERRIDES:
-        return SENIORITY_OVERRIDES[name]
-
-    if pd.isna(role) or str(role) in ['', '0', 'nan']:
-        return None
-    role_lower = str(role).lower()
-    for level, keywords in SENIORITY_LEVELS.items():
-        if any(kw in role_lower for kw in keywords):
-            return level
-    return 'Entry/IC'
+# Reference year for "years since PhD" in the printed analyses
+REFERENCE_YEAR = 2025
 
 
-def load_data() -> pd.DataFrame:
-    """Load the candidates dataset with normalized company names."""
-    df = pd.read_csv(DATA_PATH)
-
-    # Filter to 2014 and later only
+def filter_recent(df: pd.DataFrame) -> pd.DataFrame:
+    """Filter to 2014 and later only."""
     if 'graduation_year' in df.columns:
         df = df[df['graduation_year'] >= 2014]
+    return df
+
 
-    # Normalize company names (Facebook→Meta, Twitter→X, etc.)
+def prepare_basic(df: pd.DataFrame) -> pd.DataFrame:
+    """Filter to 2014+ and normalize company names (Facebook→Meta, Twitter→X, etc.)."""
+    df = filter_recent(df).copy()
     if 'initial_placement' in df.columns:
         df['initial_placement'] = df['initial_placement'].apply(normalize_company)
     if 'current_company' in df.columns:
         df['current_company'] = df['current_company'].apply(standardize_current_placement)
     if 'current_placement' in df.columns:
         df['current_placement'] = df['current_placement'].apply(standardize_current_placement)
-
     return df
 
 
+def load_data() -> pd.DataFrame:
+    """Load the candidates dataset with normalized company names and derived features."""
+    return load_features(DATA_PATH, prepare=prepare_basic, persist=True)
+
+
+def load_enriched() -> pd.DataFrame:
+    """Load the enriched dataset (2014+) with derived features."""
+    return load_features(ENRICHED_PATH, prepare=filter_recent, persist=True)
+
+
 def placements_by_school(df: pd.DataFrame) -> pd.Series:
     """Count placements by PhD-granting institution."""
     return df["school"].value_counts()
@@ -177,18 +145,8 @@ def career_progression_analysis(df: pd.DataFrame) -> dict:
     - retention_by_company: {company: retention_rate}
     - popular_transitions: [(from, to, count), ...]
     """
-    # Identify job changers
-    df_copy = df.copy()
-    if 'current_company' not in df_copy.columns:
-        df_copy['current_company'] = df_copy['initial_placement']
-
-    df_copy['current_co'] = df_copy['current_company'].fillna(df_copy['initial_placement'])
-    df_copy['moved'] = df_copy.apply(
-        lambda r: str(r['initial_placement']).lower().strip() != str(r['current_co']).lower().strip()
-        if pd.notna(r['current_co']) and str(r['current_co']) not in ['', '0', '0.0', 'nan']
-        else False,
-        axis=1
-    )
+    # Identify job changers (moved/current_co come from the features frame)
+    df_copy = ensure_features(df)
 
     # Retention by company (top 10 companies by hire count)
     top_companies = df_copy['initial_placement'].value_counts().head(10).index
@@ -202,9 +160,9 @@ def career_progression_analysis(df: pd.DataFrame) -> dict:
     movers = df_copy[df_copy['moved']]
 
     # Popular transitions
-    transitions = movers.apply(lambda r: (r['initial_placement'], r['current_co']), axis=1)
-    trans_counts = transitions.value_counts().head(15)
-    popular = [(t[0], t[1], c) for t, c in trans_counts.items()]
+    trans_counts = movers.groupby(['initial_placement', 'current_co'], sort=False).size()
+    trans_counts = trans_counts.sort_values(ascending=False, kind='stable').head(15)
+    popular = [(src, dst, c) for (src, dst), c in trans_counts.items()]
 
     return {
         'retention_by_company': retention,
@@ -222,9 +180,7 @@ def seniority_distribution(df: pd.DataFrame) -> pd.DataFrame:
     - count: Number of economists at that level
     - percentage: Percentage of total
     """
-    df_copy = df.copy()
-    df_copy['seniority'] = df_copy.apply(
-        lambda r: get_seniority(r['current_role'], r.get('name')), axis=1)
+    df_copy = ensure_features(df)
 
     # Filter to those with known roles
     df_with_role = df_copy[df_copy['seniority'].notna()]
@@ -261,10 +217,8 @@ def promotion_timeline_analysis(df: pd.DataFrame) -> pd.DataFrame:
     - max: Maximum years
     - n: Count at that level
     """
-    df_copy = df.copy()
-    df_copy['seniority'] = df_copy.apply(
-        lambda r: get_seniority(r['current_role'], r.get('name')), axis=1)
-    df_copy['years_since_phd'] = 2025 - df_copy['graduation_year']
+    df_copy = ensure_features(df).copy()
+    df_copy['years_since_phd'] = REFERENCE_YEAR - df_copy['graduation_year']
 
     # Filter to those with seniority above Entry/IC
     df_senior = df_copy[
@@ -303,10 +257,8 @@ def high_achievers_analysis(df: pd.DataFrame) -> dict:
     - research_fields: Counter of research fields
     - avg_years_to_director: Average years since PhD for Director+ roles
     """
-    df_copy = df.copy()
-    df_copy['seniority'] = df_copy.apply(
-        lambda r: get_seniority(r['current_role'], r.get('name')), axis=1)
-    df_copy['years_since_phd'] = 2025 - df_copy['graduation_year']
+    df_copy = ensure_features(df).copy()
+    df_copy['years_since_phd'] = REFERENCE_YEAR - df_copy['graduation_year']
 
     # Filter to Director and above
     high_levels = {'Director', 'Head', 'VP', 'Chief', 'Founder'}
@@ -357,6 +309,8 @@ def statistical_analysis(df: pd.DataFrame) -> dict:
 
     Returns dict with chi-square results (no quality rankings).
     """
+    from scipy import stats  # deferred: scipy dominates analyze.py import time
+
     results = {}
 
     # Chi-square: School independence from Company
@@ -566,10 +520,7 @@ def print_extended_analysis(df: pd.DataFrame) -> None:
 if __name__ == "__main__":
     # Try enriched data first, fall back to basic
     if ENRICHED_PATH.exists():
-        df = pd.read_csv(ENRICHED_PATH)
-        # Filter to 2014 and later only
-        if 'graduation_year' in df.columns:
-            df = df[df['graduation_year'] >= 2014]
+        df = load_enriched()
         print(f"Loaded enriched data: {len(df)} candidates (2014+)")
     else:
         df = load_data()
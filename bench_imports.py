@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the pipeline scripts.
+
+Imports each module in a fresh interpreter under `python -X importtime`
+and reports wall-clock startup plus the heaviest top-level packages.
+
+Usage:
+    python bench_imports.py                  # all pipeline modules
+    python bench_imports.py scraper charts   # selected modules
+"""
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+MODULES = ['scraper', 'charts', 'analyze', 'enricher', 'pdf_parser']
+
+# "import time: self [us] | cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def profile_import(module: str) -> tuple:
+    """Import a module in a fresh interpreter.
+
+    Returns:
+        Tuple of (wall seconds, {top-level package: cumulative us}, error or None)
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - start
+
+    packages = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        # Direct imports of the module (one level below it) carry the full cost of each package
+        if not match or len(match.group(3)) != 3:
+            continue
+        name = match.group(4).split('.')[0]
+        packages[name] = packages.get(name, 0) + int(match.group(2))
+
+    error = None
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'failed'
+    return wall, packages, error
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Benchmark pipeline script import time')
+    parser.add_argument('modules', nargs='*', default=MODULES,
+                        help=f"Modules to import (default: {' '.join(MODULES)})")
+    parser.add_argument('--runs', '-n', type=int, default=3,
+                        help='Fresh interpreters per module; best run is reported (default: 3)')
+    parser.add_argument('--top', type=int, default=5,
+                        help='Heaviest packages to list per module (default: 5)')
+    args = parser.parse_args()
+
+    print(f"{'='*50}")
+    print("STARTUP BENCHMARK (python -X importtime)")
+    print(f"{'='*50}")
+
+    for module in args.modules:
+        runs = [profile_import(module) for _ in range(args.runs)]
+        wall, packages, error = min(runs, key=lambda r: r[0])
+
+        print(f"\n{module}: {wall * 1000:.0f} ms")
+        if error:
+            print(f"  import failed: {error}")
+            continue
+        for name, us in sorted(packages.items(), key=lambda p: -p[1])[:args.top]:
+            print(f"  {name:<24} {us / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark PDF extraction: full pdfplumber path vs text-first path.
+
+Runs both extraction paths over recorded placement PDFs (by default the
+downloads cached in data/cache/pdf) and reports time per page, how many
+pages needed table detection, and whether both paths yield the same
+candidates. Interpreting the extracted pages (table rows and text lines
+into candidates) is timed separately.
+
+Usage:
+    python bench_pdf.py                      # cached downloads
+    python bench_pdf.py history.pdf ...      # specific files
+"""
+import time
+from pathlib import Path
+
+from pdf_parser import PDF_CACHE_DIR, PDFPlacementParser, _extract_pages, pdfium
+
+
+def bench(path: Path, runs: int) -> dict:
+    """Time both extraction paths on one PDF (best of runs)."""
+    parser = PDFPlacementParser('Benchmark')
+    result = {}
+    for label, text_first in (('full', False), ('text-first', True)):
+        best = None
+        for _ in range(runs):
+            start = time.perf_counter()
+            pages = _extract_pages(str(path), 0, None, text_first=text_first)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        start = time.perf_counter()
+        candidates = parser.parse_pages(pages)
+        result[label] = {
+            'seconds': best,
+            'interpret_seconds': time.perf_counter() - start,
+            'pages': len(pages),
+            'table_pages': sum(1 for tables, _ in pages if tables),
+            'candidates': candidates,
+        }
+    return result
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Benchmark PDF extraction paths')
+    parser.add_argument('pdfs', nargs='*', type=Path,
+                        help=f'PDF files (default: {PDF_CACHE_DIR}/*.pdf)')
+    parser.add_argument('--runs', '-n', type=int, default=3,
+                        help='Runs per path; best is reported (default: 3)')
+    args = parser.parse_args()
+
+    pdfs = args.pdfs or sorted(PDF_CACHE_DIR.glob('*.pdf'))
+    if not pdfs:
+        print(f"No PDFs given and none cached in {PDF_CACHE_DIR}/")
+        return
+    if pdfium is None:
+        print("Note: pypdfium2 not installed, text-first path falls back to pdfplumber")
+
+    print(f"{'='*50}")
+    print("PDF EXTRACTION BENCHMARK")
+    print(f"{'='*50}")
+    for path in pdfs:
+        result = bench(path, args.runs)
+        full, fast = result['full'], result['text-first']
+        print(f"\n{path.name} ({full['pages']} pages, {full['table_pages']} with tables)")
+        for label, r in result.items():
+            per_page = r['seconds'] / max(r['pages'], 1) * 1000
+            print(f"  {label:<11} {r['seconds']:7.2f}s  {per_page:7.1f} ms/page  "
+                  f"{len(r['candidates'])} candidates")
+        print(f"  interpret   {fast['interpret_seconds'] * 1000:7.1f} ms")
+        print(f"  speedup     {full['seconds'] / fast['seconds']:6.1f}x  "
+              f"same candidates: {'yes' if full['candidates'] == fast['candidates'] else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
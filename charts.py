@@ -1,15 +1,22 @@
 #!/usr/bin/env python3
 """Generate visualizations for Economics PhD tech placements."""
 
+import contextlib
+import hashlib
+import inspect
+import io
+import json
+import multiprocessing
+import os
 import re
+import time
 import pandas as pd
+import matplotlib
 import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
-import networkx as nx
 from datetime import datetime
-from wordcloud import WordCloud
 from pathlib import Path
+from features import ensure_features, load_features
 from work_tags import (
     WORK_TAGS,
     DOMAIN_TAGS,
@@ -22,6 +29,10 @@ from work_tags import (
 # Paths
 DATA_PATH = Path(__file__).parent / "data" / "candidates_enriched.csv"
 CHARTS_DIR = Path(__file__).parent / "charts"
+FINGERPRINTS_PATH = Path(__file__).parent / "data" / "cache" / "chart_fingerprints.json"
+
+# Bump when shared rendering code (theme, helpers) changes in a way that affects every chart
+CHART_CODE_VERSION = 1
 
 # Dark theme colors
 COLORS = {
@@ -54,6 +65,11 @@ NON_TECH_CATEGORIES = {
 }
 
 
+def _as_str(series: pd.Series) -> pd.Series:
+    """Element-wise str(), matching f-string formatting of each value."""
+    return series.map(str).astype(object)
+
+
 def setup_dark_theme():
     """Configure matplotlib for dark theme."""
     plt.style.use("dark_background")
@@ -73,9 +89,72 @@ def setup_dark_theme():
     })
 
 
-def load_data() -> pd.DataFrame:
-    """Load the candidates dataset (tech only, excludes finance firms)."""
-    df = pd.read_csv(DATA_PATH)
+def chart_inputs(output: str, columns: list, **params):
+    """Declare a chart's output file, input columns and extra parameters.
+
+    The renderer fingerprints exactly these inputs (plus the chart's source
+    and keyword defaults) to decide whether the PNG needs redrawing.
+    """
+    def decorate(func):
+        func.output = output
+        func.columns = tuple(columns)
+        func.params = params
+        return func
+    return decorate
+
+
+def chart_fingerprint(func, df: pd.DataFrame) -> str:
+    """Hash a chart's declared data slice, parameters and code version."""
+    defaults = {
+        name: p.default for name, p in inspect.signature(func).parameters.items()
+        if p.default is not inspect.Parameter.empty
+    }
+    params = {**defaults, **func.params}
+    columns = [c for c in func.columns if c in df.columns]
+
+    digest = hashlib.sha256()
+    digest.update(f"{CHART_CODE_VERSION}|{func.__name__}|{func.columns}|{COLORS}|{PALETTE}".encode())
+    digest.update(repr(sorted(params.items())).encode())
+    digest.update(inspect.getsource(func).encode())
+    digest.update(df[columns].to_csv(index=False).encode())
+    return digest.hexdigest()
+
+
+def _file_sha(path: Path) -> str:
+    """SHA-256 of a rendered chart file."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _load_fingerprints() -> dict:
+    """Load the fingerprint manifest of previously rendered charts."""
+    if FINGERPRINTS_PATH.exists():
+        try:
+            with open(FINGERPRINTS_PATH) as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            pass
+    return {}
+
+
+def _save_fingerprints(manifest: dict) -> None:
+    """Save the fingerprint manifest."""
+    FINGERPRINTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(FINGERPRINTS_PATH, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def _is_current(func, fingerprint: str, manifest: dict) -> bool:
+    """True if the chart's PNG exists and was rendered from the same fingerprint."""
+    entry = manifest.get(func.__name__)
+    output = CHARTS_DIR / func.output
+    if not entry or entry.get('fingerprint') != fingerprint or not output.exists():
+        return False
+    # Guard against the PNG being replaced since it was rendered (e.g. git checkout)
+    return entry.get('sha256') == _file_sha(output)
+
+
+def filter_tech(df: pd.DataFrame) -> pd.DataFrame:
+    """Keep 2014+ graduates and drop finance firms."""
     # Filter to 2014 and later only
     if 'graduation_year' in df.columns:
         df = df[df['graduation_year'] >= 2014]
@@ -85,6 +164,22 @@ def load_data() -> pd.DataFrame:
     return df
 
 
+def load_data() -> pd.DataFrame:
+    """Load the candidates dataset (tech only, excludes finance firms) with derived features."""
+    return load_features(DATA_PATH, prepare=filter_tech, persist=True)
+
+
+def _field_company_pairs(df: pd.DataFrame) -> pd.DataFrame:
+    """One row per (research field, initial company), from the field_list feature."""
+    pairs = df[['field_list', 'initial_placement']].explode('field_list')
+    pairs = pairs[pairs['field_list'].notna()]
+    return pd.DataFrame({
+        'field': pairs['field_list'].tolist(),
+        'company': pairs['initial_placement'].tolist(),
+    })
+
+
+@chart_inputs("school_placements.png", ["school"])
 def chart_placements_by_school(df: pd.DataFrame) -> None:
     """Bar chart of placements by school."""
     data = df["school"].value_counts()
@@ -100,6 +195,7 @@ def chart_placements_by_school(df: pd.DataFrame) -> None:
     print("  - school_placements.png")
 
 
+@chart_inputs("top_companies.png", ["initial_placement"])
 def chart_top_companies(df: pd.DataFrame, top_n: int = 20) -> None:
     """Bar chart of top hiring companies (tech only)."""
     data = df["initial_placement"].value_counts().head(top_n)
@@ -115,8 +211,10 @@ def chart_top_companies(df: pd.DataFrame, top_n: int = 20) -> None:
     print("  - top_companies.png")
 
 
+@chart_inputs("heatmap.png", ["school", "initial_placement"])
 def chart_heatmap(df: pd.DataFrame) -> None:
     """Heatmap of school vs company placements."""
+    import seaborn as sns
     matrix = pd.crosstab(df["school"], df["initial_placement"])
     matrix = matrix.loc[:, matrix.sum() >= 2]
 
@@ -137,6 +235,7 @@ def chart_heatmap(df: pd.DataFrame) -> None:
     print("  - heatmap.png")
 
 
+@chart_inputs("timeline.png", ["graduation_year"])
 def chart_timeline(df: pd.DataFrame) -> None:
     """Timeline of placements by graduation year."""
     data = df["graduation_year"].value_counts().sort_index()
@@ -154,6 +253,7 @@ def chart_timeline(df: pd.DataFrame) -> None:
     print("  - timeline.png")
 
 
+@chart_inputs("roles.png", ["current_role"])
 def chart_roles(df: pd.DataFrame) -> None:
     """Pie chart of role distribution."""
     roles = df["current_role"].dropna()
@@ -200,29 +300,16 @@ def chart_roles(df: pd.DataFrame) -> None:
     print("  - roles.png")
 
 
+@chart_inputs("research_to_company.png", ["field_list", "initial_placement"])
 def chart_research_to_company(df: pd.DataFrame) -> None:
     """Research Field → Company as stacked bar (rank ordered)."""
-    # Generic terms to exclude - these are not real research specializations
-    GENERIC_TERMS = {
-        'economics', 'economist', 'economic', 'phd', 'ph.d', 'applied',
-        'theory', 'microeconomics', 'microeconomic'  # too broad
-    }
-
-    rows = []
-    for _, r in df.iterrows():
-        fields = str(r.get('research_fields', '')).split(',')
-        for field in fields:
-            field = field.strip()
-            # Skip empty, nan, and generic terms
-            if field and field != 'nan' and field.lower() not in GENERIC_TERMS:
-                rows.append({'field': field[:30], 'company': r['initial_placement']})
+    # Generic terms are already excluded from field_list
+    field_df = _field_company_pairs(ensure_features(df))
 
-    if not rows:
+    if field_df.empty:
         print("  - research_to_company.png (skipped - no data)")
         return
 
-    field_df = pd.DataFrame(rows)
-
     # Get field counts and sort by total (rank order)
     field_counts = field_df['field'].value_counts()
     top_fields = field_counts.head(12).index.tolist()
@@ -247,28 +334,16 @@ def chart_research_to_company(df: pd.DataFrame) -> None:
     print("  - research_to_company.png")
 
 
+@chart_inputs("field_to_firm.png", ["field_list", "initial_placement"])
 def chart_field_to_firm(df: pd.DataFrame) -> None:
     """Field → Firm mapping: which research fields go to which companies."""
-    # Generic terms to exclude
-    GENERIC_TERMS = {
-        'economics', 'economist', 'economic', 'phd', 'ph.d', 'applied',
-        'theory', 'microeconomics', 'microeconomic'
-    }
+    import seaborn as sns
+    field_df = _field_company_pairs(ensure_features(df))
 
-    rows = []
-    for _, r in df.iterrows():
-        fields = str(r.get('research_fields', '')).split(',')
-        for field in fields:
-            field = field.strip()
-            if field and field != 'nan' and field.lower() not in GENERIC_TERMS:
-                rows.append({'field': field[:30], 'company': r['initial_placement']})
-
-    if not rows:
+    if field_df.empty:
         print("  - field_to_firm.png (skipped - no data)")
         return
 
-    field_df = pd.DataFrame(rows)
-
     # Get top fields and all companies with 2+ hires
     field_counts = field_df['field'].value_counts()
     top_fields = field_counts[field_counts >= 2].head(15).index.tolist()
@@ -303,6 +378,7 @@ def chart_field_to_firm(df: pd.DataFrame) -> None:
     print("  - field_to_firm.png")
 
 
+@chart_inputs("teams.png", ["team"])
 def chart_teams(df: pd.DataFrame) -> None:
     """Bar chart of teams/orgs people join."""
     teams = df['team'].dropna()
@@ -346,16 +422,10 @@ def chart_teams(df: pd.DataFrame) -> None:
 
 def _get_work_texts(df: pd.DataFrame) -> list:
     """Extract combined work_focus + team texts from dataframe."""
-    work_texts = []
-    for _, row in df.iterrows():
-        work_focus = str(row.get('work_focus', '')).strip()
-        team = str(row.get('team', '')).strip()
-        combined = f"{work_focus} {team}".strip()
-        if combined and combined not in ('nan', '0', '0.0', 'nan nan'):
-            work_texts.append(combined)
-    return work_texts
+    return ensure_features(df)['work_text'].dropna().tolist()
 
 
+@chart_inputs("work_domains.png", ["work_text"], tags=DOMAIN_TAGS)
 def chart_work_domains(df: pd.DataFrame) -> None:
     """Bar chart of work DOMAINS (what area they work in)."""
     work_texts = _get_work_texts(df)
@@ -384,6 +454,7 @@ def chart_work_domains(df: pd.DataFrame) -> None:
     print(f"  - work_domains.png ({len(work_texts)} candidates)")
 
 
+@chart_inputs("work_methods.png", ["work_text"], tags=METHOD_TAGS)
 def chart_work_methods(df: pd.DataFrame) -> None:
     """Bar chart of work METHODS (what techniques they use)."""
     work_texts = _get_work_texts(df)
@@ -412,6 +483,7 @@ def chart_work_methods(df: pd.DataFrame) -> None:
     print(f"  - work_methods.png ({len(work_texts)} candidates)")
 
 
+@chart_inputs("work_ngrams.png", ["work_phrase_text"])
 def chart_work_ngrams(df: pd.DataFrame) -> None:
     """Bar chart of top ngrams extracted from work_focus and team fields."""
     # Words to filter out (company names, generic org terms)
@@ -422,19 +494,14 @@ def chart_work_ngrams(df: pd.DataFrame) -> None:
         'intelligence', 'central', 'applied', 'core'
     }
 
-    # Collect all work-related text, splitting on slashes/commas to get separate phrases
-    work_phrases = set()  # Use set to deduplicate
-    for _, row in df.iterrows():
-        work_focus = str(row.get('work_focus', '')).strip()
-        team = str(row.get('team', '')).strip()
-        # Prefer work_focus over team (more descriptive)
-        text = work_focus if work_focus and work_focus not in ('nan', '0', '0.0', 'Unknown') else team
-        if text and text not in ('nan', '0', '0.0', 'Unknown'):
-            # Split on slashes and commas to get separate phrases
-            for phrase in re.split(r'[/,]', text):
-                phrase = phrase.strip()
-                if phrase and len(phrase) > 3:
-                    work_phrases.add(phrase)
+    # Collect all work-related text (work_focus preferred over team),
+    # splitting on slashes/commas to get separate phrases
+    work_phrases = {}  # Ordered dedup, so ngram ties are stable across runs
+    for text in ensure_features(df)['work_phrase_text'].dropna():
+        for phrase in re.split(r'[/,]', text):
+            phrase = phrase.strip()
+            if phrase and len(phrase) > 3:
+                work_phrases[phrase] = None
 
     work_texts = list(work_phrases)
 
@@ -472,8 +539,10 @@ def chart_work_ngrams(df: pd.DataFrame) -> None:
     print(f"  - work_ngrams.png ({len(work_texts)} text samples)")
 
 
+@chart_inputs("company_roles.png", ["current_role", "initial_placement"])
 def chart_company_roles(df: pd.DataFrame) -> None:
     """Heatmap: Company × Role type."""
+    import seaborn as sns
     categories = {
         "Economist": ["economist"],
         "Data Scientist": ["data scientist"],
@@ -515,25 +584,18 @@ def chart_company_roles(df: pd.DataFrame) -> None:
     print("  - company_roles.png")
 
 
+@chart_inputs("movers.png", ["moved", "initial_placement", "current_co"])
 def chart_movers(df: pd.DataFrame) -> None:
     """Who changed companies? Initial vs Current."""
-    df_copy = df.copy()
-    df_copy['current_company'] = df_copy['current_company'].fillna(df_copy['initial_placement'])
-    df_copy['moved'] = df_copy.apply(
-        lambda r: str(r['initial_placement']).lower().strip() != str(r['current_company']).lower().strip()
-        if pd.notna(r['current_company']) and r['current_company'] not in ['', '0', '0.0', 'nan']
-        else False,
-        axis=1
-    )
-
-    movers = df_copy[df_copy['moved']]
+    df = ensure_features(df)
+    movers = df[df['moved']]
 
     if len(movers) == 0:
         print("  - movers.png (skipped - no job changes)")
         return
 
     # Create transition labels
-    transitions = movers.apply(lambda r: f"{r['initial_placement']} → {r['current_company']}", axis=1)
+    transitions = _as_str(movers['initial_placement']) + " → " + _as_str(movers['current_co'])
     trans_counts = transitions.value_counts().head(15)
 
     fig, ax = plt.subplots(figsize=(12, 8))
@@ -547,6 +609,7 @@ def chart_movers(df: pd.DataFrame) -> None:
     print("  - movers.png")
 
 
+@chart_inputs("school_to_role.png", ["current_role", "school"])
 def chart_school_to_role(df: pd.DataFrame) -> None:
     """Stacked bar: School → Role type."""
     categories = {
@@ -589,6 +652,7 @@ def chart_school_to_role(df: pd.DataFrame) -> None:
     print("  - school_to_role.png")
 
 
+@chart_inputs("selectivity.png", ["initial_placement", "school"])
 def chart_selectivity(df: pd.DataFrame) -> None:
     """Show which schools each company hires from (target school analysis)."""
     # Get company-school counts
@@ -643,19 +707,17 @@ def chart_selectivity(df: pd.DataFrame) -> None:
     print("  - selectivity.png")
 
 
+@chart_inputs("network_graph.png", ["moved", "initial_placement", "current_co"])
 def chart_network_graph(df: pd.DataFrame) -> None:
     """Network graph of talent flows between companies."""
-    # Build transition graph
-    df_copy = df.copy()
-    df_copy['current_co'] = df_copy['current_company'].fillna(df_copy['initial_placement'])
-
+    import networkx as nx
     # Create edges from initial -> current (only if different)
-    edges = []
-    for _, row in df_copy.iterrows():
-        initial = str(row['initial_placement']).strip()
-        current = str(row['current_co']).strip()
-        if initial and current and initial.lower() != current.lower() and current not in ['nan', '0', '0.0', '']:
-            edges.append((initial, current))
+    df = ensure_features(df)
+    movers = df[df['moved']]
+    initial = _as_str(movers['initial_placement']).str.strip()
+    current = _as_str(movers['current_co']).str.strip()
+    keep = (initial != '') & ~current.isin(['nan', '0', '0.0', ''])
+    edges = list(zip(initial[keep], current[keep]))
 
     if not edges:
         print("  - network_graph.png (skipped - no transitions)")
@@ -670,7 +732,8 @@ def chart_network_graph(df: pd.DataFrame) -> None:
 
     # Add nodes with attributes
     company_counts = df['initial_placement'].value_counts()
-    for company in set(list(company_counts.index) + [e[1] for e in edges]):
+    # Sorted so the layout does not depend on set/hash ordering
+    for company in sorted(set(list(company_counts.index) + [e[1] for e in edges])):
         G.add_node(company, size=company_counts.get(company, 1))
 
     # Add weighted edges
@@ -719,16 +782,12 @@ def chart_network_graph(df: pd.DataFrame) -> None:
     print("  - network_graph.png")
 
 
+@chart_inputs(
+    "career_progression.png", ["moved", "initial_placement", "current_co", "graduation_year"],
+)
 def chart_career_progression(df: pd.DataFrame) -> None:
     """Multi-panel career progression analysis."""
-    df_copy = df.copy()
-    df_copy['current_co'] = df_copy['current_company'].fillna(df_copy['initial_placement'])
-    df_copy['moved'] = df_copy.apply(
-        lambda r: str(r['initial_placement']).lower().strip() != str(r['current_co']).lower().strip()
-        if pd.notna(r['current_co']) and str(r['current_co']) not in ['', '0', '0.0', 'nan']
-        else False,
-        axis=1
-    )
+    df_copy = ensure_features(df)
 
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
 
@@ -760,7 +819,7 @@ def chart_career_progression(df: pd.DataFrame) -> None:
     # 3. Popular transitions
     ax3 = axes[1, 0]
     if len(movers) > 0:
-        transitions = movers.apply(lambda r: f"{r['initial_placement']} → {r['current_co']}", axis=1)
+        transitions = _as_str(movers['initial_placement']) + " → " + _as_str(movers['current_co'])
         trans_counts = transitions.value_counts().head(10)
         bars = ax3.barh(trans_counts.index[::-1], trans_counts.values[::-1], color=COLORS['primary'])
         ax3.set_xlabel("Count")
@@ -782,23 +841,16 @@ def chart_career_progression(df: pd.DataFrame) -> None:
     print("  - career_progression.png")
 
 
+@chart_inputs("correlations.png", ["graduation_year", "company_size", "moved"])
 def chart_correlations(df: pd.DataFrame) -> None:
     """Heatmap of correlations between variables (descriptive, no quality scores)."""
-    df_copy = df.copy()
-    df_copy['current_co'] = df_copy['current_company'].fillna(df_copy['initial_placement'])
-    df_copy['moved'] = df_copy.apply(
-        lambda r: 1 if str(r['initial_placement']).lower().strip() != str(r['current_co']).lower().strip()
-        and str(r['current_co']) not in ['', '0', '0.0', 'nan'] else 0,
-        axis=1
-    )
-
-    # Company size (hire count as proxy)
-    company_counts = df_copy['initial_placement'].value_counts().to_dict()
-    df_copy['company_size'] = df_copy['initial_placement'].map(company_counts)
+    import seaborn as sns
+    # Company size = hire count as proxy
+    df = ensure_features(df)
 
     # Build correlation matrix
     corr_vars = ['graduation_year', 'company_size', 'moved']
-    corr_data = df_copy[corr_vars].dropna()
+    corr_data = df[corr_vars].astype({'moved': int}).dropna()
 
     if len(corr_data) < 10:
         print("  - correlations.png (skipped - insufficient data)")
@@ -822,6 +874,9 @@ def chart_correlations(df: pd.DataFrame) -> None:
     print("  - correlations.png")
 
 
+@chart_inputs(
+    "left_tech.png", ["name", "school", "initial_placement", "initial_role", "current_company", "current_role"], categories=NON_TECH_CATEGORIES,
+)
 def chart_left_tech(df: pd.DataFrame) -> None:
     """Chart showing candidates who left tech for non-tech sectors."""
     # Define tech companies
@@ -938,12 +993,11 @@ def chart_left_tech(df: pd.DataFrame) -> None:
     print(f"  - left_tech.png ({len(left_df)}/{started_in_tech} = {pct_left:.1f}% left tech)")
 
 
+@chart_inputs("career_growth.png", ["seniority"])
 def chart_career_growth(df: pd.DataFrame) -> None:
     """Chart showing seniority level distribution with percentages."""
-    # Use module-level get_seniority function for consistency
-    df_copy = df.copy()
-    df_copy['seniority'] = df_copy.apply(
-        lambda r: get_seniority(r['current_role'], r.get('name'), include_entry=True), axis=1)
+    # Seniority comes from the shared features frame (see features._seniority)
+    df_copy = ensure_features(df).copy()
     # Map to broader categories for this chart
     seniority_mapping = {
         'Head': 'Head/VP/Chief', 'VP': 'Head/VP/Chief', 'Chief': 'Head/VP/Chief', 'Founder': 'Head/VP/Chief',
@@ -978,51 +1032,11 @@ def chart_career_growth(df: pd.DataFrame) -> None:
     print(f"  - career_growth.png ({total} candidates)")
 
 
-# Seniority levels for career progression (shared with analyze.py)
-# Note: Director must come before Chief to avoid 'cto' matching 'Director'
-SENIORITY_LEVELS = {
-    'Director': ['director'],
-    'Founder': ['founder', 'co-founder'],
-    'Chief': ['chief', 'ceo', ' cto', 'coo'],
-    'VP': ['vp ', 'vice president'],
-    'Head': ['head of', 'head '],
-    'Manager': ['manager'],
-    'Principal': ['principal'],
-    'Staff': ['staff'],
-    'Lead': ['lead'],
-    'Senior': ['senior', 'sr.', 'sr '],
-}
-
-# Manual overrides for specific people whose titles don't reflect true seniority
-SENIORITY_OVERRIDES = {
-    'Korkut': 'Entry/IC',           # "Principal Consultant" is consulting title
-    'David Mao': 'Entry/IC',        # LinkedIn shows "Applied Scientist", not Senior
-    'Meghanath M Y': 'Senior',      # "Head of AI" at tiny startup != Head at big tech
-    'Shreya Bhattacharya': 'Senior',  # "Research Director (Asst Prof)" is academic, not tech
-}
-
-
-def get_seniority(role: str, name: str = None, include_entry: bool = True) -> str:
-    """Extract seniority level from a role title."""
-    # Check manual overrides first
-    if name and name in SENIORITY_OVERRIDES:
-        return SENIORITY_OVERRIDES[name]
-
-    if pd.isna(role) or str(role) in ['', '0', 'nan']:
-        return None
-    role_lower = str(role).lower()
-    for level, keywords in SENIORITY_LEVELS.items():
-        if any(kw in role_lower for kw in keywords):
-            return level
-    return 'Entry/IC' if include_entry else None
-
-
+@chart_inputs("seniority_pyramid.png", ["seniority"])
 def chart_seniority_pyramid(df: pd.DataFrame) -> None:
     """Horizontal bar chart showing distribution of economists at each seniority level."""
-    df_copy = df.copy()
-    df_copy['seniority'] = df_copy.apply(
-        lambda r: get_seniority(r['current_role'], r.get('name'), include_entry=True), axis=1)
-    df_with_role = df_copy[df_copy['seniority'].notna()]
+    df = ensure_features(df)
+    df_with_role = df[df['seniority'].notna()]
 
     if len(df_with_role) == 0:
         print("  - seniority_pyramid.png (skipped - no data)")
@@ -1061,13 +1075,11 @@ def chart_seniority_pyramid(df: pd.DataFrame) -> None:
     print(f"  - seniority_pyramid.png ({len(df_with_role)} candidates with roles)")
 
 
+@chart_inputs("time_to_promotion.png", ["seniority", "years_since_phd"])
 def chart_time_to_promotion(df: pd.DataFrame) -> None:
     """Bar chart showing average years to reach each seniority level."""
-    df_copy = df.copy()
-    df_copy['seniority'] = df_copy.apply(
-        lambda r: get_seniority(r['current_role'], r.get('name'), include_entry=True), axis=1)
-    df_copy = df_copy[df_copy['seniority'].notna()]
-    df_copy['years_since_phd'] = datetime.now().year - df_copy['graduation_year']
+    df_copy = ensure_features(df)
+    df_copy = df_copy[df_copy['seniority'].notna()].copy()
 
     if len(df_copy) == 0:
         print("  - time_to_promotion.png (skipped - no data)")
@@ -1124,15 +1136,14 @@ def chart_time_to_promotion(df: pd.DataFrame) -> None:
     print(f"  - time_to_promotion.png ({len(df_copy)} senior+ candidates)")
 
 
+@chart_inputs("high_achiever_origins.png", ["seniority", "initial_placement"])
 def chart_high_achiever_origins(df: pd.DataFrame) -> None:
     """Bar chart showing which firms Director+ people started at."""
-    df_copy = df.copy()
-    df_copy['seniority'] = df_copy.apply(
-        lambda r: get_seniority(r['current_role'], r.get('name'), include_entry=False), axis=1)
+    df = ensure_features(df)
 
     # Filter to Director and above
     high_levels = {'Director', 'Head', 'VP', 'Chief', 'Founder'}
-    achievers = df_copy[df_copy['seniority'].isin(high_levels)]
+    achievers = df[df['seniority'].isin(high_levels)]
 
     if len(achievers) == 0:
         print("  - high_achiever_origins.png (skipped - no Director+ data)")
@@ -1160,15 +1171,14 @@ def chart_high_achiever_origins(df: pd.DataFrame) -> None:
     print(f"  - high_achiever_origins.png ({len(achievers)} Director+ candidates)")
 
 
+@chart_inputs("high_achiever_schools.png", ["seniority", "school"])
 def chart_high_achiever_schools(df: pd.DataFrame) -> None:
     """Bar chart showing which schools Director+ people came from."""
-    df_copy = df.copy()
-    df_copy['seniority'] = df_copy.apply(
-        lambda r: get_seniority(r['current_role'], r.get('name'), include_entry=False), axis=1)
+    df = ensure_features(df)
 
     # Filter to Director and above
     high_levels = {'Director', 'Head', 'VP', 'Chief', 'Founder'}
-    achievers = df_copy[df_copy['seniority'].isin(high_levels)]
+    achievers = df[df['seniority'].isin(high_levels)]
 
     if len(achievers) == 0:
         print("  - high_achiever_schools.png (skipped - no Director+ data)")
@@ -1196,6 +1206,7 @@ def chart_high_achiever_schools(df: pd.DataFrame) -> None:
     print(f"  - high_achiever_schools.png ({len(achievers)} Director+ candidates)")
 
 
+@chart_inputs("data_coverage.png", ["school", "graduation_year"])
 def chart_data_coverage(df: pd.DataFrame) -> None:
     """Heatmap showing data coverage by school and year."""
     # Create pivot table
@@ -1244,6 +1255,9 @@ def chart_data_coverage(df: pd.DataFrame) -> None:
     print(f"  - data_coverage.png ({len(coverage.index)} schools, {len(coverage.columns)} years)")
 
 
+@chart_inputs(
+    "hiring_timeseries.png", ["initial_placement", "graduation_year"], year=datetime.now().year,
+)
 def chart_hiring_timeseries(df: pd.DataFrame) -> None:
     """Time series of hiring patterns by top firms."""
     # Get top firms
@@ -1271,11 +1285,11 @@ def chart_hiring_timeseries(df: pd.DataFrame) -> None:
     print(f"  - hiring_timeseries.png ({len(top_firms)} firms)")
 
 
+@chart_inputs("work_wordcloud.png", ["seniority", "work_focus"])
 def chart_work_wordcloud(df: pd.DataFrame) -> None:
     """Wordclouds showing how economists describe their work, by seniority level."""
-    df_copy = df.copy()
-    df_copy['seniority'] = df_copy.apply(
-        lambda r: get_seniority(r['current_role'], r.get('name'), include_entry=True), axis=1)
+    from wordcloud import WordCloud
+    df_copy = ensure_features(df).copy()
 
     # Merge categories
     df_copy['seniority'] = df_copy['seniority'].replace({
@@ -1311,6 +1325,7 @@ def chart_work_wordcloud(df: pd.DataFrame) -> None:
             colormap='viridis',
             max_words=30,
             collocations=True,
+            random_state=42,
         ).generate(text)
 
         axes[i].imshow(np.array(wc.to_image()), interpolation='bilinear')
@@ -1330,8 +1345,145 @@ def chart_work_wordcloud(df: pd.DataFrame) -> None:
     print(f"  - work_wordcloud.png ({count} descriptions across {len(levels)} levels)")
 
 
+# Render order, grouped by section heading
+CHART_SECTIONS = [
+    ("Generating basic charts:", [
+        chart_placements_by_school,
+        chart_top_companies,
+        chart_heatmap,
+        chart_timeline,
+        chart_roles,
+    ]),
+    ("Generating enriched data charts:", [
+        chart_research_to_company,
+        chart_field_to_firm,
+        chart_teams,
+        chart_work_domains,
+        chart_work_methods,
+        chart_work_ngrams,
+        chart_company_roles,
+        chart_movers,
+        chart_school_to_role,
+        chart_selectivity,
+    ]),
+    ("Generating new analytics charts:", [
+        chart_network_graph,
+        chart_career_progression,
+        chart_correlations,
+    ]),
+    ("Generating career trajectory charts:", [
+        chart_left_tech,
+        chart_career_growth,
+        chart_time_to_promotion,
+        chart_seniority_pyramid,
+        chart_high_achiever_origins,
+        chart_high_achiever_schools,
+        chart_data_coverage,
+        chart_hiring_timeseries,
+        chart_work_wordcloud,
+    ]),
+]
+
+# Prepared frame, set once per worker process by _init_worker
+_worker_df = None
+
+
+def _init_worker(df: pd.DataFrame) -> None:
+    """Pool initializer: Agg backend, theme and shared frame, once per worker."""
+    global _worker_df
+    matplotlib.use("Agg")
+    setup_dark_theme()
+    _worker_df = df
+
+
+def _render_in_worker(chart_name: str) -> tuple:
+    """Render one chart in a worker; return its captured output and elapsed seconds."""
+    buf = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(buf):
+        globals()[chart_name](_worker_df)
+    return buf.getvalue(), time.perf_counter() - start
+
+
+def _render_serial(funcs: list, df: pd.DataFrame):
+    """Render charts in-process, yielding (output, elapsed) per chart as it finishes."""
+    for func in funcs:
+        buf = io.StringIO()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(buf):
+            func(df)
+        yield buf.getvalue(), time.perf_counter() - start
+
+
+def render_charts(df: pd.DataFrame, jobs: int = 1, force: bool = False) -> list:
+    """Render stale charts, serially or across a process pool.
+
+    Args:
+        df: Prepared candidates frame (see load_data)
+        jobs: Worker processes; 1 renders in-process, 0 uses all cores
+        force: Redraw every chart, ignoring fingerprints
+
+    A chart is skipped when its PNG exists and was rendered from the same
+    fingerprint (declared input columns, parameters and chart code).
+    In parallel mode each chart is a separate task; workers receive the
+    frame once (inherited via fork where available) and output is printed
+    in the same order as a serial run.
+
+    Returns:
+        List of (chart file, seconds) for the charts that were rebuilt
+    """
+    jobs = jobs or os.cpu_count() or 1
+    manifest = {} if force else _load_fingerprints()
+
+    all_funcs = [func for _, funcs in CHART_SECTIONS for func in funcs]
+    fingerprints = {func.__name__: chart_fingerprint(func, df) for func in all_funcs}
+    stale = [func for func in all_funcs if not _is_current(func, fingerprints[func.__name__], manifest)]
+
+    if len(stale) > 1 and jobs > 1:
+        start_method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+        ctx = multiprocessing.get_context(start_method)
+        pool = ctx.Pool(processes=min(jobs, len(stale)), initializer=_init_worker, initargs=(df,))
+        results = pool.imap(_render_in_worker, [func.__name__ for func in stale], chunksize=1)
+    else:
+        pool = None
+        results = _render_serial(stale, df)
+
+    rebuilt = []
+    try:
+        stale_names = {func.__name__ for func in stale}
+        for i, (heading, funcs) in enumerate(CHART_SECTIONS):
+            print(f"{'' if i == 0 else chr(10)}{heading}")
+            for func in funcs:
+                if func.__name__ not in stale_names:
+                    print(f"  - {func.output} (unchanged)")
+                    continue
+                output, elapsed = next(results)
+                print(output, end="")
+                rebuilt.append((func.output, elapsed))
+
+                entry = {'fingerprint': fingerprints[func.__name__]}
+                if (CHARTS_DIR / func.output).exists():
+                    entry['sha256'] = _file_sha(CHARTS_DIR / func.output)
+                manifest[func.__name__] = entry
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        _save_fingerprints(manifest)
+
+    return rebuilt
+
+
 def main():
     """Generate all charts."""
+    import argparse
+    parser = argparse.ArgumentParser(description='Generate placement charts')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Worker processes for rendering (0 = all cores, default: 1)')
+    parser.add_argument('--force', '-f', action='store_true',
+                        help='Redraw all charts, ignoring cached fingerprints')
+    args = parser.parse_args()
+
     CHARTS_DIR.mkdir(exist_ok=True)
     setup_dark_theme()
 
@@ -1339,41 +1491,12 @@ def main():
     df = load_data()
     print(f"  {len(df)} candidates loaded\n")
 
-    print("Generating basic charts:")
-    chart_placements_by_school(df)
-    chart_top_companies(df)
-    chart_heatmap(df)
-    chart_timeline(df)
-    chart_roles(df)
-
-    print("\nGenerating enriched data charts:")
-    chart_research_to_company(df)
-    chart_field_to_firm(df)
-    chart_teams(df)
-    chart_work_domains(df)
-    chart_work_methods(df)
-    chart_work_ngrams(df)
-    chart_company_roles(df)
-    chart_movers(df)
-    chart_school_to_role(df)
-    chart_selectivity(df)
-
-    print("\nGenerating new analytics charts:")
-    chart_network_graph(df)
-    chart_career_progression(df)
-    chart_correlations(df)
-
-    print("\nGenerating career trajectory charts:")
-    chart_left_tech(df)
-    chart_career_growth(df)
-    chart_time_to_promotion(df)
-    chart_seniority_pyramid(df)
-    chart_high_achiever_origins(df)
-    chart_high_achiever_schools(df)
-    chart_data_coverage(df)
-    chart_hiring_timeseries(df)
-    chart_work_wordcloud(df)
+    rebuilt = render_charts(df, jobs=args.jobs, force=args.force)
 
+    total = sum(len(funcs) for _, funcs in CHART_SECTIONS)
+    print(f"\nRebuilt {len(rebuilt)} of {total} charts:")
+    for output, elapsed in sorted(rebuilt, key=lambda r: -r[1]):
+        print(f"  {output:<28} {elapsed:6.2f}s")
     print(f"\nDone! Charts saved to {CHARTS_DIR}/")
 
 
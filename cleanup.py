@@ -85,6 +85,20 @@ def cleanup_candidates(input_path: str, output_path: str) -> pd.DataFrame:
     print(f"Loading {input_path}...")
     df = pd.read_csv(input_path)
     original_count = len(df)
+
+    df = cleanup_frame(df)
+
+    # Save
+    df.to_csv(output_path, index=False)
+    print(f"\nSaved cleaned data to {output_path}")
+    print(f"Final rows: {len(df)} (removed {original_count - len(df)})")
+
+    return df
+
+
+def cleanup_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Apply all cleanup steps to a candidates frame (returns a new frame)."""
+    original_count = len(df)
     print(f"Original rows: {original_count}")
 
     # Track changes
@@ -128,11 +142,6 @@ def cleanup_candidates(input_path: str, output_path: str) -> pd.DataFrame:
     if 'current_placement' in df.columns:
         df['current_placement'] = df['current_placement'].apply(standardize_current_placement)
 
-    # Save
-    df.to_csv(output_path, index=False)
-    print(f"\nSaved cleaned data to {output_path}")
-    print(f"Final rows: {len(df)} (removed {original_count - len(df)})")
-
     return df
 
 
@@ -5,12 +5,13 @@ Uses H1B LCA data from DOL and Levels.fyi structured data.
 """
 import os
 import re
-import requests
 import pandas as pd
 from pathlib import Path
 from functools import lru_cache
 from typing import Optional, Dict
 
+from http_client import get_client
+
 # Map common company names to H1B employer names
 COMPANY_H1B_MAPPING = {
     'google': ['GOOGLE LLC', 'GOOGLE INC'],
@@ -59,7 +60,7 @@ def _fetch_levels_fyi(company: str) -> dict:
     url = f"https://www.levels.fyi/companies/{company_slug}/salaries.md"
 
     try:
-        resp = requests.get(url, timeout=10, headers={
+        resp = get_client().get(url, timeout=10, headers={
             'User-Agent': 'Mozilla/5.0 (compatible; EconGradsScraper/1.0)'
         })
         if resp.status_code == 200:
@@ -230,7 +231,18 @@ def main():
 
     # Initialize enricher
     enricher = CompensationEnricher(h1b_file=args.h1b_file)
+    df = add_compensation(df, enricher)
+
+    # Save
+    df.to_csv(output_path, index=False)
+    print(f"\n{'='*50}")
+    print(f"Done! Saved to {output_path}")
+
+    print_salary_summary(df)
 
+
+def add_compensation(df: pd.DataFrame, enricher: CompensationEnricher) -> pd.DataFrame:
+    """Fill compensation columns for every candidate (modifies df in place)."""
     # Add compensation columns
     comp_cols = ['salary_min', 'salary_max', 'salary_median', 'salary_source', 'levels_fyi_url']
     for col in comp_cols:
@@ -248,12 +260,11 @@ def main():
         df.at[idx, 'salary_source'] = comp.get('salary_source', '')
         df.at[idx, 'levels_fyi_url'] = comp.get('levels_fyi_url', '')
 
-    # Save
-    df.to_csv(output_path, index=False)
-    print(f"\n{'='*50}")
-    print(f"Done! Saved to {output_path}")
+    return df
+
 
-    # Summary
+def print_salary_summary(df: pd.DataFrame):
+    """Print salary coverage and ranges by company."""
     has_salary = df['salary_median'].notna().sum()
     print(f"\nCandidates with salary data: {has_salary}/{len(df)}")
 
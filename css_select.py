@@ -0,0 +1,108 @@
+"""
+Fast CSS selector matching for BeautifulSoup trees.
+
+soupsieve implements all of CSS but costs several microseconds per tag
+and selector; the scraper's card/name/placement selectors only use a small
+subset, so testing every tag of a large page against them is much cheaper
+as compiled Python predicates.
+
+Handles selector lists of compound selectors (tag, .class, [attr],
+[attr="v"], [attr*="v"]) joined by descendant (space) and child (>) combinators.
+Anything else is matched by soupsieve, so results are always the same.
+"""
+import re
+from typing import Callable, List, Optional
+
+from bs4 import Tag
+
+# 'div.a.b[attr*="v"]' (or [attr], [attr="v"])
+COMPOUND_SELECTOR = re.compile(
+    r'(?P<tag>[a-z][a-z0-9]*)?(?P<classes>(?:\.[\w-]+)*)'
+    r'(?:\[(?P<attr>[\w-]+)(?:(?P<op>\*?=)"(?P<value>[^"]+)")?\])?'
+)
+
+
+def _compile_compound(selector: str) -> Optional[Callable]:
+    """Predicate for a compound selector, or None if it is not a supported one."""
+    match = COMPOUND_SELECTOR.fullmatch(selector)
+    if not selector or not match:
+        return None
+    tag, attr, op, value = match.group('tag', 'attr', 'op', 'value')
+    classes = set(match.group('classes').split('.')[1:])
+
+    def matches(el) -> bool:
+        if tag and el.name != tag:
+            return False
+        if classes and not classes.issubset(el.get('class') or ()):
+            return False
+        if attr:
+            actual = el.get(attr)
+            if actual is None:
+                return False
+            if op is None:
+                return True
+            if isinstance(actual, list):  # multi-valued, e.g. class
+                actual = ' '.join(actual)
+            return actual == value if op == '=' else value in actual
+        return True
+    return matches
+
+
+def _compile_complex(selector: str) -> Optional[Callable]:
+    """Predicate for compounds joined by ' ' and '>' combinators, matched right to left."""
+    tokens = re.findall(r'>|[^\s>]+', selector)
+    steps = []  # (compound predicate, combinator to the step on its left)
+    combinator = None
+    for token in tokens:
+        if token == '>':
+            if combinator is not None or not steps:
+                return None
+            combinator = '>'
+            continue
+        compound = _compile_compound(token)
+        if compound is None:
+            return None
+        steps.append((compound, combinator or ' '))
+        combinator = None
+    if not steps or combinator is not None:
+        return None
+
+    def match_from(el, i: int) -> bool:
+        compound, left = steps[i]
+        if not compound(el):
+            return False
+        if i == 0:
+            return True
+        if left == '>':
+            return el.parent is not None and match_from(el.parent, i - 1)
+        return any(match_from(ancestor, i - 1) for ancestor in el.parents)
+
+    last = len(steps) - 1
+    if last == 0:
+        return steps[0][0]
+    return lambda el: match_from(el, last)
+
+
+def compile_selector(selector: str) -> Callable:
+    """Compile a CSS selector (list) into a predicate on bs4 tags."""
+    # Splitting inside a quoted value leaves unbalanced parts, which don't compile
+    alternatives = [_compile_complex(part.strip()) for part in selector.split(',')]
+    if None in alternatives:
+        import soupsieve
+        return soupsieve.compile(selector).match
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return lambda el: any(matches(el) for matches in alternatives)
+
+
+def select(root, matches: Callable) -> List[Tag]:
+    """Descendant tags of root matching a compiled selector, in document order."""
+    return [el for el in root.descendants if isinstance(el, Tag) and matches(el)]
+
+
+def select_one(root, matches: Callable) -> Optional[Tag]:
+    """First descendant tag of root matching a compiled selector, or None."""
+    for el in root.descendants:
+        if isinstance(el, Tag) and matches(el):
+            return el
+    return None
@@ -9,18 +9,8 @@ import json
 import time
 import requests
 import pandas as pd
-from openai import OpenAI
 from dotenv import load_dotenv
 
-# Try to import scholarly for Google Scholar data
-try:
-    from scholarly import scholarly, ProxyGenerator
-    SCHOLARLY_AVAILABLE = True
-except ImportError:
-    SCHOLARLY_AVAILABLE = False
-    print("Note: scholarly not installed. Scholar enrichment disabled.")
-    print("Install with: pip install scholarly")
-
 load_dotenv()
 
 # Import normalization
@@ -37,6 +27,7 @@ def get_perplexity_client():
     if _perplexity_client is None:
         if not PERPLEXITY_API_KEY:
             raise ValueError("PERPLEXITY_API_KEY not set")
+        from openai import OpenAI
         _perplexity_client = OpenAI(
             api_key=PERPLEXITY_API_KEY,
             base_url="https://api.perplexity.ai"
@@ -44,6 +35,24 @@ def get_perplexity_client():
     return _perplexity_client
 
 
+# Lazy-import scholarly (slow to import) only when Scholar enrichment runs
+_scholarly = None
+_scholarly_checked = False
+
+def get_scholarly():
+    """Import scholarly on first use; return None if it is not installed."""
+    global _scholarly, _scholarly_checked
+    if not _scholarly_checked:
+        _scholarly_checked = True
+        try:
+            from scholarly import scholarly
+            _scholarly = scholarly
+        except ImportError:
+            print("Note: scholarly not installed. Scholar enrichment disabled.")
+            print("Install with: pip install scholarly")
+    return _scholarly
+
+
 def enrich_with_sonar(name: str, company: str, school: str, research_fields: str) -> dict:
     """Use Perplexity Sonar (cheapest model with built-in search) to get candidate info."""
     prompt = f"""Find information about this economics PhD graduate who now works in tech:
@@ -111,7 +120,8 @@ Return ONLY valid JSON, no other text."""
 
 def get_scholar_data(name: str, school: str) -> dict:
     """Fetch Google Scholar data for a candidate."""
-    if not SCHOLARLY_AVAILABLE:
+    scholarly = get_scholarly()
+    if scholarly is None:
         return {'citations': 0, 'h_index': 0, 'publications': [], 'interests': []}
 
     try:
@@ -195,7 +205,7 @@ def enrich_candidate(row: pd.Series, include_scholar: bool = True) -> dict:
     info = enrich_with_sonar(name, company, school, research_fields)
 
     # Get Google Scholar data if available
-    if include_scholar and SCHOLARLY_AVAILABLE:
+    if include_scholar and get_scholarly() is not None:
         scholar_data = get_scholar_data(name, school)
         info['citations'] = scholar_data.get('citations', 0)
         info['h_index'] = scholar_data.get('h_index', 0)
@@ -220,7 +230,7 @@ def main():
         print("ERROR: PERPLEXITY_API_KEY not set!")
         return
 
-    include_scholar = not args.no_scholar and SCHOLARLY_AVAILABLE
+    include_scholar = not args.no_scholar and get_scholarly() is not None
     print(f"Scholar enrichment: {'enabled' if include_scholar else 'disabled'}")
 
     input_path = "data/candidates.csv"
@@ -235,62 +245,81 @@ def main():
         df = pd.read_csv(input_path)
     print(f"Found {len(df)} candidates")
 
+    df = enrich_frame(df, output_path, include_scholar=include_scholar,
+                      force=args.force, check_work_focus=args.enrich_work_focus)
+
+    print(f"Saved to {output_path}")
+    print(df[['name', 'initial_placement', 'current_role', 'citations', 'h_index']].head(10))
+
+
+def enrich_frame(df: pd.DataFrame, output_path: str, include_scholar: bool = True,
+                 force: bool = False, check_work_focus: bool = False) -> pd.DataFrame:
+    """Enrich a candidates frame in place, saving progress to output_path after each row."""
     # Normalize initial_placement company names (Facebook→Meta, etc.)
     if 'initial_placement' in df.columns:
         df['initial_placement'] = df['initial_placement'].apply(normalize_company)
 
-    # Add new columns (including scholar fields)
-    new_cols = [
-        'current_role', 'current_company', 'team', 'work_focus', 'notes', 'linkedin_url',
-        'citations', 'h_index', 'research_interests', 'top_publications'
-    ]
-    for col in new_cols:
-        if col not in df.columns:
-            df[col] = "" if col in ['research_interests', 'top_publications', 'notes', 'linkedin_url'] else 0
+    add_enrichment_columns(df)
 
     # Enrich each candidate
     skipped = 0
     enriched = 0
-    check_work_focus = args.enrich_work_focus
     for idx, row in df.iterrows():
-        if not args.force and is_already_enriched(row, check_work_focus=check_work_focus):
+        if not force and is_already_enriched(row, check_work_focus=check_work_focus):
             print(f"Skipping already enriched: {row['name']}")
             skipped += 1
             continue
 
         info = enrich_candidate(row, include_scholar=include_scholar)
         enriched += 1
-
-        # Helper to convert lists/None to strings
-        def to_str(val):
-            if val is None:
-                return ''
-            if isinstance(val, list):
-                return ', '.join(str(v) for v in val) if val else ''
-            return str(val)
-
-        df.at[idx, 'current_role'] = to_str(info.get('current_role', ''))
-        # Standardize current_company: academia → "Academia", rebrandings normalized
-        raw_company = info.get('current_company', row['initial_placement'])
-        df.at[idx, 'current_company'] = standardize_current_placement(raw_company) if raw_company else ''
-        df.at[idx, 'team'] = to_str(info.get('team', ''))
-        df.at[idx, 'work_focus'] = to_str(info.get('work_focus', ''))
-        df.at[idx, 'notes'] = to_str(info.get('notes', ''))
-        df.at[idx, 'linkedin_url'] = info.get('linkedin_url', '')
-
-        # Scholar fields
-        df.at[idx, 'citations'] = info.get('citations', 0)
-        df.at[idx, 'h_index'] = info.get('h_index', 0)
-        df.at[idx, 'research_interests'] = info.get('research_interests', '')
-        df.at[idx, 'top_publications'] = info.get('top_publications', '[]')
+        apply_enrichment(df, idx, info)
 
         # Save progress
         df.to_csv(output_path, index=False)
 
     print(f"\n{'='*50}")
     print(f"Done! Enriched {enriched}, skipped {skipped} already-enriched candidates")
-    print(f"Saved to {output_path}")
-    print(df[['name', 'initial_placement', 'current_role', 'citations', 'h_index']].head(10))
+    return df
+
+
+def add_enrichment_columns(df: pd.DataFrame):
+    """Add the enrichment columns (including scholar fields) missing from df."""
+    new_cols = [
+        'current_role', 'current_company', 'team', 'work_focus', 'notes', 'linkedin_url',
+        'citations', 'h_index', 'research_interests', 'top_publications'
+    ]
+    for col in new_cols:
+        if col not in df.columns:
+            df[col] = "" if col in ['research_interests', 'top_publications', 'notes', 'linkedin_url'] else 0
+        elif col not in ['citations', 'h_index']:
+            # Text columns read back from CSV are float when all empty
+            df[col] = df[col].astype(object)
+
+
+def apply_enrichment(df: pd.DataFrame, idx, info: dict):
+    """Write enrich_candidate's info for row idx into the frame's columns."""
+    # Helper to convert lists/None to strings
+    def to_str(val):
+        if val is None:
+            return ''
+        if isinstance(val, list):
+            return ', '.join(str(v) for v in val) if val else ''
+        return str(val)
+
+    df.at[idx, 'current_role'] = to_str(info.get('current_role', ''))
+    # Standardize current_company: academia → "Academia", rebrandings normalized
+    raw_company = info.get('current_company', df.at[idx, 'initial_placement'])
+    df.at[idx, 'current_company'] = standardize_current_placement(raw_company) if raw_company else ''
+    df.at[idx, 'team'] = to_str(info.get('team', ''))
+    df.at[idx, 'work_focus'] = to_str(info.get('work_focus', ''))
+    df.at[idx, 'notes'] = to_str(info.get('notes', ''))
+    df.at[idx, 'linkedin_url'] = info.get('linkedin_url', '')
+
+    # Scholar fields
+    df.at[idx, 'citations'] = info.get('citations', 0)
+    df.at[idx, 'h_index'] = info.get('h_index', 0)
+    df.at[idx, 'research_interests'] = info.get('research_interests', '')
+    df.at[idx, 'top_publications'] = info.get('top_publications', '[]')
 
 
 if __name__ == "__main__":
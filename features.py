@@ -0,0 +1,212 @@
+"""
+Derived-feature materialization for econ-grads analyses.
+
+charts.py and analyze.py both need the same derived columns (job changes,
+seniority, work text, research field lists). They are computed here once,
+vectorized, and cached in memory and optionally on disk, keyed by a hash
+of the input CSV.
+
+Derived columns:
+- current_co: current_company, falling back to initial_placement
+- moved: True if the candidate changed companies
+- seniority: Seniority level of current_role (None if no role data)
+- years_since_phd: Current year minus graduation year
+- company_size: Hire count of the initial placement (within the frame)
+- work_text: Combined "work_focus team" text (None if empty)
+- work_phrase_text: work_focus, or team when work_focus is empty (None if both empty)
+- field_list: Non-generic research fields, truncated to 30 chars
+"""
+
+import hashlib
+import pickle
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = Path(__file__).parent / "data" / "cache"
+
+# Bump when derived columns change so stale disk caches are ignored
+FEATURES_VERSION = 1
+
+# Seniority levels for career progression (ordered by match priority)
+# Note: Director must come before Chief to avoid 'cto' matching 'Director'
+SENIORITY_LEVELS = {
+    'Director': ['director'],
+    'Founder': ['founder', 'co-founder'],
+    'Chief': ['chief', 'ceo', ' cto', 'coo'],
+    'VP': ['vp ', 'vice president'],
+    'Head': ['head of', 'head '],
+    'Manager': ['manager'],
+    'Principal': ['principal'],
+    'Staff': ['staff'],
+    'Lead': ['lead'],
+    'Senior': ['senior', 'sr.', 'sr '],
+}
+
+# Manual overrides for specific people whose titles don't reflect true seniority
+SENIORITY_OVERRIDES = {
+    'Korkut': 'Entry/IC',           # "Principal Consultant" is consulting title
+    'David Mao': 'Entry/IC',        # LinkedIn shows "Applied Scientist", not Senior
+    'Meghanath M Y': 'Senior',      # "Head of AI" at tiny startup != Head at big tech
+    'Shreya Bhattacharya': 'Senior',  # "Research Director (Asst Prof)" is academic, not tech
+}
+
+# Generic terms that are not real research specializations
+GENERIC_FIELDS = {
+    'economics', 'economist', 'economic', 'phd', 'ph.d', 'applied',
+    'theory', 'microeconomics', 'microeconomic'
+}
+
+FEATURE_COLUMNS = [
+    'current_co', 'moved', 'seniority', 'years_since_phd', 'company_size',
+    'work_text', 'work_phrase_text', 'field_list',
+]
+
+# (path, file hash, prepare step) -> materialized frame
+_memory_cache = {}
+
+
+def _as_str(series: pd.Series) -> pd.Series:
+    """Element-wise str(), so missing values become 'nan' like str(row[col])."""
+    return series.map(str).astype(object)
+
+
+def _column(df: pd.DataFrame, name: str) -> pd.Series:
+    """Return a column as strings, or empty strings if it is missing."""
+    if name in df.columns:
+        return _as_str(df[name])
+    return pd.Series('', index=df.index, dtype=object)
+
+
+def _seniority(df: pd.DataFrame) -> pd.Series:
+    """Vectorized seniority level of current_role, with name overrides."""
+    if 'current_role' in df.columns:
+        role = df['current_role']
+        has_role = role.notna() & ~_as_str(role).isin(['', '0', 'nan'])
+        role_lower = _as_str(role).str.lower()
+        conditions = [
+            role_lower.str.contains('|'.join(re.escape(kw) for kw in keywords), regex=True).to_numpy(dtype=bool)
+            for keywords in SENIORITY_LEVELS.values()
+        ]
+        levels = np.select(conditions, list(SENIORITY_LEVELS), default='Entry/IC')
+        seniority = pd.Series(levels, index=df.index, dtype=object).where(has_role, None)
+    else:
+        seniority = pd.Series(None, index=df.index, dtype=object)
+
+    if 'name' in df.columns:
+        overrides = df['name'].map(SENIORITY_OVERRIDES).astype(object)
+        seniority = overrides.where(overrides.notna(), seniority)
+    return seniority
+
+
+def _field_lists(df: pd.DataFrame) -> pd.Series:
+    """Split research_fields into cleaned, non-generic field lists."""
+    if 'research_fields' not in df.columns:
+        return pd.Series([[] for _ in range(len(df))], index=df.index, dtype=object)
+
+    fields = _as_str(df['research_fields']).str.split(',').explode().str.strip()
+    keep = (fields != '') & (fields != 'nan') & ~fields.str.lower().isin(GENERIC_FIELDS)
+    grouped = fields[keep].str[:30].groupby(level=0).agg(list)
+    return pd.Series(
+        [grouped.get(idx, []) for idx in df.index], index=df.index, dtype=object
+    )
+
+
+def build_features(df: pd.DataFrame) -> pd.DataFrame:
+    """Add all derived columns to a copy of the candidates frame."""
+    df = df.copy()
+
+    # Job changes: compare initial vs current company (case/whitespace-insensitive)
+    if 'current_company' in df.columns:
+        current_co = df['current_company'].fillna(df['initial_placement'])
+    else:
+        current_co = df['initial_placement']
+    current_str = _as_str(current_co)
+    has_current = current_co.notna() & ~current_str.isin(['', '0', '0.0', 'nan'])
+    initial_norm = _as_str(df['initial_placement']).str.lower().str.strip()
+    df['current_co'] = current_co
+    df['moved'] = (has_current & (initial_norm != current_str.str.lower().str.strip())).astype(bool)
+
+    df['seniority'] = _seniority(df)
+    df['years_since_phd'] = datetime.now().year - df['graduation_year']
+
+    company_counts = df['initial_placement'].value_counts()
+    df['company_size'] = df['initial_placement'].map(company_counts)
+
+    # Work descriptions from enrichment
+    work_focus = _column(df, 'work_focus').str.strip()
+    team = _column(df, 'team').str.strip()
+    combined = (work_focus + ' ' + team).str.strip()
+    df['work_text'] = combined.where(
+        (combined != '') & ~combined.isin(['nan', '0', '0.0', 'nan nan']), None
+    )
+    placeholders = ['', 'nan', '0', '0.0', 'Unknown']
+    phrase_text = work_focus.where(~work_focus.isin(placeholders), team)
+    df['work_phrase_text'] = phrase_text.where(~phrase_text.isin(placeholders), None)
+
+    df['field_list'] = _field_lists(df)
+    return df
+
+
+def ensure_features(df: pd.DataFrame) -> pd.DataFrame:
+    """Return df if it already carries the derived columns, else materialize them."""
+    if all(col in df.columns for col in FEATURE_COLUMNS):
+        return df
+    return build_features(df)
+
+
+def file_hash(path) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_features(path, prepare: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+                  persist: bool = False) -> pd.DataFrame:
+    """Load a candidates CSV and materialize derived features, with caching.
+
+    Args:
+        path: Input CSV
+        prepare: Optional filtering/normalization applied before materializing
+        persist: Also cache the frame on disk under CACHE_DIR
+
+    The returned frame is shared between callers and should be treated as read-only.
+    """
+    path = Path(path)
+    prepare_name = f"{prepare.__module__}.{prepare.__qualname__}" if prepare else 'none'
+    key = (str(path.resolve()), file_hash(path), prepare_name)
+
+    if key in _memory_cache:
+        return _memory_cache[key]
+
+    # Year is part of the key because years_since_phd depends on it
+    cache_id = hashlib.sha256(
+        f"{FEATURES_VERSION}|{datetime.now().year}|{'|'.join(key[1:])}".encode()
+    ).hexdigest()[:16]
+    cache_file = CACHE_DIR / f"features_{path.stem}_{cache_id}.pkl"
+
+    df = None
+    if persist and cache_file.exists():
+        try:
+            df = pd.read_pickle(cache_file)
+        except (pickle.UnpicklingError, EOFError, ValueError):
+            df = None
+
+    if df is None:
+        df = pd.read_csv(path)
+        if prepare:
+            df = prepare(df)
+        df = build_features(df)
+        if persist:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            df.to_pickle(cache_file)
+
+    _memory_cache[key] = df
+    return df
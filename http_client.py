@@ -0,0 +1,235 @@
+"""Shared HTTP client for scraping, PDF downloads and compensation lookups.
+
+One pooled, keep-alive session per process (get_client), so repeat requests
+to a host reuse its connection instead of paying DNS, TCP and TLS setup each
+time. Transient failures are retried with backoff (honouring Retry-After),
+every request's timing is recorded, and downloads can stream.
+
+HTTP/2 is used when HTTP2 is set (or ECON_HTTP2=1) and httpx with h2 is
+installed (pip install 'httpx[http2]'); responses and errors then keep the
+requests API, so callers do not change.
+"""
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+# Hosts kept in the pool, and connections kept per host (requests' default is 10 and 10)
+POOL_HOSTS = 32
+POOL_PER_HOST = 16
+# (connect, read) seconds: a dead host fails fast, a slow page still loads
+TIMEOUT = (5, 30)
+# Retries of idempotent requests on connection errors and 502/503/504,
+# 0.5s, 1s, 2s ... apart (or as Retry-After says)
+RETRY = Retry(total=2, connect=2, read=1, status=2, backoff_factor=0.5,
+              status_forcelist=(502, 503, 504), allowed_methods={'GET', 'HEAD'},
+              respect_retry_after_header=True, raise_on_status=False)
+TIMINGS_KEPT = 1000
+HTTP2 = os.getenv('ECON_HTTP2') == '1'
+
+
+class Timing(NamedTuple):
+    method: str
+    url: str
+    status: Optional[int]  # None: no response
+    seconds: float  # whole request; streamed bodies are read later and not included
+    bytes: Optional[int]  # None when streamed
+    connect: Optional[float] = None  # DNS + TCP + TLS; 0 on a reused connection
+    ttfb: Optional[float] = None  # request sent to response headers, connect included
+
+
+# Connection setup time of the current thread's request (see _TimedConnection)
+_connect_time = threading.local()
+
+
+class _TimedConnection:
+    def connect(self):
+        started = time.monotonic()
+        try:
+            super().connect()
+        finally:
+            _connect_time.seconds = getattr(_connect_time, 'seconds', 0.0) + time.monotonic() - started
+
+
+class _TimedHTTPConnection(_TimedConnection, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnection, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections record their setup time."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool, 'https': _TimedHTTPSConnectionPool}
+
+
+class HttpClient:
+    """Pooled HTTP client with retries and per-request timing.
+
+    get() takes the requests arguments (headers, timeout, stream, ...) and
+    returns a requests-style response; errors are requests exceptions.
+    """
+
+    def __init__(self, retry: Retry = RETRY, timeout=TIMEOUT, http2: bool = HTTP2,
+                 headers: Optional[Dict[str, str]] = None):
+        self.timeout = timeout
+        self.timings = deque(maxlen=TIMINGS_KEPT)
+        self.listeners: List[Callable[[Timing], None]] = []  # called with each Timing
+        self.http2 = http2 and _httpx_http2_available()
+        headers = {'User-Agent': USER_AGENT, **(headers or {})}
+        if self.http2:
+            import httpx
+            self._httpx = httpx.Client(
+                http2=True, headers=headers, follow_redirects=True,
+                transport=httpx.HTTPTransport(http2=True, retries=retry.connect or 0),
+                limits=httpx.Limits(max_connections=POOL_HOSTS * POOL_PER_HOST,
+                                    max_keepalive_connections=POOL_HOSTS))
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        adapter = _TimedAdapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_PER_HOST, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    @property
+    def headers(self):
+        return self.session.headers
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request; the response's .timing is its Timing."""
+        kwargs.setdefault('timeout', self.timeout)
+        _connect_time.seconds = 0.0
+        started = time.monotonic()
+        response = None
+        try:
+            if self.http2:
+                response = self._httpx_request(method, url, **kwargs)
+            else:
+                response = self.session.request(method, url, **kwargs)
+            return response
+        finally:
+            streamed = kwargs.get('stream') or response is None
+            elapsed = getattr(response, 'elapsed', None)
+            timing = Timing(method, url, getattr(response, 'status_code', None),
+                            round(time.monotonic() - started, 4),
+                            None if streamed else len(response.content),
+                            None if self.http2 else round(_connect_time.seconds, 4),
+                            round(elapsed.total_seconds(), 4) if elapsed is not None else None)
+            if response is not None:
+                response.timing = timing
+            self._record(timing)
+
+    def _record(self, timing: Timing):
+        self.timings.append(timing)
+        for listener in self.listeners:
+            listener(timing)
+
+    def _httpx_request(self, method: str, url: str, headers=None, timeout=None, stream: bool = False,
+                       allow_redirects: bool = True, **kwargs) -> '_HTTPXResponse':
+        import httpx
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        try:
+            request = self._httpx.build_request(method, url, headers=headers, timeout=timeout, **kwargs)
+            response = self._httpx.send(request, stream=stream, follow_redirects=allow_redirects)
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e)) from e
+        return _HTTPXResponse(response)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Request count, mean and max seconds per host over the kept timings."""
+        from urllib.parse import urlparse
+        hosts = {}
+        for timing in self.timings:
+            hosts.setdefault(urlparse(timing.url).netloc, []).append(timing.seconds)
+        return {host: {'requests': len(s), 'mean': round(sum(s) / len(s), 4), 'max': max(s)}
+                for host, s in hosts.items()}
+
+    def close(self):
+        self.session.close()
+        if self.http2:
+            self._httpx.close()
+
+
+class _HTTPXResponse:
+    """requests-style view of an httpx response."""
+
+    def __init__(self, response):
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.url = str(response.url)
+
+    @property
+    def content(self) -> bytes:
+        return self._response.read()
+
+    @property
+    def text(self) -> str:
+        self._response.read()
+        return self._response.text
+
+    def iter_content(self, chunk_size: int = 1 << 16):
+        return self._response.iter_bytes(chunk_size)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+    def close(self):
+        self._response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _httpx_http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        import httpx  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HttpClient:
+    """The process's shared client (created on first use)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
+
@@ -452,6 +452,12 @@ def main():
     df = pd.read_csv(args.input)
     print(f"Found {len(df)} candidates")
 
+    run_network_analysis(df, viz=args.viz)
+
+
+def run_network_analysis(df: pd.DataFrame, viz: bool = False,
+                         output_path: str = 'data/network_centrality.csv') -> pd.DataFrame:
+    """Build the career graph, print the analysis and save centrality scores."""
     # Build graph
     print("\nBuilding career graph...")
     G = build_career_graph(df)
@@ -473,15 +479,17 @@ def main():
 
     # Save results
     centrality_df = pd.DataFrame.from_dict(centrality, orient='index')
-    centrality_df.to_csv('data/network_centrality.csv')
-    print(f"\nSaved centrality scores to data/network_centrality.csv")
+    centrality_df.to_csv(output_path)
+    print(f"\nSaved centrality scores to {output_path}")
 
     # Generate visualizations
-    if args.viz:
+    if viz:
         print("\nGenerating visualizations...")
         visualize_network(G, centrality)
         visualize_sankey(df)
 
+    return centrality_df
+
 
 if __name__ == "__main__":
     main()
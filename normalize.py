@@ -6,7 +6,8 @@ Handles:
 - Academia detection and standardization
 """
 
-import pandas as pd
+# pandas is deliberately not imported: every pipeline script imports this
+# module, and only scalar missing-value checks are needed here.
 
 # Rebrandings and subsidiaries to normalize
 COMPANY_ALIASES = {
@@ -45,13 +46,18 @@ ACADEMIA_KEYWORDS = [
 ]
 
 
+def _is_missing(value) -> bool:
+    """Scalar equivalent of pd.isna for None and float NaN (NaN != NaN)."""
+    return value is None or (isinstance(value, float) and value != value)
+
+
 def normalize_company(name) -> str:
     """
     Normalize company name to canonical form.
     Only handles rebrandings (Facebook→Meta, etc.)
     Subsidiaries remain separate (DeepMind, LinkedIn, etc.)
     """
-    if not name or pd.isna(name):
+    if not name or _is_missing(name):
         return name
 
     name_str = str(name)
@@ -68,7 +74,7 @@ def normalize_company(name) -> str:
 
 def is_academia(text) -> bool:
     """Check if text indicates an academic position."""
-    if not text or pd.isna(text):
+    if not text or _is_missing(text):
         return False
 
     text_lower = str(text).lower()
@@ -81,7 +87,7 @@ def standardize_current_placement(current_company) -> str:
     If it's academia, return "Academia".
     Otherwise, normalize the company name.
     """
-    if not current_company or pd.isna(current_company):
+    if not current_company or _is_missing(current_company):
         return current_company
 
     if is_academia(current_company):
@@ -1,66 +1,112 @@
-"""School-specific parsers for economics PhD placement data."""
+"""School-specific parsers for economics PhD placement data.
+
+Parsers are listed by school in PARSER_MODULES and imported and constructed
+on first use, so a run pays only for the schools it parses. Add a school by
+adding its module to the table (or calling register_parser for a module
+outside this package).
+"""
+from collections.abc import Mapping
+from importlib import import_module
+from typing import Dict, Iterator, List, Optional
+
 from .base import SchoolParser
 
-# Original 10 parsers
-from .princeton import PrincetonParser
-from .uchicago import UChicagoParser
-from .nyu import NYUParser
-from .stanford import StanfordParser
-from .mit import MITParser
-from .yale import YaleParser
-from .brown import BrownParser
-from .penn import PennParser
-from .maryland import MarylandParser
-from .cmu import CMUParser
-
-# New 14 parsers
-from .harvard import HarvardParser
-from .berkeley import BerkeleyParser
-from .northwestern import NorthwesternParser
-from .columbia import ColumbiaParser
-from .michigan import MichiganParser
-from .ucla import UCLAParser
-from .wisconsin import WisconsinParser
-from .duke import DukeParser
-from .minnesota import MinnesotaParser
-from .cornell import CornellParser
-from .washington import WashingtonParser
-from .illinois import IllinoisParser
-from .virginia import VirginiaParser
-from .utaustin import UTAustinParser
-
-# Map school names to their custom parsers
-CUSTOM_PARSERS = {
+# School name -> 'module:ParserClass'; relative modules are in this package
+PARSER_MODULES = {
     # Original 10
-    'Princeton': PrincetonParser(),
-    'University of Chicago': UChicagoParser(),
-    'NYU': NYUParser(),
-    'Stanford': StanfordParser(),
-    'MIT': MITParser(),
-    'Yale': YaleParser(),
-    'Brown': BrownParser(),
-    'University of Pennsylvania': PennParser(),
-    'University of Maryland': MarylandParser(),
-    'Carnegie Mellon': CMUParser(),
+    'Princeton': '.princeton:PrincetonParser',
+    'University of Chicago': '.uchicago:UChicagoParser',
+    'NYU': '.nyu:NYUParser',
+    'Stanford': '.stanford:StanfordParser',
+    'MIT': '.mit:MITParser',
+    'Yale': '.yale:YaleParser',
+    'Brown': '.brown:BrownParser',
+    'University of Pennsylvania': '.penn:PennParser',
+    'University of Maryland': '.maryland:MarylandParser',
+    'Carnegie Mellon': '.cmu:CMUParser',
     # New 14
-    'Harvard': HarvardParser(),
-    'UC Berkeley': BerkeleyParser(),
-    'Northwestern': NorthwesternParser(),
-    'Columbia': ColumbiaParser(),
-    'University of Michigan': MichiganParser(),
-    'UCLA': UCLAParser(),
-    'University of Wisconsin': WisconsinParser(),
-    'Duke': DukeParser(),
-    'University of Minnesota': MinnesotaParser(),
-    'Cornell': CornellParser(),
-    'University of Washington': WashingtonParser(),
-    'University of Illinois': IllinoisParser(),
-    'University of Virginia': VirginiaParser(),
-    'UT Austin': UTAustinParser(),
+    'Harvard': '.harvard:HarvardParser',
+    'UC Berkeley': '.berkeley:BerkeleyParser',
+    'Northwestern': '.northwestern:NorthwesternParser',
+    'Columbia': '.columbia:ColumbiaParser',
+    'University of Michigan': '.michigan:MichiganParser',
+    'UCLA': '.ucla:UCLAParser',
+    'University of Wisconsin': '.wisconsin:WisconsinParser',
+    'Duke': '.duke:DukeParser',
+    'University of Minnesota': '.minnesota:MinnesotaParser',
+    'Cornell': '.cornell:CornellParser',
+    'University of Washington': '.washington:WashingtonParser',
+    'University of Illinois': '.illinois:IllinoisParser',
+    'University of Virginia': '.virginia:VirginiaParser',
+    'UT Austin': '.utaustin:UTAustinParser',
 }
 
+
+def _load_class(path: str) -> type:
+    """Import 'module:ParserClass' and return the class."""
+    module, _, class_name = path.partition(':')
+    return getattr(import_module(module, __name__), class_name)
+
+
+class ParserRegistry(Mapping):
+    """School name -> parser, imported and constructed on first lookup.
+
+    Membership, iteration and len() only read the module table.
+    """
+
+    def __init__(self, modules: Dict[str, str]):
+        self._modules = modules
+        self._parsers: Dict[str, SchoolParser] = {}
+
+    def __getitem__(self, school: str) -> SchoolParser:
+        if school not in self._parsers:
+            self._parsers[school] = _load_class(self._modules[school])()
+        return self._parsers[school]
+
+    def __contains__(self, school) -> bool:
+        return school in self._modules
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._modules)
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+    def register(self, school: str, path: str):
+        """Add or replace a school's parser ('module:ParserClass')."""
+        self._modules[school] = path
+        self._parsers.pop(school, None)
+
+
+CUSTOM_PARSERS = ParserRegistry(PARSER_MODULES)
+
+
+def get_parser(school: str) -> Optional[SchoolParser]:
+    """The school's custom parser, or None if it has none."""
+    return CUSTOM_PARSERS[school] if school in CUSTOM_PARSERS else None
+
+
+def available_schools() -> List[str]:
+    """Schools with a custom parser, without importing any of them."""
+    return list(CUSTOM_PARSERS)
+
+
+def register_parser(school: str, path: str):
+    """Register a parser by 'module:ParserClass', e.g. 'myparsers.rice:RiceParser'."""
+    CUSTOM_PARSERS.register(school, path)
+
+
+def __getattr__(name: str):
+    # Parser classes stay importable by name (from parsers import DukeParser)
+    for path in PARSER_MODULES.values():
+        if path.endswith(':' + name):
+            return _load_class(path)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
-    'SchoolParser', 'CUSTOM_PARSERS',
+    'SchoolParser', 'CUSTOM_PARSERS', 'PARSER_MODULES', 'ParserRegistry',
+    'get_parser', 'available_schools', 'register_parser',
     # Original
     'PrincetonParser', 'UChicagoParser', 'NYUParser',
     'StanfordParser', 'MITParser', 'YaleParser',
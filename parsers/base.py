@@ -1,9 +1,13 @@
 """Base class for school-specific parsers."""
 from abc import ABC, abstractmethod
 from bs4 import BeautifulSoup
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import re
 
+from bs4 import Tag
+
+from .spec import compile_strategies
+
 # Consolidated list of tech companies for placement filtering
 TECH_COMPANIES = {
     # Big Tech
@@ -55,16 +59,78 @@ class SchoolParser(ABC):
     # Subclasses can override to extend the default list
     TECH_COMPANIES = TECH_COMPANIES
 
+    # Named extraction strategies, run in order: (name, CSS selector, handler).
+    # The handler is a declarative spec (see parsers/spec.py) or the name of a
+    # method that gets each matched element and returns a candidate, a list of
+    # candidates or None; with selector None it gets the whole soup.
+    # Parsers that define STRATEGIES inherit parse(); others override parse()
+    # and count as a single strategy.
+    STRATEGIES: Tuple[tuple, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Compiled once per class, so a bad spec fails at import
+        cls._compiled_strategies = compile_strategies(cls.STRATEGIES)
+
     @property
     @abstractmethod
     def school_name(self) -> str:
         """Return the school name."""
         pass
 
-    @abstractmethod
     def parse(self, soup: BeautifulSoup) -> List[Dict]:
         """Parse candidates from page."""
-        pass
+        return self.run_strategies(soup)[0]
+
+    def strategy_names(self) -> List[str]:
+        """Names of the parser's strategies, in the order they run."""
+        return [name for name, _, _ in self.STRATEGIES] or ['parse']
+
+    def run_strategies(self, soup: BeautifulSoup,
+                       only: Optional[List[str]] = None) -> Tuple[List[Dict], List[str]]:
+        """Run all strategies (or only the named ones), deduplicating by name.
+
+        Returns:
+            Tuple of (candidates, names of the strategies that contributed any)
+        """
+        if not self.STRATEGIES:
+            candidates = self.parse(soup)
+            return candidates, ['parse'] if candidates else []
+
+        strategies = [(name, matches, extract) for name, matches, extract in self._compiled_strategies
+                      if only is None or name in only]
+        # One walk over the page collects every strategy's elements, in document order
+        matched = {name: [] for name, matches, _ in strategies if matches}
+        if matched:
+            selectors = [(matched[name], matches) for name, matches, _ in strategies if matches]
+            for elem in soup.descendants:
+                if isinstance(elem, Tag):
+                    for elements, matches in selectors:
+                        if matches(elem):
+                            elements.append(elem)
+
+        candidates = []
+        seen_names = set()
+        produced = []
+        for name, matches, extract in strategies:
+            results = extract(self, matched[name] if matches else [soup])
+            added = 0
+            for result in results:
+                for c in (result if isinstance(result, list) else [result]):
+                    if c and c['name'].lower() not in seen_names:
+                        seen_names.add(c['name'].lower())
+                        candidates.append(c)
+                        added += 1
+            if added:
+                produced.append(name)
+        return candidates, produced
+
+    def run_strategy(self, name: str, elements: list, **options) -> List[Dict]:
+        """Run one spec strategy's extractor on the given elements."""
+        for strategy, _, extract in self._compiled_strategies:
+            if strategy == name:
+                return extract(self, elements, **options)
+        raise KeyError(f"{type(self).__name__} has no strategy {name!r}")
 
     def extract_year(self, text: str) -> int:
         """Extract a year (2020-2025) from text."""
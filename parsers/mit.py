@@ -1,5 +1,4 @@
 """MIT Economics department parser."""
-from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 from .base import SchoolParser
 
@@ -11,46 +10,25 @@ class MITParser(SchoolParser):
     Job market page: https://economics.mit.edu/academic-programs/phd-program/job-market
     """
 
+    STRATEGIES = (
+        # Figure/figcaption structure (primary layout)
+        ('figures', 'figure.caption, figure[role="group"], figure', '_parse_figure'),
+        # Card/profile structure
+        ('cards', '.person, .profile, .candidate, article',
+         {'kind': 'card', 'name': 'h2 a, h3 a, h4 a, h2, h3, h4, .name, .title',
+          'fields': '.research, .interests, .fields, .research-areas'}),
+        # Table structure (placement history)
+        ('tables', 'table', '_parse_table'),
+        # Grid items
+        ('grid_items', '.grid-item, .views-row, .node',
+         {'kind': 'card', 'name': 'h2, h3, h4, a, .name, .title', 'skip_words': ['mit', 'building', 'campus'],
+          'fields': '.research, .interests, .field', 'placement': '.placement, .position'}),
+    )
+
     @property
     def school_name(self) -> str:
         return 'MIT'
 
-    def parse(self, soup: BeautifulSoup) -> List[Dict]:
-        """Parse candidates from MIT Economics pages."""
-        candidates = []
-        seen_names = set()
-
-        # Strategy 1: Figure/figcaption structure (primary layout)
-        for figure in soup.select('figure.caption, figure[role="group"], figure'):
-            candidate = self._parse_figure(figure)
-            if candidate and candidate['name'].lower() not in seen_names:
-                seen_names.add(candidate['name'].lower())
-                candidates.append(candidate)
-
-        # Strategy 2: Card/profile structure
-        for card in soup.select('.person, .profile, .candidate, article'):
-            candidate = self._parse_card(card)
-            if candidate and candidate['name'].lower() not in seen_names:
-                seen_names.add(candidate['name'].lower())
-                candidates.append(candidate)
-
-        # Strategy 3: Table structure (placement history)
-        for table in soup.select('table'):
-            table_candidates = self._parse_table(table)
-            for c in table_candidates:
-                if c['name'].lower() not in seen_names:
-                    seen_names.add(c['name'].lower())
-                    candidates.append(c)
-
-        # Strategy 4: Grid items
-        for item in soup.select('.grid-item, .views-row, .node'):
-            candidate = self._parse_grid_item(item)
-            if candidate and candidate['name'].lower() not in seen_names:
-                seen_names.add(candidate['name'].lower())
-                candidates.append(candidate)
-
-        return candidates
-
     def _parse_figure(self, figure) -> Optional[Dict]:
         """Parse a figure/figcaption element."""
         figcaption = figure.select_one('figcaption')
@@ -87,31 +65,6 @@ class MITParser(SchoolParser):
             year=year
         )
 
-    def _parse_card(self, card) -> Optional[Dict]:
-        """Parse a profile/person card."""
-        name_elem = card.select_one('h2 a, h3 a, h4 a, h2, h3, h4, .name, .title')
-        if not name_elem:
-            return None
-
-        name = name_elem.get_text(strip=True)
-        if not name or len(name) < 3 or len(name) > 100:
-            return None
-
-        fields_elem = card.select_one('.research, .interests, .fields, .research-areas')
-        fields = fields_elem.get_text(strip=True) if fields_elem else ''
-
-        placement_elem = card.select_one('.placement, .position, .employer')
-        placement = placement_elem.get_text(strip=True) if placement_elem else ''
-
-        year = self.extract_year(card.get_text())
-
-        return self.create_candidate(
-            name=name,
-            placement=placement,
-            year=year,
-            fields=fields
-        )
-
     def _parse_table(self, table) -> List[Dict]:
         """Parse a placement table."""
         candidates = []
@@ -146,31 +99,3 @@ class MITParser(SchoolParser):
             ))
 
         return candidates
-
-    def _parse_grid_item(self, item) -> Optional[Dict]:
-        """Parse a grid/views-row item."""
-        name_elem = item.select_one('h2, h3, h4, a, .name, .title')
-        if not name_elem:
-            return None
-
-        name = name_elem.get_text(strip=True)
-        if not name or len(name) < 3 or len(name) > 100:
-            return None
-
-        if any(g in name.lower() for g in ['mit', 'building', 'campus']):
-            return None
-
-        fields_elem = item.select_one('.research, .interests, .field')
-        fields = fields_elem.get_text(strip=True) if fields_elem else ''
-
-        placement_elem = item.select_one('.placement, .position')
-        placement = placement_elem.get_text(strip=True) if placement_elem else ''
-
-        year = self.extract_year(item.get_text())
-
-        return self.create_candidate(
-            name=name,
-            placement=placement,
-            year=year,
-            fields=fields
-        )
@@ -0,0 +1,274 @@
+"""Declarative extraction specs for school parsers.
+
+A strategy in a parser's STRATEGIES either names a handler method or gives
+a spec: a dict with a 'kind' plus the selectors, column keywords and skip
+words that set one school's pages apart. Specs are checked and compiled
+once, when the parser class is defined, into extractors that share one
+implementation per kind.
+
+    ('tables', 'table', {'kind': 'table', 'columns': {'year': ['year', 'graduated']}}),
+    ('cards', '.person, article', {'kind': 'card', 'skip_words': ['duke']}),
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+
+from css_select import compile_selector, select, select_one
+
+# Spec kinds and their parameters, with defaults
+DEFAULTS = {
+    # <table> with a header row; columns found by header keywords
+    'table': {
+        'columns': {
+            'name': ['name', 'student', 'candidate'],
+            'placement': ['placement', 'employer', 'position', 'first'],
+            'year': ['year', 'class', 'cohort'],
+            'fields': ['field', 'research', 'area'],
+        },
+        'skip_names': ['name', 'candidate', 'student', ''],
+        'placement_fallback': 1,  # column used when the placement column is past the row end
+        'year_headings': None,  # headings whose year applies to the tables after them
+        'keep_year': False,  # headings without a year keep the previous one
+    },
+    # One person per element
+    'card': {
+        'name': 'h2, h3, h4, .name, .title, a',
+        'skip_words': [],
+        'fields': '.research, .interests, .fields',
+        'placement': '.placement, .position, .employer',
+    },
+    # "Name, Placement" items under a header carrying the year
+    'section': {
+        'header': 'h2, h3, h4, summary, .year-header',
+        'header_fallback': True,  # no header: look for the year in the section's first 50 chars
+        'items': 'li, p',
+        'min_text': 10,
+        'separators': [' - ', ' – '],
+        'skip_names': ['class', 'year', 'placement'],
+        'skip_digits': True,
+    },
+    # "Name - Placement (year)" items; items None parses the element itself
+    'list': {
+        'items': 'li',
+        'skip_nav': True,
+        'min_text': 10,
+        'separators': [' - ', ' – '],
+        'require_placement': True,
+        'skip_digits': True,
+    },
+    # <dl> with name/placement dt/dd pairs
+    'definition_list': {},
+}
+
+
+def _find_col(headers: List[str], keywords: List[str]) -> int:
+    """Find column index matching any keyword (0 if none does)."""
+    for i, h in enumerate(headers):
+        for kw in keywords:
+            if kw in h:
+                return i
+    return 0
+
+
+def _split_line(text: str, separators: List[str]) -> List[str]:
+    """Split 'Name - Placement, ...' text into comma-separated parts."""
+    for sep in separators:
+        text = text.replace(sep, ', ')
+    return text.split(',')
+
+
+def _table(spec: Dict) -> Callable:
+    row_match = compile_selector('tr')
+    header_match = compile_selector('th, td')
+    cell_match = compile_selector('td')
+    heading_match = compile_selector(spec['year_headings']) if spec['year_headings'] else None
+    columns = spec['columns']
+    skip_names = set(spec['skip_names'])
+    fallback = spec['placement_fallback']
+
+    def parse_table(parser, table, year) -> List[Dict]:
+        candidates = []
+        rows = select(table, row_match)
+        headers = [th.get_text(strip=True).lower() for th in select(rows[0], header_match)] if rows else []
+        name_col, placement_col, year_col, fields_col = (
+            _find_col(headers, columns[key]) for key in ('name', 'placement', 'year', 'fields'))
+
+        for row in rows[1:]:
+            cells = select(row, cell_match)
+            if len(cells) < 2:
+                continue
+            name = cells[name_col if name_col < len(cells) else 0].get_text(strip=True)
+            if not name or len(name) < 3 or len(name) > 100 or name.lower() in skip_names:
+                continue
+            cell = placement_col if placement_col < len(cells) else fallback
+            placement = cells[cell].get_text(strip=True)
+            fields = cells[fields_col].get_text(strip=True) if fields_col < len(cells) else ''
+            row_year = year
+            if not row_year and year_col < len(cells):
+                row_year = parser.extract_year(cells[year_col].get_text())
+            if not row_year:
+                row_year = parser.extract_year(row.get_text())
+            candidates.append(parser.create_candidate(name=name, placement=placement, year=row_year, fields=fields))
+        return candidates
+
+    def extract(parser, elements, year=None) -> List[Dict]:
+        candidates = []
+        for elem in elements:
+            if heading_match and heading_match(elem):
+                heading_year = parser.extract_year(elem.get_text())
+                if heading_year or not spec['keep_year']:
+                    year = heading_year
+            else:
+                candidates.extend(parse_table(parser, elem, year))
+        return candidates
+    return extract
+
+
+def _card(spec: Dict) -> Callable:
+    name_match = compile_selector(spec['name'])
+    fields_match = compile_selector(spec['fields'])
+    placement_match = compile_selector(spec['placement'])
+    skip_words = spec['skip_words']
+
+    def extract(parser, elements) -> List[Dict]:
+        candidates = []
+        for card in elements:
+            name_elem = select_one(card, name_match)
+            if not name_elem:
+                continue
+            name = name_elem.get_text(strip=True)
+            if not name or len(name) < 3 or len(name) > 100:
+                continue
+            if any(w in name.lower() for w in skip_words):
+                continue
+            fields_elem = select_one(card, fields_match)
+            placement_elem = select_one(card, placement_match)
+            candidates.append(parser.create_candidate(
+                name=name,
+                placement=placement_elem.get_text(strip=True) if placement_elem else '',
+                year=parser.extract_year(card.get_text()),
+                fields=fields_elem.get_text(strip=True) if fields_elem else '',
+            ))
+        return candidates
+    return extract
+
+
+def _section(spec: Dict) -> Callable:
+    header_match = compile_selector(spec['header'])
+    item_match = compile_selector(spec['items'])
+    skip_names = set(spec['skip_names'])
+
+    def extract(parser, elements) -> List[Dict]:
+        candidates = []
+        for section in elements:
+            header = select_one(section, header_match)
+            if header:
+                year = parser.extract_year(header.get_text())
+            else:
+                year = parser.extract_year(section.get_text()[:50] if spec['header_fallback'] else '')
+
+            for item in select(section, item_match):
+                text = item.get_text(separator=' ', strip=True)
+                if not text or len(text) < spec['min_text']:
+                    continue
+                parts = _split_line(text, spec['separators'])
+                name = parts[0].strip()
+                if not name or len(name) < 3 or len(name) > 100:
+                    continue
+                if (spec['skip_digits'] and name.isdigit()) or name.lower() in skip_names:
+                    continue
+                placement = parts[1].strip() if len(parts) > 1 else ''
+                candidates.append(parser.create_candidate(name=name, placement=placement, year=year))
+        return candidates
+    return extract
+
+
+def _list(spec: Dict) -> Callable:
+    item_match = compile_selector(spec['items']) if spec['items'] else None
+
+    def extract(parser, elements) -> List[Dict]:
+        candidates = []
+        for elem in elements:
+            if spec['skip_nav'] and (elem.find_parent('nav') or elem.find_parent('header')):
+                continue
+            for item in (select(elem, item_match) if item_match else [elem]):
+                text = item.get_text(separator=' ', strip=True)
+                if not text or len(text) < spec['min_text']:
+                    continue
+                parts = _split_line(text, spec['separators'])
+                if spec['require_placement'] and len(parts) < 2:
+                    continue
+                name = parts[0].strip()
+                if not name or len(name) < 3 or len(name) > 100:
+                    continue
+                if spec['skip_digits'] and name.isdigit():
+                    continue
+                placement = parts[1].strip() if len(parts) > 1 else ''
+                candidates.append(parser.create_candidate(
+                    name=name, placement=placement, year=parser.extract_year(text)))
+        return candidates
+    return extract
+
+
+def _definition_list(spec: Dict) -> Callable:
+    dt_match = compile_selector('dt')
+    dd_match = compile_selector('dd')
+
+    def extract(parser, elements) -> List[Dict]:
+        candidates = []
+        for dl in elements:
+            for dt, dd in zip(select(dl, dt_match), select(dl, dd_match)):
+                name = dt.get_text(strip=True)
+                if name and 3 <= len(name) <= 100:
+                    candidates.append(parser.create_candidate(
+                        name=name, placement=dd.get_text(strip=True), year=parser.extract_year(dd.get_text())))
+        return candidates
+    return extract
+
+
+BUILDERS = {
+    'table': _table,
+    'card': _card,
+    'section': _section,
+    'list': _list,
+    'definition_list': _definition_list,
+}
+
+
+def compile_spec(spec: Dict) -> Callable:
+    """Compile a spec into an extractor: (parser, elements) -> candidates."""
+    kind = spec.get('kind')
+    if kind not in BUILDERS:
+        raise ValueError(f"Unknown spec kind {kind!r}; expected one of {sorted(BUILDERS)}")
+    unknown = set(spec) - set(DEFAULTS[kind]) - {'kind'}
+    if unknown:
+        raise ValueError(f"Unknown {kind} spec parameters: {sorted(unknown)}")
+    params = {**DEFAULTS[kind], **spec}
+    if kind == 'table':
+        unknown = set(spec.get('columns', {})) - set(DEFAULTS['table']['columns'])
+        if unknown:
+            raise ValueError(f"Unknown table columns: {sorted(unknown)}")
+        params['columns'] = {**DEFAULTS['table']['columns'], **spec.get('columns', {})}
+    return BUILDERS[kind](params)
+
+
+def _method_extractor(handler: str) -> Callable:
+    """Extractor calling a parser's handler method on each element."""
+    def extract(parser, elements) -> list:
+        method = getattr(parser, handler)
+        return [method(elem) for elem in elements]
+    return extract
+
+
+def compile_strategies(strategies) -> List[Tuple[str, Optional[Callable], Callable]]:
+    """Compile STRATEGIES into (name, element predicate or None, extractor) triples."""
+    compiled = []
+    for name, selector, handler in strategies:
+        if isinstance(handler, str):
+            extractor = _method_extractor(handler)
+        else:
+            if selector is None:
+                raise ValueError(f"Strategy {name!r}: specs need a selector")
+            extractor = compile_spec(handler)
+            if handler.get('year_headings'):
+                selector = f"{selector}, {handler['year_headings']}"
+        compiled.append((name, compile_selector(selector) if selector else None, extractor))
+    return compiled
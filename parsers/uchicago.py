@@ -7,8 +7,9 @@ from .base import SchoolParser
 class UChicagoParser(SchoolParser):
     """Parser for UChicago Economics department pages.
 
-    Note: UChicago's placement data is primarily in an external PDF.
-    This parser handles both the PDF and any HTML page content.
+    Note: UChicago's placement data is primarily in an external PDF, which
+    is a separate scrape target (see 'pdfs' in schools.json) and takes
+    precedence when it yields candidates. This parser handles the HTML page.
     """
 
     @property
@@ -19,15 +20,6 @@ class UChicagoParser(SchoolParser):
         """Parse candidates from UChicago Economics pages."""
         candidates = []
 
-        # Strategy 0: Try PDF parsing first (primary data source)
-        pdf_candidates = self._parse_pdf()
-        candidates.extend(pdf_candidates)
-
-        # If we got PDF data, that's the authoritative source
-        if pdf_candidates:
-            return candidates
-
-        # Fallback to HTML parsing if PDF fails
         # Strategy 1: Person cards (UChicago uses specific classes)
         for card in soup.select('.person-card, .person, .profile, .views-row, article.candidate'):
             name_elem = card.select_one('h2, h3, h4, .name, .person-name, a')
@@ -93,16 +85,3 @@ class UChicagoParser(SchoolParser):
                         break
 
         return candidates
-
-    def _parse_pdf(self) -> List[Dict]:
-        """Parse placement data from UChicago's PDF."""
-        try:
-            from pdf_parser import UChicagoPDFParser
-            parser = UChicagoPDFParser()
-            return parser.parse()
-        except ImportError:
-            print("  [UChicago] PDF parser not available")
-            return []
-        except Exception as e:
-            print(f"  [UChicago] PDF parsing failed: {e}")
-            return []
@@ -1,5 +1,4 @@
 """Yale Economics department parser."""
-from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 from .base import SchoolParser
 
@@ -12,46 +11,26 @@ class YaleParser(SchoolParser):
     Placement page: https://economics.yale.edu/graduate/placement
     """
 
+    STRATEGIES = (
+        # Tables (primary for placement history)
+        ('tables', 'table', '_parse_table'),
+        # Accordion/expandable sections
+        ('accordions', '.accordion-item, .expandable, .panel, .collapse-item', '_parse_accordion'),
+        # Card/profile structures
+        ('cards', '.person, .profile, .candidate, .views-row, article',
+         {'kind': 'card', 'name': 'h2 a, h3 a, h4 a, h2, h3, h4, .name, .title a, .title',
+          'skip_words': ['yale', 'building', 'campus', 'click', 'website'],
+          'fields': '.research, .interests, .fields, .research-areas'}),
+        # Grid layouts
+        ('grid_items', '.grid-item, .person-grid-item, .student-card',
+         {'kind': 'card', 'name': 'h2, h3, h4, a, .name, .title',
+          'fields': '.research, .interests, .field', 'placement': '.placement, .position'}),
+    )
+
     @property
     def school_name(self) -> str:
         return 'Yale'
 
-    def parse(self, soup: BeautifulSoup) -> List[Dict]:
-        """Parse candidates from Yale Economics pages."""
-        candidates = []
-        seen_names = set()
-
-        # Strategy 1: Tables (primary for placement history)
-        for table in soup.select('table'):
-            table_candidates = self._parse_table(table)
-            for c in table_candidates:
-                if c['name'].lower() not in seen_names:
-                    seen_names.add(c['name'].lower())
-                    candidates.append(c)
-
-        # Strategy 2: Accordion/expandable sections
-        for accordion in soup.select('.accordion-item, .expandable, .panel, .collapse-item'):
-            candidate = self._parse_accordion(accordion)
-            if candidate and candidate['name'].lower() not in seen_names:
-                seen_names.add(candidate['name'].lower())
-                candidates.append(candidate)
-
-        # Strategy 3: Card/profile structures
-        for card in soup.select('.person, .profile, .candidate, .views-row, article'):
-            candidate = self._parse_card(card)
-            if candidate and candidate['name'].lower() not in seen_names:
-                seen_names.add(candidate['name'].lower())
-                candidates.append(candidate)
-
-        # Strategy 4: Grid layouts
-        for item in soup.select('.grid-item, .person-grid-item, .student-card'):
-            candidate = self._parse_grid_item(item)
-            if candidate and candidate['name'].lower() not in seen_names:
-                seen_names.add(candidate['name'].lower())
-                candidates.append(candidate)
-
-        return candidates
-
     def _parse_table(self, table) -> List[Dict]:
         """Parse a placement table."""
         candidates = []
@@ -147,57 +126,3 @@ class YaleParser(SchoolParser):
             year=year,
             fields=fields
         )
-
-    def _parse_card(self, card) -> Optional[Dict]:
-        """Parse a profile/person card."""
-        name_elem = card.select_one('h2 a, h3 a, h4 a, h2, h3, h4, .name, .title a, .title')
-        if not name_elem:
-            return None
-
-        name = name_elem.get_text(strip=True)
-        if not name or len(name) < 3 or len(name) > 100:
-            return None
-
-        # Skip garbage
-        if any(g in name.lower() for g in ['yale', 'building', 'campus', 'click', 'website']):
-            return None
-
-        fields_elem = card.select_one('.research, .interests, .fields, .research-areas')
-        fields = fields_elem.get_text(strip=True) if fields_elem else ''
-
-        placement_elem = card.select_one('.placement, .position, .employer')
-        placement = placement_elem.get_text(strip=True) if placement_elem else ''
-
-        year = self.extract_year(card.get_text())
-
-        return self.create_candidate(
-            name=name,
-            placement=placement,
-            year=year,
-            fields=fields
-        )
-
-    def _parse_grid_item(self, item) -> Optional[Dict]:
-        """Parse a grid item."""
-        name_elem = item.select_one('h2, h3, h4, a, .name, .title')
-        if not name_elem:
-            return None
-
-        name = name_elem.get_text(strip=True)
-        if not name or len(name) < 3 or len(name) > 100:
-            return None
-
-        fields_elem = item.select_one('.research, .interests, .field')
-        fields = fields_elem.get_text(strip=True) if fields_elem else ''
-
-        placement_elem = item.select_one('.placement, .position')
-        placement = placement_elem.get_text(strip=True) if placement_elem else ''
-
-        year = self.extract_year(item.get_text())
-
-        return self.create_candidate(
-            name=name,
-            placement=placement,
-            year=year,
-            fields=fields
-        )
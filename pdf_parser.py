@@ -2,11 +2,26 @@
 """
 PDF parsing for economics PhD placement data.
 Handles external PDF sources like UChicago Box.com links.
+
+Downloads stream to data/cache/pdf/<sha256>.pdf and are revalidated with
+ETag/Last-Modified; resolved Box download URLs and extracted candidates
+are cached alongside, so re-parsing an unchanged PDF costs no network
+round-trip beyond a conditional GET. Extraction streams page by page
+(iter_pages / iter_candidates), so memory does not grow with page count.
 """
+import hashlib
+import inspect
 import io
+import json
+import multiprocessing
+import os
 import re
+import sys
+import threading
 import requests
-from typing import List, Dict, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 from pathlib import Path
 
 try:
@@ -15,9 +30,134 @@ except ImportError:
     pdfplumber = None
     print("Warning: pdfplumber not installed. Run: pip install pdfplumber")
 
+# Optional: pdfium's C text extractor for the text-first fast path
+try:
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+except ImportError:
+    pdfium = None
+
+from http_client import get_client
 # Import tech companies and normalization from main scraper
 from normalize import is_academia, normalize_company
 
+PDF_CACHE_DIR = Path('data/cache/pdf')
+
+# Bump when extraction results change for reasons not visible in this module
+PDF_CACHE_VERSION = 1
+
+# Guards the download index when several PDFs are fetched concurrently
+_index_lock = threading.Lock()
+
+# Below this many pages, worker start-up costs more than page-parallel extraction saves
+MIN_PARALLEL_PAGES = 8
+
+# Path objects covering at least this share of the page are backgrounds, not rulings
+BACKGROUND_AREA = 0.9
+
+
+def _has_rulings(page) -> bool:
+    """True if a pdfium page has drawn lines/rects that could bound a table.
+
+    pdfplumber's default table finder only builds cells from such edges,
+    so a page without them cannot yield tables.
+    """
+    width, height = page.get_size()
+    for obj in page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_PATH]):
+        left, bottom, right, top = obj.get_bounds()
+        if (right - left) * (top - bottom) < BACKGROUND_AREA * width * height:
+            return True
+    return False
+
+
+def _open_plumber(source: Union[bytes, str, Path]):
+    return pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source)
+
+
+def page_count(source: Union[bytes, str, Path]) -> int:
+    """Number of pages, read from the PDF's page tree without laying pages out."""
+    if pdfium is not None:
+        doc = pdfium.PdfDocument(source)
+        try:
+            return len(doc)
+        finally:
+            doc.close()
+    with _open_plumber(source) as pdf:
+        return len(pdf.pages)
+
+
+def iter_pages(source: Union[bytes, str, Path], start: int = 0, stop: Optional[int] = None,
+               text_first: bool = True) -> Iterator[tuple]:
+    """Yield (tables, text) for pages [start, stop) of a PDF, one page at a time.
+
+    Text is only extracted for pages without tables. With text_first (and
+    pypdfium2 installed), pdfplumber's table detection only runs on pages
+    with ruling lines and text comes from pdfium; otherwise every page goes
+    through pdfplumber. Each page's layout caches are released before the
+    next page is read, so memory stays flat however long the document is.
+    """
+    if not text_first or pdfium is None:
+        with _open_plumber(source) as pdf:
+            for page in pdf.pages[start:stop]:
+                tables = page.extract_tables()
+                text = None if tables else page.extract_text()
+                page.close()
+                yield tables, text
+        return
+
+    doc = pdfium.PdfDocument(source)
+    plumber = None
+    try:
+        for index in range(len(doc))[start:stop]:
+            page = doc[index]
+            tables = []
+            if _has_rulings(page):
+                if plumber is None:
+                    plumber = _open_plumber(source)
+                plumber_page = plumber.pages[index]
+                tables = plumber_page.extract_tables()
+                plumber_page.close()
+            text = None
+            if not tables:
+                textpage = page.get_textpage()
+                text = textpage.get_text_range().replace('\r\n', '\n').replace('\r', '\n')
+                textpage.close()
+            page.close()
+            yield tables, text
+    finally:
+        if plumber is not None:
+            plumber.close()
+        doc.close()
+
+
+def _build_trie(words) -> dict:
+    """Character trie over words; a node's '' key holds the word ending there."""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = word
+    return trie
+
+
+def _match_prefix(trie: dict, text: str) -> Optional[str]:
+    """Longest word in the trie that text starts with."""
+    match = None
+    node = trie
+    for char in text:
+        node = node.get(char)
+        if node is None:
+            break
+        match = node.get('', match)
+    return match
+
+
+def _extract_pages(source: Union[bytes, str, Path], start: int, stop: Optional[int],
+                   text_first: bool = True) -> List[tuple]:
+    """Extract pages [start, stop) as a list; runs in page-worker processes."""
+    return list(iter_pages(source, start, stop, text_first))
+
 
 class PDFPlacementParser:
     """Parse placement data from PDF documents."""
@@ -57,34 +197,153 @@ class PDFPlacementParser:
         'grammarly', 'duolingo', 'coursera', 'udemy', 'pandora', 'adobe',
     }
 
-    def __init__(self, school_name: str):
+    def __init__(self, school_name: str, page_workers: int = 1, text_first: bool = True):
+        """
+        Args:
+            school_name: School attached to extracted candidates
+            page_workers: Processes for page extraction; 1 is serial, 0 uses all cores
+            text_first: Run table detection only on pages with ruling lines (see iter_pages)
+        """
         self.school_name = school_name
+        self.page_workers = page_workers or os.cpu_count() or 1
+        self.text_first = text_first
+        self._company_trie = _build_trie(self.TECH_COMPANIES)
+
+    def _load_index(self) -> dict:
+        """Load the download index: source URL -> resolved URL, hash and validators."""
+        index_file = PDF_CACHE_DIR / 'index.json'
+        if index_file.exists():
+            try:
+                with open(index_file) as f:
+                    return json.load(f)
+            except json.JSONDecodeError:
+                pass
+        return {}
+
+    def _update_index(self, url: str, entry: Optional[dict]):
+        """Replace (or with None, remove) a source URL's index entry."""
+        with _index_lock:
+            index = self._load_index()
+            if entry is None:
+                index.pop(url, None)
+            else:
+                index[url] = entry
+            PDF_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(PDF_CACHE_DIR / 'index.json', 'w') as f:
+                json.dump(index, f, indent=2)
 
-    def fetch_pdf(self, url: str) -> Optional[bytes]:
-        """Download PDF from URL (handles Box.com public links)."""
-        try:
+    def fetch_pdf_file(self, url: str, force: bool = False) -> Optional[Path]:
+        """Download a PDF into the cache, returning its path (named by SHA-256).
+
+        Handles Box.com public links (the resolved download URL is cached).
+        A cached copy is revalidated with a conditional GET and reused when
+        the server reports it unchanged or the download fails.
+        """
+        entry = self._load_index().get(url, {})
+        cached = PDF_CACHE_DIR / f"{entry['sha256']}.pdf" if entry.get('sha256') else None
+        if cached is not None and not cached.exists():
+            cached = None
+
+        download_url = entry.get('download_url')
+        if not download_url:
             # Box.com shared links need special handling
-            if 'box.com' in url:
-                download_url = self._convert_box_link(url)
-                if not download_url:
-                    return None
-            else:
-                download_url = url
+            download_url = self._convert_box_link(url) if 'box.com' in url else url
+            if not download_url:
+                return cached
+
+        headers = {}
+        if cached is not None and not force:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
 
+        try:
             print(f"  [PDF] Downloading: {download_url[:80]}...")
-            response = requests.get(download_url, timeout=60, allow_redirects=True)
-            response.raise_for_status()
+            with get_client().get(download_url, headers=headers, timeout=(5, 60), stream=True) as response:
+                if response.status_code == 304:
+                    print(f"  [PDF] Not modified, using cached copy")
+                    return cached
+                response.raise_for_status()
+
+                # Stream to a temp file, hashing as we go
+                PDF_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_path = PDF_CACHE_DIR / f".{hashlib.md5(url.encode()).hexdigest()[:12]}.part"
+                digest = hashlib.sha256()
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=1 << 16):
+                        digest.update(chunk)
+                        f.write(chunk)
+
+                # Verify it's a PDF (not an error page or a Box interstitial)
+                # before it enters the cache
+                content_type = response.headers.get('content-type', '')
+                with open(tmp_path, 'rb') as f:
+                    magic = f.read(4)
+                if magic != b'%PDF':
+                    tmp_path.unlink()
+                    raise ValueError(f"response is not a PDF (content-type: {content_type})")
+
+                sha256 = digest.hexdigest()
+                path = PDF_CACHE_DIR / f"{sha256}.pdf"
+                tmp_path.replace(path)
+                self._update_index(url, {
+                    'download_url': download_url,
+                    'sha256': sha256,
+                    'etag': response.headers.get('etag'),
+                    'last_modified': response.headers.get('last-modified'),
+                })
+                return path
+
+        except (requests.RequestException, ValueError) as e:
+            print(f"  [PDF] Error downloading: {e}")
+            if entry.get('download_url'):
+                # Resolved links can expire; resolve again next time
+                self._update_index(url, {**entry, 'download_url': None})
+            if cached is not None:
+                print(f"  [PDF] Using cached copy")
+            return cached
 
-            # Verify it's a PDF
-            content_type = response.headers.get('content-type', '')
-            if 'pdf' not in content_type.lower() and not response.content[:4] == b'%PDF':
-                print(f"  [PDF] Warning: Response may not be PDF (content-type: {content_type})")
+    def fetch_pdf(self, url: str) -> Optional[bytes]:
+        """Download PDF from URL (handles Box.com public links).
 
-            return response.content
+        Reads the whole file into memory; fetch_pdf_file and iter_pages
+        stream it instead.
+        """
+        path = self.fetch_pdf_file(url)
+        return path.read_bytes() if path else None
+
+    def _parser_version(self) -> str:
+        """Hash of the extraction code, so cached results expire when it changes."""
+        source = inspect.getsource(sys.modules[type(self).__module__])
+        return hashlib.sha256(f"{PDF_CACHE_VERSION}|{source}".encode()).hexdigest()[:16]
+
+    def parse_url(self, url: str, force: bool = False) -> List[Dict]:
+        """Fetch a PDF and extract candidates, reusing results for unchanged PDFs."""
+        path = self.fetch_pdf_file(url, force=force)
+        if not path:
+            return []
 
-        except requests.RequestException as e:
-            print(f"  [PDF] Error downloading: {e}")
-            return None
+        results_file = PDF_CACHE_DIR / f"{path.stem}.{self._parser_version()}.json"
+        if results_file.exists() and not force:
+            with open(results_file) as f:
+                candidates = json.load(f)
+            print(f"  [PDF] {len(candidates)} candidates from cache")
+            return candidates
+
+        if pdfplumber is None:
+            print("  [PDF] pdfplumber not available")
+            return []
+        try:
+            candidates = list(self.iter_candidates(path))
+        except Exception as e:
+            # Not cached: the next call tries again
+            print(f"  [PDF] Error parsing PDF: {e}")
+            return []
+        print(f"  [PDF] Found {len(candidates)} candidates")
+        with open(results_file, 'w') as f:
+            json.dump(candidates, f)
+        return candidates
 
     def _convert_box_link(self, share_url: str) -> Optional[str]:
         """Convert Box.com share URL to direct download URL.
@@ -94,7 +353,7 @@ class PDFPlacementParser:
         """
         try:
             # First, fetch the share page to get file info
-            response = requests.get(share_url, timeout=30)
+            response = get_client().get(share_url)
             response.raise_for_status()
 
             # Look for download link pattern in the page
@@ -122,38 +381,71 @@ class PDFPlacementParser:
             print(f"  [PDF] Error converting Box link: {e}")
             return None
 
-    def parse_pdf(self, pdf_bytes: bytes) -> List[Dict]:
-        """Extract placement data from PDF."""
+    def parse_pdf(self, pdf: Union[bytes, Path]) -> List[Dict]:
+        """Extract placement data from PDF bytes or a PDF file."""
         if pdfplumber is None:
             print("  [PDF] pdfplumber not available")
             return []
 
         candidates = []
-
         try:
-            with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-                print(f"  [PDF] Processing {len(pdf.pages)} pages...")
-
-                for page_num, page in enumerate(pdf.pages):
-                    # Strategy 1: Extract tables
-                    tables = page.extract_tables()
-                    for table in tables:
-                        table_candidates = self._parse_table(table)
-                        candidates.extend(table_candidates)
-
-                    # Strategy 2: If no tables, try text extraction
-                    if not tables:
-                        text = page.extract_text()
-                        if text:
-                            text_candidates = self._parse_text(text)
-                            candidates.extend(text_candidates)
-
+            candidates = list(self.iter_candidates(pdf))
         except Exception as e:
             print(f"  [PDF] Error parsing PDF: {e}")
 
         print(f"  [PDF] Found {len(candidates)} candidates")
         return candidates
 
+    def iter_candidates(self, pdf: Union[bytes, Path]) -> Iterator[Dict]:
+        """Yield candidates as pages are extracted, holding only a few pages at once."""
+        source = pdf if isinstance(pdf, bytes) else str(pdf)
+        return self.iter_parse_pages(self._iter_extract(source))
+
+    def parse_pages(self, pages: Iterable[tuple]) -> List[Dict]:
+        """Interpret extracted (tables, text) pages in page order."""
+        return list(self.iter_parse_pages(pages))
+
+    def iter_parse_pages(self, pages: Iterable[tuple]) -> Iterator[Dict]:
+        """Interpret extracted (tables, text) pages in page order, yielding candidates.
+
+        Order matters: year headers and sections carry across pages.
+        """
+        text_state = {}
+        for tables, text in pages:
+            # Strategy 1: Extract tables
+            for table in tables:
+                yield from self._parse_table(table)
+
+            # Strategy 2: If no tables, try text extraction
+            if not tables and text:
+                yield from self._parse_text(text, text_state)
+
+    def _iter_extract(self, source: Union[bytes, str]) -> Iterator[tuple]:
+        """Yield pages in order, splitting page ranges across processes when worthwhile."""
+        count = page_count(source)
+        if self.page_workers == 1 or count < MIN_PARALLEL_PAGES:
+            yield from iter_pages(source, 0, None, self.text_first)
+            print(f"  [PDF] Processed {count} pages")
+            return
+
+        # Several small contiguous ranges per worker balance uneven page costs
+        workers = min(self.page_workers, count)
+        chunk = max(1, -(-count // (workers * 4)))
+        starts = deque(range(0, count, chunk))
+        print(f"  [PDF] Processing {count} pages on {workers} workers...")
+
+        # spawn: parse_pdf may run in a scraper thread, where forking is unsafe
+        ctx = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            # Keep at most two chunks per worker in flight so finished pages don't pile up
+            pending = deque()
+            while starts or pending:
+                while starts and len(pending) < workers * 2:
+                    start = starts.popleft()
+                    pending.append(pool.submit(_extract_pages, source, start,
+                                               start + chunk, self.text_first))
+                yield from pending.popleft().result()
+
     def _parse_table(self, table: List[List]) -> List[Dict]:
         """Parse a table extracted from PDF."""
         candidates = []
@@ -199,47 +491,58 @@ class PDFPlacementParser:
             if not self._is_tech_placement(placement):
                 continue
 
-            candidates.append({
-                'name': name,
-                'school': self.school_name,
-                'graduation_year': year or 2024,
-                'research_fields': '',
-                'initial_placement': normalize_company(placement),
-                'initial_role': '',
-                'current_placement': '',
-                'current_role': '',
-                'linkedin_url': ''
-            })
+            candidates.append(self._candidate(name, year, normalize_company(placement)))
 
         return candidates
 
-    def _parse_text(self, text: str) -> List[Dict]:
+    def _parse_text(self, text: str, state: Optional[dict] = None) -> List[Dict]:
         """Parse freeform text for placement data.
 
         UChicago PDF format: "Company field(s) Name" per line
         Example: "Amazon (3) international trade Maria Ignacia Cuevas de Saint Pierre"
+
+        A single pass classifies each line for both this format (company
+        prefix looked up in a trie) and the older "Name - Placement" format;
+        separator matches are kept for names the first format did not find.
+
+        Args:
+            text: Text of one page
+            state: Year/section state carried over from the previous page;
+                updated in place for the next one
         """
+        if state is None:
+            state = {}
         candidates = []
-        lines = text.split('\n')
-        current_year = None
-        in_private_sector = False
+        separator_lines = []  # (options, year) per "Name - Placement" line
+        current_year = state.get('year')
+        in_private_sector = state.get('private_sector', False)
+        separator_year = state.get('separator_year')
 
-        for line in lines:
+        for line in text.split('\n'):
             line = line.strip()
             if not line:
                 continue
+            year = self._extract_year(line)
+
+            # Separator format keeps its own year, from any short line with a year
+            if year and len(line) < 20:
+                separator_year = year
+            else:
+                options = self._separator_options(line)
+                if options:
+                    separator_lines.append((options, separator_year))
 
             # Check for year header (e.g., "2024 – 2025", "2023 – 2024")
-            year = self._extract_year(line)
             if year and ('–' in line or '-' in line) and len(line) < 30:
                 current_year = year
                 continue
 
             # Check for section headers
-            if 'private sector' in line.lower():
+            line_lower = line.lower()
+            if 'private sector' in line_lower:
                 in_private_sector = True
                 continue
-            elif 'academic' in line.lower() or 'post-doc' in line.lower() or 'public sector' in line.lower():
+            elif 'academic' in line_lower or 'post-doc' in line_lower or 'public sector' in line_lower:
                 in_private_sector = False
                 continue
 
@@ -248,103 +551,76 @@ class PDFPlacementParser:
                 continue
 
             # UChicago format: "Company field Name" - company at start, name at end
-            # Try to extract: tech company at start, name is the capitalized words at end
-            line_lower = line.lower()
-
-            # Check if line starts with a tech company
-            matched_company = None
-            for company in self.TECH_COMPANIES:
-                if line_lower.startswith(company):
-                    matched_company = company.title()
-                    break
-
-            if not matched_company:
+            company = _match_prefix(self._company_trie, line_lower)
+            if not company:
                 continue
 
-            # Extract name - typically the last 2-4 capitalized words
-            # Remove company name and field from start, name is what remains
-            words = line.split()
-
-            # Find where the name starts (after company and field keywords)
-            # Common fields: "international trade", "industrial organization", "macroeconomics", etc.
-            name_words = []
-            found_name_start = False
-
-            for i, word in enumerate(words):
-                # Skip if it's the company name
-                if i == 0 or (i == 1 and words[0].lower() in self.TECH_COMPANIES):
-                    continue
-                # Skip parenthetical counts like "(3)"
-                if word.startswith('(') and word.endswith(')'):
-                    continue
-                # Skip field keywords (lowercase words)
-                if word.islower() or word.lower() in ['and', 'of', 'the', 'for']:
-                    continue
-                # This looks like a name (capitalized)
-                if word and word[0].isupper():
-                    found_name_start = True
-                if found_name_start:
-                    name_words.append(word)
-
-            name = ' '.join(name_words)
+            name = self._name_after_company(line.split())
             if len(name) < 3 or len(name) > 100:
                 continue
+            candidates.append(self._candidate(name, current_year, company.title()))
+
+        state['year'] = current_year
+        state['private_sector'] = in_private_sector
+        state['separator_year'] = separator_year
+
+        # Separator-format matches fill in names not already found on this page
+        seen = {c['name'] for c in candidates}
+        for options, year in separator_lines:
+            for name, placement in options:
+                if name not in seen:
+                    seen.add(name)
+                    candidates.append(self._candidate(name, year, normalize_company(placement)))
+                    break
 
-            candidates.append({
-                'name': name,
-                'school': self.school_name,
-                'graduation_year': current_year or 2024,
-                'research_fields': '',
-                'initial_placement': matched_company,
-                'initial_role': '',
-                'current_placement': '',
-                'current_role': '',
-                'linkedin_url': ''
-            })
-
-        # Also try the original separator-based parsing as fallback
-        current_year = None
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        return candidates
 
-            year = self._extract_year(line)
-            if year and len(line) < 20:
-                current_year = year
+    def _separator_options(self, line: str) -> List[tuple]:
+        """(name, placement) splits of a "Name - Placement" line that look like tech placements."""
+        options = []
+        for sep in [' - ', ': ', ' – ', ' — ']:
+            if sep in line:
+                name, placement = (part.strip() for part in line.split(sep, 1))
+                if 3 <= len(name) <= 100 and self._is_tech_placement(placement):
+                    options.append((name, placement))
+        return options
+
+    def _name_after_company(self, words: List[str]) -> str:
+        """Extract the name: the capitalized words after the company and field keywords."""
+        name_words = []
+        found_name_start = False
+
+        for i, word in enumerate(words):
+            # Skip if it's the company name
+            if i == 0 or (i == 1 and words[0].lower() in self.TECH_COMPANIES):
                 continue
-
-            for sep in [' - ', ': ', ' – ', ' — ']:
-                if sep in line:
-                    parts = line.split(sep, 1)
-                    if len(parts) >= 2:
-                        name = parts[0].strip()
-                        placement = parts[1].strip()
-
-                        if len(name) < 3 or len(name) > 100:
-                            continue
-
-                        if not self._is_tech_placement(placement):
-                            continue
-
-                        # Avoid duplicates
-                        if any(c['name'] == name for c in candidates):
-                            continue
-
-                        candidates.append({
-                            'name': name,
-                            'school': self.school_name,
-                            'graduation_year': current_year or 2024,
-                            'research_fields': '',
-                            'initial_placement': normalize_company(placement),
-                            'initial_role': '',
-                            'current_placement': '',
-                            'current_role': '',
-                            'linkedin_url': ''
-                        })
-                        break
-
-        return candidates
+            # Skip parenthetical counts like "(3)"
+            if word.startswith('(') and word.endswith(')'):
+                continue
+            # Skip field keywords (lowercase words)
+            if word.islower() or word.lower() in ['and', 'of', 'the', 'for']:
+                continue
+            # This looks like a name (capitalized)
+            if word and word[0].isupper():
+                found_name_start = True
+            if found_name_start:
+                name_words.append(word)
+
+        return ' '.join(name_words)
+
+    def _candidate(self, name: str, year: Optional[int], placement: str) -> Dict:
+        """Build a candidate record in the scraper's schema."""
+        return {
+            'name': name,
+            'school': self.school_name,
+            'graduation_year': year or 2024,
+            'research_fields': '',
+            'initial_placement': placement,
+            'initial_role': '',
+            'current_placement': '',
+            'current_role': '',
+            'linkedin_url': ''
+        }
 
     def _find_column(self, header: List[str], keywords: List[str]) -> Optional[int]:
         """Find column index matching any of the keywords."""
@@ -383,22 +659,29 @@ class UChicagoPDFParser(PDFPlacementParser):
     # UChicago Box.com PDF URL
     PDF_URL = "https://uchicago.app.box.com/s/14o5hl9hoyuapm30xvzi48qi74oetu9c"
 
-    def __init__(self):
-        super().__init__('University of Chicago')
+    def __init__(self, page_workers: int = 1):
+        super().__init__('University of Chicago', page_workers=page_workers)
 
     def parse(self) -> List[Dict]:
         """Fetch and parse UChicago placement PDF."""
-        pdf_bytes = self.fetch_pdf(self.PDF_URL)
-        if not pdf_bytes:
-            return []
-        return self.parse_pdf(pdf_bytes)
+        return self.parse_url(self.PDF_URL)
 
 
 def main():
     """Test PDF parsing."""
+    import argparse
+    import time
+    parser = argparse.ArgumentParser(description='Test PDF placement parsing')
+    parser.add_argument('--file', help='Parse a local PDF instead of the UChicago source')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Processes for page extraction (0 = all cores, default: 1)')
+    args = parser.parse_args()
+
     print("Testing UChicago PDF Parser...")
-    parser = UChicagoPDFParser()
-    candidates = parser.parse()
+    pdf_parser = UChicagoPDFParser(page_workers=args.jobs)
+    start = time.perf_counter()
+    candidates = pdf_parser.parse_pdf(Path(args.file)) if args.file else pdf_parser.parse()
+    print(f"Parsed in {time.perf_counter() - start:.1f}s")
 
     print(f"\nFound {len(candidates)} tech placement candidates:")
     for c in candidates[:10]:
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Pipeline orchestrator for econ-grads.
+
+Runs the README pipeline as a DAG of stages:
+
+    scrape → cleanup → enrich → compensation → scoring
+                                             → network
+                                             → charts
+                                             → hiring_charts
+
+Each stage declares its input and output files. Dependencies follow from
+them: a stage depends on the latest earlier stage that writes one of its
+inputs. A stage is skipped when its inputs and code hash the same as at
+its last successful run (recorded in data/cache/pipeline_state.json) and
+its outputs are as it left them. Frames written by a stage are handed to
+downstream stages in memory instead of being re-read from CSV, and stages
+whose dependencies are done run concurrently in worker processes.
+
+Stages that call external services (scrape, enrich, compensation) always
+run when enabled, and are only enabled with --online.
+
+Usage:
+    python pipeline.py                   # offline stages, skipping unchanged ones
+    python pipeline.py --online          # full refresh including scraping/enrichment
+    python pipeline.py charts scoring    # only the named stages
+"""
+import contextlib
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import pandas as pd
+
+from features import file_hash
+
+# Every path is anchored here, so the pipeline runs the same from any directory
+ROOT = Path(__file__).parent
+STATE_PATH = ROOT / 'data' / 'cache' / 'pipeline_state.json'
+CHARTS_DIR = ROOT / 'charts'
+
+CANDIDATES = str(ROOT / 'data' / 'candidates.csv')
+ENRICHED = str(ROOT / 'data' / 'candidates_enriched.csv')
+COMPANY_STATS = str(ROOT / 'data' / 'company_stats.csv')
+CENTRALITY = str(ROOT / 'data' / 'network_centrality.csv')
+H1B = str(ROOT / 'data' / 'h1b_lca.csv')
+
+
+# =============================================================================
+# Stages
+# =============================================================================
+# Each run function takes {input path: DataFrame or None} for inputs produced
+# by another stage, writes its outputs, and returns {output path: DataFrame}
+# for frames downstream stages may reuse.
+
+def _require(frames: dict, path: str) -> pd.DataFrame:
+    """Return an input frame, or fail the stage if the file does not exist."""
+    if frames.get(path) is None:
+        raise FileNotFoundError(f"{path} not found")
+    return frames[path]
+
+
+def run_scrape(frames: dict) -> dict:
+    """Scrape all schools (incremental per page) into candidates.csv."""
+    from scraper import EconPhDScraper, print_summary
+    scraper = EconPhDScraper()
+    df = scraper.scrape_all()
+    print_summary(df)
+    if df.empty:
+        return {}
+    scraper.save(df, CANDIDATES)
+    return {CANDIDATES: df}
+
+
+def run_cleanup(frames: dict) -> dict:
+    """Clean base and enriched candidates in place."""
+    from cleanup import cleanup_frame, print_data_quality_report
+    cleaned = {}
+    for path in (CANDIDATES, ENRICHED):
+        if frames.get(path) is None:
+            continue
+        print(f"Cleaning {path}...")
+        df = cleanup_frame(frames[path])
+        df.to_csv(path, index=False)
+        print(f"Saved cleaned data to {path} ({len(df)} rows)\n")
+        cleaned[path] = df
+    print_data_quality_report(_require(cleaned, CANDIDATES))
+    return cleaned
+
+
+def run_enrich(frames: dict) -> dict:
+    """Enrich candidates not yet enriched via Perplexity (and Scholar if installed)."""
+    from enricher import PERPLEXITY_API_KEY, enrich_frame, get_scholarly
+    if not PERPLEXITY_API_KEY:
+        raise RuntimeError("PERPLEXITY_API_KEY not set")
+    df = frames.get(ENRICHED)
+    if df is None:
+        df = _require(frames, CANDIDATES)
+    df = enrich_frame(df, ENRICHED, include_scholar=get_scholarly() is not None)
+    df.to_csv(ENRICHED, index=False)
+    return {ENRICHED: df}
+
+
+def run_compensation(frames: dict) -> dict:
+    """Add H1B / Levels.fyi compensation columns to enriched candidates."""
+    from compensation import CompensationEnricher, add_compensation, print_salary_summary
+    df = add_compensation(_require(frames, ENRICHED), CompensationEnricher(h1b_file=H1B))
+    df.to_csv(ENRICHED, index=False)
+    print(f"Saved to {ENRICHED}")
+    print_salary_summary(df)
+    return {ENRICHED: df}
+
+
+def run_scoring(frames: dict) -> dict:
+    """Compute company hiring statistics."""
+    from scoring import compute_company_stats, normalize_companies, print_stats
+    stats_df = compute_company_stats(normalize_companies(_require(frames, ENRICHED)))
+    stats_df.to_csv(COMPANY_STATS, index=False)
+    print(f"Saved stats to {COMPANY_STATS}")
+    print_stats(stats_df)
+    return {COMPANY_STATS: stats_df}
+
+
+def run_network(frames: dict) -> dict:
+    """Career network analysis and centrality scores."""
+    from network import run_network_analysis
+    run_network_analysis(_require(frames, ENRICHED), output_path=CENTRALITY)
+    return {}
+
+
+def run_charts(frames: dict) -> dict:
+    """Render the main chart set (unchanged charts are skipped by charts.py itself)."""
+    import matplotlib
+    import charts
+    from features import ensure_features
+    charts.CHARTS_DIR.mkdir(exist_ok=True)
+    df = ensure_features(charts.filter_tech(_require(frames, ENRICHED)))
+    # Keep the dark theme from leaking into other stages sharing this process
+    with matplotlib.rc_context():
+        charts.setup_dark_theme()
+        charts.render_charts(df)
+    return {}
+
+
+def run_hiring_charts(frames: dict) -> dict:
+    """Render hiring pattern charts."""
+    from hiring_charts import create_all_charts
+    create_all_charts(_require(frames, ENRICHED), str(CHARTS_DIR))
+    return {}
+
+
+def pipeline_stages() -> dict:
+    """The README pipeline as a stage table, in dependency order.
+
+    Keys per stage: inputs, outputs (file paths), code (source files or
+    packages that affect the result), run, and online.
+    """
+    from charts import CHART_SECTIONS
+    chart_files = [str(CHARTS_DIR / func.output) for _, funcs in CHART_SECTIONS for func in funcs]
+
+    def code(*names):
+        return [str(ROOT / name) for name in names]
+
+    return {
+        'scrape': {
+            'inputs': [], 'outputs': [CANDIDATES],
+            'code': code('scraper.py', 'parsers', 'pdf_parser.py', 'normalize.py'),
+            'run': run_scrape, 'online': True,
+        },
+        'cleanup': {
+            'inputs': [CANDIDATES, ENRICHED], 'outputs': [CANDIDATES, ENRICHED],
+            'code': code('cleanup.py', 'normalize.py'),
+            'run': run_cleanup,
+        },
+        'enrich': {
+            'inputs': [CANDIDATES, ENRICHED], 'outputs': [ENRICHED],
+            'code': code('enricher.py', 'normalize.py'),
+            'run': run_enrich, 'online': True,
+        },
+        'compensation': {
+            'inputs': [ENRICHED, H1B], 'outputs': [ENRICHED],
+            'code': code('compensation.py'),
+            'run': run_compensation, 'online': True,
+        },
+        'scoring': {
+            'inputs': [ENRICHED], 'outputs': [COMPANY_STATS],
+            'code': code('scoring.py', 'normalize.py'),
+            'run': run_scoring,
+        },
+        'network': {
+            'inputs': [ENRICHED], 'outputs': [CENTRALITY],
+            'code': code('network.py', 'normalize.py'),
+            'run': run_network,
+        },
+        'charts': {
+            'inputs': [ENRICHED], 'outputs': chart_files,
+            'code': code('charts.py', 'features.py', 'work_tags.py'),
+            'run': run_charts,
+        },
+        'hiring_charts': {
+            'inputs': [ENRICHED],
+            'outputs': [str(CHARTS_DIR / name) for name in
+                        ('hiring_trends.png', 'school_company_flow.html', 'field_distribution.png')],
+            'code': code('hiring_charts.py'),
+            'run': run_hiring_charts,
+        },
+    }
+
+
+# =============================================================================
+# Orchestration
+# =============================================================================
+
+def stage_dependencies(stages: dict) -> dict:
+    """Map each stage to the stages it depends on.
+
+    A stage depends on the latest earlier stage writing each of its inputs,
+    and on the latest earlier stage writing each of its outputs (so
+    in-place updates of a file happen in table order).
+    """
+    deps = {}
+    writers = {}
+    for name, stage in stages.items():
+        deps[name] = sorted({writers[path] for path in stage['inputs'] + stage['outputs'] if path in writers})
+        for path in stage['outputs']:
+            writers[path] = name
+    return deps
+
+
+def _hash_path(path) -> str:
+    """Content hash of a file or of every .py file under a directory."""
+    path = Path(path)
+    if path.is_dir():
+        digest = hashlib.sha256()
+        for child in sorted(path.rglob('*.py')):
+            digest.update(f"{child.relative_to(path)}|{file_hash(child)}".encode())
+        return digest.hexdigest()
+    return file_hash(path) if path.exists() else 'missing'
+
+
+def stage_fingerprint(stage: dict) -> str:
+    """Hash a stage's input files and code."""
+    digest = hashlib.sha256()
+    for path in stage['inputs'] + stage.get('code', []):
+        digest.update(f"{path}|{_hash_path(path)}\n".encode())
+    return digest.hexdigest()
+
+
+def _is_current(stage: dict, entry: dict) -> bool:
+    """True if the stage last ran on the same inputs and its outputs are untouched.
+
+    Outputs a stage did not write (e.g. a chart without data) were recorded
+    as 'missing' and still match while absent.
+    """
+    if not entry or entry.get('fingerprint') != stage_fingerprint(stage):
+        return False
+    return all(entry['outputs'].get(path) == _hash_path(path) for path in stage['outputs'])
+
+
+def _load_state(state_path: Path) -> dict:
+    """Load recorded stage fingerprints."""
+    if state_path.exists():
+        try:
+            with open(state_path) as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            pass
+    return {}
+
+
+def _save_state(state: dict, state_path: Path):
+    """Save recorded stage fingerprints."""
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(state_path, 'w') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+
+
+def _execute(run, frames: dict) -> tuple:
+    """Run a stage with its output captured.
+
+    Returns:
+        Tuple of (captured output, produced frames or None on error, elapsed seconds)
+    """
+    buf = io.StringIO()
+    start = time.perf_counter()
+    produced = None
+    with contextlib.redirect_stdout(buf):
+        try:
+            produced = run(frames) or {}
+        except Exception:
+            traceback.print_exc(file=buf)
+    return buf.getvalue(), produced, time.perf_counter() - start
+
+
+def run_pipeline(stages: dict, jobs: int = 1, force: bool = False, online: bool = False,
+                 only: list = None, state_path: Path = STATE_PATH) -> dict:
+    """Run stages in dependency order, skipping those whose inputs are unchanged.
+
+    Args:
+        stages: Stage table (see pipeline_stages)
+        jobs: Worker processes for independent stages; 1 runs in-process, 0 uses all cores
+        force: Run every enabled stage regardless of recorded fingerprints
+        online: Enable stages that call external services
+        only: If given, run only these stages (others count as done)
+        state_path: Where stage fingerprints are recorded
+
+    Returns:
+        Dict of stage name -> (status, seconds), status one of
+        'ran', 'unchanged', 'skipped', 'failed' or 'blocked'
+    """
+    jobs = jobs or os.cpu_count() or 1
+    state = _load_state(state_path)
+    deps = stage_dependencies(stages)
+    produced_by = {path for stage in stages.values() for path in stage['outputs']}
+
+    results = {}
+    frames = {}  # path -> latest frame written this run
+    pending = list(stages)
+    running = {}
+
+    def input_frames(stage):
+        loaded = {}
+        for path in stage['inputs']:
+            if path not in produced_by:
+                continue  # source file, only fingerprinted
+            if path not in frames and Path(path).exists():
+                frames[path] = pd.read_csv(path)
+            frame = frames.get(path)
+            loaded[path] = frame.copy() if frame is not None else None
+        return loaded
+
+    def finish(name, output, produced, elapsed):
+        stage = stages[name]
+        print(f"\n{'='*50}\n{name}\n{'='*50}")
+        print(output, end="")
+        if produced is None:
+            print(f"FAILED after {elapsed:.1f}s")
+            results[name] = ('failed', elapsed)
+            return
+        frames.update({path: df for path, df in produced.items() if path in stage['outputs']})
+        # Fingerprint after the run so in-place outputs count as the next run's inputs
+        state[name] = {
+            'fingerprint': stage_fingerprint(stage),
+            'outputs': {path: _hash_path(path) for path in stage['outputs']},
+        }
+        _save_state(state, state_path)
+        results[name] = ('ran', elapsed)
+
+    executor = None
+    if jobs > 1:
+        start_method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+        executor = ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context(start_method))
+
+    try:
+        while pending or running:
+            for name in list(pending):
+                upstream = [results.get(dep, (None,))[0] for dep in deps[name]]
+                if any(status in ('failed', 'blocked') for status in upstream):
+                    pending.remove(name)
+                    results[name] = ('blocked', 0.0)
+                    print(f"{name}: blocked by failed upstream stage")
+                    continue
+                if None in upstream:
+                    continue
+
+                pending.remove(name)
+                stage = stages[name]
+                if (only and name not in only) or (stage.get('online') and not online):
+                    results[name] = ('skipped', 0.0)
+                    continue
+                if not force and not stage.get('online') and _is_current(stage, state.get(name)):
+                    results[name] = ('unchanged', 0.0)
+                    print(f"{name}: unchanged, skipped")
+                    continue
+
+                if executor is None:
+                    finish(name, *_execute(stage['run'], input_frames(stage)))
+                else:
+                    running[executor.submit(_execute, stage['run'], input_frames(stage))] = name
+
+            if running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finish(running.pop(future), *future.result())
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return results
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Run the econ-grads pipeline')
+    parser.add_argument('stages', nargs='*', help='Only run these stages (default: all)')
+    parser.add_argument('--online', action='store_true',
+                        help='Enable stages that call external services (scrape, enrich, compensation)')
+    parser.add_argument('--force', '-f', action='store_true',
+                        help='Run enabled stages even if their inputs are unchanged')
+    parser.add_argument('--jobs', '-j', type=int, default=0,
+                        help='Worker processes for independent stages (0 = all cores, default: 0)')
+    args = parser.parse_args()
+
+    stages = pipeline_stages()
+    unknown = set(args.stages) - set(stages)
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(sorted(unknown))} (choose from {', '.join(stages)})")
+
+    results = run_pipeline(stages, jobs=args.jobs, force=args.force, online=args.online,
+                           only=args.stages or None)
+
+    print(f"\n{'='*50}")
+    print("PIPELINE SUMMARY")
+    print(f"{'='*50}")
+    for name, (status, elapsed) in results.items():
+        timing = f"{elapsed:6.1f}s" if status in ('ran', 'failed') else ''
+        print(f"  {name:<15} {status:<10} {timing}")
+
+    if any(status == 'failed' for status, _ in results.values()):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -93,6 +93,15 @@ def print_stats(stats_df: pd.DataFrame, top_n: int = 20):
     print("=" * 75)
 
 
+def normalize_companies(df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize initial and current company names (modifies df in place)."""
+    if 'initial_placement' in df.columns:
+        df['initial_placement'] = df['initial_placement'].apply(normalize_company)
+    if 'current_company' in df.columns:
+        df['current_company'] = df['current_company'].apply(standardize_current_placement)
+    return df
+
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(description='Company hiring statistics')
@@ -114,14 +123,8 @@ def main():
     df = pd.read_csv(input_path)
     print(f"Found {len(df)} candidates")
 
-    # Normalize company names
-    if 'initial_placement' in df.columns:
-        df['initial_placement'] = df['initial_placement'].apply(normalize_company)
-    if 'current_company' in df.columns:
-        df['current_company'] = df['current_company'].apply(standardize_current_placement)
-
     # Compute stats
-    stats_df = compute_company_stats(df)
+    stats_df = compute_company_stats(normalize_companies(df))
 
     if stats_df.empty:
         print("No companies found.")
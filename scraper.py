@@ -4,26 +4,31 @@ Economics PhD → Tech Industry Placement Scraper
 Scrapes placement data from top 20 econ PhD programs (2020-2025)
 """
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, Tag
 import time
 import re
 import hashlib
+import inspect
 import json
+import os
 import argparse
+import codecs
+import functools
 import shutil
-from datetime import datetime
+import sys
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from urllib.parse import urlparse
+from typing import TYPE_CHECKING, List, Dict, Optional, Union
 
-# Selenium imports for JS-heavy sites
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+# pandas and Selenium are imported where they are used: most runs are
+# incremental and never start a browser, and only scrape_all builds a frame.
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Import custom parsers
 try:
@@ -32,159 +37,317 @@ except ImportError:
     CUSTOM_PARSERS = {}
 
 # Import normalization
+from http_client import TIMEOUT, HttpClient
+from tracing import Tracer, print_report
 from normalize import is_academia, normalize_company
+from css_select import compile_selector, select_one
 
 # Paths for state tracking and caching
 SCRAPE_STATE_FILE = 'data/scrape_state.json'
 RAW_HTML_DIR = 'data/raw'
+PARSE_CACHE_DIR = 'data/cache/parsed'
+
+# State sections keyed by URL / school / host; _save_state merges them entry by entry
+MERGED_STATE_KEYS = ('pages', 'schools', 'hosts')
+
+# PDF sources download and parse in the background while HTML is fetched
+PDF_WORKERS = 2
+# Processes per PDF for page extraction (0 = all cores; small PDFs stay serial)
+PDF_PAGE_WORKERS = 0
+
+# Bump when parse results change for reasons not visible in parser source
+# (parser versions otherwise hash the parser modules and generic strategies)
+PARSE_CACHE_VERSION = 1
+
+# Generic strategies (EconPhDScraper._parse_<name>), run in order when a
+# school has no custom parser or it finds nothing
+GENERIC_STRATEGIES = ['tables', 'cards', 'year_lists']
+
+# A page's remembered strategies (those that produced candidates last time)
+# run alone; yielding under this share of last time's count is treated as a
+# layout change and triggers the exhaustive pass
+LAYOUT_CHANGE_RATIO = 0.5
+
+# School registry: name -> {'urls': [...], optional 'pdfs': [...],
+# 'parser': CUSTOM_PARSERS key, 'wait_for': CSS selector Selenium waits for,
+# 'refresh_days': skip refetching pages fetched more recently than this}
+SCHOOLS_FILE = Path(__file__).with_name('schools.json')
+SCHOOL_KEYS = {'urls', 'pdfs', 'parser', 'wait_for', 'refresh_days'}
+
+# Adaptive recrawl (see page_refresh_days): a page is refetched after
+# REFRESH_FRACTION of its estimated time between changes, within these bounds.
+# Changes in the last CHANGE_WINDOW_DAYS set the rate while there are any
+# (job market season); otherwise the page's long-run rate does.
+REFRESH_FRACTION = 0.5
+MIN_REFRESH_DAYS = 1
+MAX_REFRESH_DAYS = 90
+CHANGE_WINDOW_DAYS = 60
+MAX_CHANGES_KEPT = 50
+
+# Circuit breaker (state['hosts']): after BREAKER_FAILURES network failures
+# in a row a host is skipped for BREAKER_COOLDOWN_MINUTES, doubled each time
+# it trips again; pages on it keep their previous parse results meanwhile
+BREAKER_FAILURES = 3
+BREAKER_COOLDOWN_MINUTES = 60
+BREAKER_MAX_COOLDOWN_MINUTES = 7 * 24 * 60
+MAX_HOST_HISTORY = 20
+# Responses that can be a bot check a real browser passes
+SELENIUM_STATUSES = {401, 403}
+
+# Per-host request pacing (see HostLimiter): a host starts at one request in
+# flight, REQUEST_INTERVAL seconds apart; its limit grows by AIMD_INCREASE per
+# healthy response and is cut by AIMD_DECREASE on a 429, 5xx, network error or
+# a response LATENCY_SPIKE_RATIO times slower than its average. Requests start
+# REQUEST_INTERVAL / limit apart.
+REQUEST_INTERVAL = 1.0
+AIMD_INCREASE = 0.25
+AIMD_DECREASE = 0.5
+AIMD_MIN_LIMIT = 0.125  # one request per 8s
+AIMD_MAX_LIMIT = 8
+LATENCY_SPIKE_RATIO = 3
+LATENCY_WEIGHT = 0.3  # weight of the latest response in a host's average latency
+MAX_RETRY_AFTER = 120  # longer Retry-After waits are left to the circuit breaker
+FETCH_WORKERS = 4  # a school's pages fetched concurrently, within host limits
+# Page requests retry a dropped connection once; error statuses go to HostLimiter
+FETCH_RETRY = Retry(total=1, connect=1, read=1, status=0, backoff_factor=0.5)
+
+# Scheduling (see EconPhDScraper.schedule): schools run longest-first by their
+# recorded duration, an average weighting the latest run by TIMING_WEIGHT;
+# schools without history are estimated at DEFAULT_SCHOOL_SECONDS
+TIMING_WEIGHT = 0.5
+DEFAULT_SCHOOL_SECONDS = 30
+
+# Sharded runs (--shard i/n) write their candidates and scrape state here;
+# --merge combines the shard outputs
+SHARD_DIR = 'data/shards'
+
+# scrape_all appends each finished school's candidates here (see CandidateSink)
+CANDIDATE_SINK = 'data/candidates.jsonl'
+
+
+def load_schools(path=SCHOOLS_FILE) -> Dict[str, dict]:
+    """Load and check the school registry."""
+    with open(path) as f:
+        schools = json.load(f)
+    for school, config in schools.items():
+        unknown = set(config) - SCHOOL_KEYS
+        if unknown:
+            raise ValueError(f"{path}: {school} has unknown keys {sorted(unknown)}")
+        if not config.get('urls') and not config.get('pdfs'):
+            raise ValueError(f"{path}: {school} has no urls or pdfs")
+        config.setdefault('urls', [])
+    return schools
+
+
+SCHOOLS = load_schools()
+
+
+def parse_shard(value: str) -> tuple:
+    """Parse an 'i/n' shard spec (1 <= i <= n)."""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"shard must look like 2/4, got {value!r}")
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard index must be between 1 and {count}")
+    return index, count
+
+
+def parse_duration(value: str) -> float:
+    """Parse '90s', '45m', '2h' (or plain minutes) into seconds."""
+    units = {'s': 1, 'm': 60, 'h': 3600}
+    try:
+        seconds = float(value[:-1]) * units[value[-1]] if value[-1:] in units else float(value) * 60
+    except ValueError:
+        seconds = 0
+    if seconds <= 0:
+        raise argparse.ArgumentTypeError(f"expected a duration like 90s, 45m or 2h, got {value!r}")
+    return seconds
+
+
+def select_schools(schools: Dict[str, dict], names: Optional[List[str]] = None,
+                   shard: Optional[tuple] = None) -> Dict[str, dict]:
+    """The named schools (default all), then shard i of n of them.
+
+    Shards are dealt round-robin in order of a hash of the school name, so
+    every machine computes the same slices, the slices differ in size by at
+    most one school, and the order in the registry file doesn't matter.
+    """
+    if names:
+        unknown = [name for name in names if name not in schools]
+        if unknown:
+            raise KeyError(f"Unknown schools: {', '.join(unknown)}")
+        schools = {name: schools[name] for name in names}
+    if shard:
+        index, count = shard
+        ordered = sorted(schools, key=lambda name: hashlib.sha1(name.encode()).hexdigest())
+        mine = set(ordered[index - 1::count])
+        schools = {name: config for name, config in schools.items() if name in mine}
+    return schools
+
+
+def shard_paths(shard: tuple) -> tuple:
+    """(candidates CSV, scrape state file) of a shard."""
+    index, count = shard
+    return (f"{SHARD_DIR}/candidates-{index}-of-{count}.csv",
+            f"{SHARD_DIR}/scrape_state-{index}-of-{count}.json")
+
+
+def merge_shards(shard_dir: str = SHARD_DIR) -> 'pd.DataFrame':
+    """Combine the candidates of every shard of a sharded run.
+
+    Raises:
+        FileNotFoundError: if no shard outputs exist or some are missing
+    """
+    import pandas as pd
+
+    shards = {}
+    for path in Path(shard_dir).glob('candidates-*-of-*.csv'):
+        match = re.fullmatch(r'candidates-(\d+)-of-(\d+)\.csv', path.name)
+        if match:
+            shards.setdefault(int(match.group(2)), {})[int(match.group(1))] = path
+    if not shards:
+        raise FileNotFoundError(f"No shard outputs in {shard_dir}")
+    # Several shard counts on disk: use the most recently written run
+    count = max(shards, key=lambda n: max(p.stat().st_mtime for p in shards[n].values()))
+    missing = sorted(set(range(1, count + 1)) - set(shards[count]))
+    if missing:
+        raise FileNotFoundError(f"Missing shard(s) {', '.join(map(str, missing))} of {count} in {shard_dir}")
+    frames = [pd.read_csv(shards[count][index]) for index in range(1, count + 1)]
+    df = pd.concat(frames, ignore_index=True)
+    if not df.empty:
+        df = df.drop_duplicates(subset=['name', 'school'])
+    print(f"Merged {count} shards: {len(df)} candidates")
+    return df
+
+
+def page_refresh_days(page: dict, now: Optional[datetime] = None) -> float:
+    """Days after its last fetch a page is due again, from its change history."""
+    if not page.get('first_checked'):
+        return MIN_REFRESH_DAYS
+    now = now or datetime.now()
+    span = (now - datetime.fromisoformat(page['first_checked'])).total_seconds() / 86400
+    changes = [datetime.fromisoformat(t) for t in page.get('changes', [])]
+    recent = [t for t in changes if (now - t).days < CHANGE_WINDOW_DAYS]
+    if recent:
+        interval = min(span, CHANGE_WINDOW_DAYS) / len(recent)
+    else:
+        # Half a change assumed, so an unchanged page backs off gradually
+        interval = span / (len(changes) + 0.5)
+    return min(max(interval * REFRESH_FRACTION, MIN_REFRESH_DAYS), MAX_REFRESH_DAYS)
+
+
+def custom_parser(school: str):
+    """The school's custom parser (its 'parser' key in the registry), or None."""
+    key = SCHOOLS.get(school, {}).get('parser', school)
+    return CUSTOM_PARSERS[key] if key in CUSTOM_PARSERS else None
+
+
+# Non-content regions dropped before the soup is built (see build_soup).
+# Headers/footers inside articles and sections hold card titles, and
+# ASP.NET-style forms wrap whole pages, so those are kept.
+PRUNE_XPATH = ' | '.join([
+    '//script', '//style', '//nav', '//*[@role="navigation"]',
+    '//*[@role="banner" or @role="contentinfo"]',
+    '//header[not(ancestor::article or ancestor::section or ancestor::main)]',
+    '//footer[not(ancestor::article or ancestor::section or ancestor::main)]',
+    '//form[not(.//table or .//h2 or .//h3 or .//h4 or .//article)]',
+])
+
+META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+
+def page_encoding(content: bytes, content_type: str = '') -> str:
+    """Declared charset (Content-Type header, then <meta>), else UTF-8 or Windows-1252.
+
+    Cheap compared to statistical detection (requests' response.text
+    runs charset_normalizer when the header has no charset).
+    """
+    declared = re.search(r'charset=["\']?([\w-]+)', content_type or '', re.IGNORECASE)
+    if declared:
+        declared = declared.group(1)
+    else:
+        meta = META_CHARSET.search(content[:4096])
+        declared = meta.group(1).decode('ascii') if meta else None
+    if declared:
+        try:
+            return codecs.lookup(declared).name
+        except LookupError:
+            pass
+    try:
+        content.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'windows-1252'
+
+
+def build_soup(content: bytes, content_type: str = '') -> BeautifulSoup:
+    """Parse raw page bytes, pruning PRUNE_XPATH regions before building the soup.
+
+    lxml parses and prunes in C, so BeautifulSoup's (much slower) tree
+    building and every parse strategy only see the content regions.
+    """
+    import lxml.etree
+    import lxml.html
+
+    encoding = page_encoding(content, content_type)
+    try:
+        doc = lxml.html.document_fromstring(content, parser=lxml.html.HTMLParser(encoding=encoding))
+    except (lxml.etree.ParserError, ValueError):
+        return BeautifulSoup(content, 'lxml', from_encoding=encoding)
+    for el in doc.xpath(PRUNE_XPATH):
+        el.drop_tree()  # keeps the element's tail text
+    html = lxml.etree.tostring(doc.getroottree(), encoding='utf-8')
+    return BeautifulSoup(html, 'lxml', from_encoding='utf-8')
+
+
+# Generic card selectors, in priority order (see EconPhDScraper._parse_cards)
+CARD_SELECTORS = [
+    # Standard CMS selectors
+    '.views-row', '.node', 'article', '.person', '.candidate',
+    '.faculty-member', '.profile', '.person-teaser', '.cu-person',
+    # Stanford (Drupal with HB cards)
+    '.hb-card', '.hb-card--horizontal',
+    # MIT (figure/figcaption structure)
+    'figure.caption', 'figure[role="group"]',
+    # Additional common patterns
+    '.profile-card', '.student-profile', '.graduate-profile',
+    '.component_item', '.person-grid-item', '.faculty-grid-item',
+    '.student-card', '.job-candidate',
+    # Drupal-specific
+    '.view-content > div', '.field-collection-item',
+    # Generic attribute selectors
+    'div[class*="person"]', 'div[class*="candidate"]', 'div[class*="profile"]',
+    # List items with rich content
+    'li.person', 'li.candidate',
+]
+CARD_NAME_SELECTOR = (
+    'h2 a, h3 a, h4 a, h2, h3, h4, .title a, .name a, .title, .name, '
+    'figcaption a, .hb-card__title a, .hb-card__title, '
+    '.field--name-title a, .component_title_link'
+)
+CARD_PLACEMENT_SELECTOR = (
+    '.placement, .position, .field--name-field-placement, '
+    '.field--name-field-initial-placement, .employer, .company, '
+    '.hb-card__subtitle, .job-placement'
+)
+CARD_FIELDS_SELECTOR = (
+    '.field--name-field-research-areas, .research, .interests, '
+    '.research-interests, .fields, .specialization, '
+    '.field--name-field-research-interests'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _card_patterns() -> tuple:
+    """Compiled card selectors: (per-selector predicates, name, placement, fields)."""
+    return (
+        [compile_selector(selector) for selector in CARD_SELECTORS],
+        compile_selector(CARD_NAME_SELECTOR),
+        compile_selector(CARD_PLACEMENT_SELECTOR),
+        compile_selector(CARD_FIELDS_SELECTOR),
+    )
 
-# School configurations
-SCHOOLS = {
-    'MIT': {
-        'urls': [
-            'https://economics.mit.edu/academic-programs/phd-program/job-market',
-            'https://economics.mit.edu/sites/default/files/inline-files/Placement_Results_2024_website.pdf',
-        ]
-    },
-    'Harvard': {
-        'urls': [
-            'https://www.economics.harvard.edu/placement',
-            'https://www.economics.harvard.edu/job-market-candidates'
-        ]
-    },
-    'Stanford': {
-        'urls': [
-            'https://economics.stanford.edu/graduate/job-market-candidates',
-            'https://economics.stanford.edu/graduate/student-placement',
-            'https://economics.stanford.edu/people/phd-alumni',
-        ]
-    },
-    'Princeton': {
-        'urls': [
-            'https://economics.princeton.edu/graduate-program/job-market-and-placements/',
-            'https://economics.princeton.edu/graduate-program/job-market-and-placements/statistics-on-past-placements/',
-        ]
-    },
-    'UC Berkeley': {
-        'urls': [
-            'https://econ.berkeley.edu/graduate/professional-placement',
-            'https://www.econ.berkeley.edu/grad/program/placement-outcomes',
-            'https://haas.berkeley.edu/phd/careers/job-placements/',
-        ]
-    },
-    'Yale': {
-        'urls': [
-            'https://economics.yale.edu/phd-program/placement',
-            'https://economics.yale.edu/phd-program/placement/outcomes'
-        ]
-    },
-    'University of Chicago': {
-        'urls': [
-            'https://economics.uchicago.edu/phd-program/career-placement',
-        ]
-    },
-    'Northwestern': {
-        'urls': [
-            'https://economics.northwestern.edu/graduate/prospective/placement.html',
-        ]
-    },
-    'Columbia': {
-        'urls': [
-            'https://econ.columbia.edu/phd/job-market-candidates/',
-            'https://econ.columbia.edu/phd/placement/'
-        ]
-    },
-    'NYU': {
-        'urls': [
-            'https://as.nyu.edu/departments/econ/job-market.html',
-            'https://as.nyu.edu/departments/econ/job-market/placements.html',
-            'https://www.stern.nyu.edu/programs-admissions/phd/job-placement/recent-job-placements'
-        ]
-    },
-    # Next 10 schools
-    'University of Pennsylvania': {
-        'urls': [
-            'https://economics.sas.upenn.edu/graduate/job-market-candidates',
-            'https://economics.sas.upenn.edu/graduate/prospective-students/placement-information',
-            'https://doctoral.wharton.upenn.edu/career-placement/',
-        ]
-    },
-    'University of Michigan': {
-        'urls': [
-            'https://lsa.umich.edu/econ/doctoral-program/past-job-market-placements.html',
-            'https://michiganross.umich.edu/programs/phd/placements',
-        ]
-    },
-    'UCLA': {
-        'urls': [
-            'https://economics.ucla.edu/graduate/graduate-profiles/graduate-placement-history/',
-            'https://www.anderson.ucla.edu/degrees/phd-program/placement',
-        ]
-    },
-    'University of Wisconsin-Madison': {
-        'urls': [
-            'https://econ.wisc.edu/doctoral/career-placement/',
-            'https://business.wisc.edu/phd/placements/',
-        ]
-    },
-    'Duke': {
-        'urls': [
-            'https://econ.duke.edu/graduate/hire-duke-phd',
-            'https://econ.duke.edu/phd-program/prospective-students/placements'
-        ]
-    },
-    'University of Minnesota': {
-        'urls': [
-            'https://cla.umn.edu/economics/people/job-market-candidates',
-            'https://apec.umn.edu/graduate/placement-recent-graduates'
-        ]
-    },
-    'Brown': {
-        'urls': [
-            'https://economics.brown.edu/job-market-candidates-0',
-            'https://economics.brown.edu/academics/graduate/job-placement-results'
-        ]
-    },
-    'Cornell': {
-        'urls': [
-            'https://economics.cornell.edu/economics-phd-job-market-candidates',
-            'https://economics.cornell.edu/historical-placement-phd-students'
-        ]
-    },
-    'Carnegie Mellon': {
-        'urls': [
-            'https://www.cmu.edu/tepper/programs/phd/job-market',
-            'https://www.heinz.cmu.edu/programs/phd-programs/phd-placements',
-        ]
-    },
-    'University of Maryland': {
-        'urls': [
-            'https://www.econ.umd.edu/graduate/job-market-candidates-2024-2025',
-            'https://www.econ.umd.edu/graduate/job-placement'
-        ]
-    },
-    # Additional schools with known tech placements
-    'University of Washington': {
-        'urls': [
-            'https://econ.washington.edu/job-placement',
-        ]
-    },
-    'University of Illinois': {
-        'urls': [
-            'https://economics.illinois.edu/academics/phd-program/phd-placements-year-employer',
-        ]
-    },
-    'University of Virginia': {
-        'urls': [
-            'https://economics.virginia.edu/placement-history',
-        ]
-    },
-    'UT Austin': {
-        'urls': [
-            'https://liberalarts.utexas.edu/economics/phd/job-market.html',
-        ]
-    },
-}
 
 # Tech companies to filter for
 TECH_COMPANIES = {
@@ -223,48 +386,300 @@ TECH_COMPANIES = {
 }
 
 
+def retry_after_seconds(value: Optional[str]) -> float:
+    """Parse a Retry-After header (seconds or HTTP date); 0 if absent or invalid."""
+    if not value:
+        return 0.0
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return max((when - datetime.now(when.tzinfo)).total_seconds(), 0.0)
+
+
+class CandidateSink:
+    """Append-only JSON-lines record of a scrape run's finished schools.
+
+    Each school's candidates are appended as one line ({'school', 'candidates'})
+    and synced to disk when it finishes, and a {'finished': time} line closes
+    the run. A sink without that line is an interrupted run: the next run
+    resumes it, skipping the schools already recorded.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def records(self):
+        """The sink's lines, in order; a line torn by a crash ends the iteration."""
+        if not self.path.exists():
+            return
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    return
+
+    def resumable(self) -> List[str]:
+        """Schools recorded by an interrupted run, or [] if there is none to resume."""
+        schools = []
+        for record in self.records():
+            if 'finished' in record:
+                return []
+            schools.append(record['school'])
+        return schools
+
+    def start(self, resume: bool = True) -> List[str]:
+        """Open the sink for a run, returning the schools it resumes with."""
+        schools = self.resumable() if resume else []
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not schools:
+            self.path.write_text('')
+            return []
+        # Drop a torn last line so new records start on a line of their own
+        content = self.path.read_bytes()
+        if not content.endswith(b'\n'):
+            with open(self.path, 'r+b') as f:
+                f.truncate(content.rfind(b'\n') + 1)
+        return schools
+
+    def _append(self, record: dict):
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(record, default=str) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def add(self, school: str, candidates: List[Dict]):
+        self._append({'school': school, 'candidates': candidates})
+
+    def finish(self):
+        self._append({'finished': datetime.now().isoformat()})
+
+    def frame(self, schools: Optional[Dict[str, dict]] = None) -> 'pd.DataFrame':
+        """Candidates of the recorded schools (those in schools, if given), deduplicated."""
+        import pandas as pd
+
+        frames = [pd.DataFrame(record['candidates']) for record in self.records()
+                  if record.get('candidates') and (schools is None or record['school'] in schools)]
+        if not frames:
+            return pd.DataFrame()
+        # Deduplicate by name + school
+        return pd.concat(frames, ignore_index=True).drop_duplicates(subset=['name', 'school'])
+
+
+class HostLimiter:
+    """Per-host request limits, adapted by AIMD from latency and errors.
+
+    Limits and average latencies live in the scrape state's host entries
+    ('limit', 'latency', 'resume_at'), so each run starts from what earlier
+    runs learned. Safe to share between fetch threads.
+    """
+
+    def __init__(self, state: dict):
+        self.state = state
+        self._cond = threading.Condition()
+        self._in_flight = {}  # host -> requests running
+        self._next_start = {}  # host -> monotonic time the next request may start
+
+    def _entry(self, host: str) -> dict:
+        return self.state.setdefault('hosts', {}).setdefault(host, {})
+
+    def limit(self, url: str) -> float:
+        return self.state.get('hosts', {}).get(urlparse(url).netloc.lower(), {}).get('limit', 1.0)
+
+    @contextmanager
+    def slot(self, url: str):
+        """Hold one of the host's request slots, waiting for its pace and any Retry-After."""
+        host = urlparse(url).netloc.lower()
+        with self._cond:
+            while self._in_flight.get(host, 0) >= max(1, int(self.limit(url))):
+                self._cond.wait()
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            resume_at = self._entry(host).get('resume_at')
+            if resume_at:
+                paused = (datetime.fromisoformat(resume_at) - datetime.now()).total_seconds()
+                start = max(start, now + min(paused, MAX_RETRY_AFTER))
+            self._next_start[host] = start + REQUEST_INTERVAL / self.limit(url)
+        try:
+            time.sleep(max(start - time.monotonic(), 0))
+            yield
+        finally:
+            with self._cond:
+                self._in_flight[host] -= 1
+                self._cond.notify_all()
+
+    def record(self, url: str, seconds: float, status: Optional[int], retry_after: float = 0.0):
+        """Adapt the host's limit to a response (status None: network error)."""
+        host = urlparse(url).netloc.lower()
+        with self._cond:
+            entry = self._entry(host)
+            limit = entry.get('limit', 1.0)
+            latency = entry.get('latency')
+            spike = status is not None and latency is not None and seconds > LATENCY_SPIKE_RATIO * latency
+            if status is None or status == 429 or status >= 500 or spike:
+                limit = max(limit * AIMD_DECREASE, AIMD_MIN_LIMIT)
+            elif status < 400:
+                limit = min(limit + AIMD_INCREASE, AIMD_MAX_LIMIT)
+            entry['limit'] = round(limit, 3)
+            if status is not None:
+                latency = seconds if latency is None else LATENCY_WEIGHT * seconds + (1 - LATENCY_WEIGHT) * latency
+                entry['latency'] = round(latency, 3)
+            if retry_after:
+                entry['resume_at'] = (datetime.now() + timedelta(seconds=retry_after)).isoformat()
+            elif entry.get('resume_at'):
+                del entry['resume_at']
+            self._cond.notify_all()
+
+
 class EconPhDScraper:
-    def __init__(self, force: bool = False):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
-        self.candidates = []
+    def __init__(self, force: bool = False, state_file: Optional[str] = None, due_only: bool = False,
+                 tracer: Optional[Tracer] = None, sink_file: Optional[str] = None):
+        # Pooled keep-alive client; 429/5xx are not retried here, HostLimiter backs off instead
+        self.session = HttpClient(retry=FETCH_RETRY)
         self.driver = None  # Lazy-initialized Selenium driver
         self.force = force  # Force re-scrape all pages
+        self.due_only = due_only  # Skip pages not due by their change rate (see page_refresh_days)
+        self.state_file = state_file or SCRAPE_STATE_FILE
         self.state = self._load_state()
+        self.sink = CandidateSink(sink_file or CANDIDATE_SINK)  # scrape_all's finished schools
+        # As loaded, to find what this run changed (see _save_state)
+        self._saved_entries = json.dumps({key: self.state.get(key, {}) for key in MERGED_STATE_KEYS})
+        self._parser_versions = {}  # school -> parser version hash
+        self._parse_cache = {}  # url -> cached parse entry (loaded lazily)
+        self._pdf_futures = {}  # school -> futures of PDF sources started by scrape_all
+        self.deferred = []  # schools scrape_all left for a later run (see schedule)
+        # Hosts skipped for the rest of this run: refused or unresolvable, or
+        # BREAKER_FAILURES network failures in a row (see _record_host_failure)
+        self._unreachable = set()
+        self._run_failures = {}  # host -> network failures in a row this run
+        self.limiter = HostLimiter(self.state)
+        self.tracer = tracer or Tracer()  # timing spans (see tracing.py), off without a path
 
     def _load_state(self) -> dict:
         """Load scrape state from disk."""
-        if Path(SCRAPE_STATE_FILE).exists():
+        if Path(self.state_file).exists():
             try:
-                with open(SCRAPE_STATE_FILE) as f:
+                with open(self.state_file) as f:
                     return json.load(f)
             except json.JSONDecodeError:
                 pass
-        return {'pages': {}, 'last_run': None}
+        return {'pages': {}, 'schools': {}, 'last_run': None}
 
     def _save_state(self):
-        """Save scrape state to disk."""
+        """Save scrape state to disk.
+
+        Only pages and school timings this scraper changed are written over
+        the file's current contents, so processes sharing a state file
+        (queue workers) keep each other's entries.
+        """
+        saved = json.loads(self._saved_entries)
+        state = self._load_state()
+        for key in MERGED_STATE_KEYS:
+            entries = self.state.setdefault(key, {})
+            changed = {name: entry for name, entry in entries.items() if saved.get(key, {}).get(name) != entry}
+            state.setdefault(key, {}).update(changed)
+            self.state[key] = state[key]
         self.state['last_run'] = datetime.now().isoformat()
-        Path(SCRAPE_STATE_FILE).parent.mkdir(parents=True, exist_ok=True)
-        with open(SCRAPE_STATE_FILE, 'w') as f:
+        self._saved_entries = json.dumps({key: self.state[key] for key in MERGED_STATE_KEYS})
+
+        Path(self.state_file).parent.mkdir(parents=True, exist_ok=True)
+        tmp = f"{self.state_file}.{os.getpid()}.tmp"
+        with open(tmp, 'w') as f:
             json.dump(self.state, f, indent=2)
+        os.replace(tmp, self.state_file)
 
-    def _hash_content(self, html: str) -> str:
+    def _hash_content(self, html: Union[str, bytes]) -> str:
         """Generate hash of page content."""
-        return hashlib.md5(html.encode()).hexdigest()
+        return hashlib.md5(html.encode() if isinstance(html, str) else html).hexdigest()
 
-    def _save_raw_html(self, url: str, html: str):
-        """Cache raw HTML for debugging."""
+    def _save_raw_html(self, url: str, html: Union[str, bytes]):
+        """Cache raw HTML for debugging (bytes as received)."""
         Path(RAW_HTML_DIR).mkdir(parents=True, exist_ok=True)
         filename = hashlib.md5(url.encode()).hexdigest()[:12] + '.html'
-        with open(f"{RAW_HTML_DIR}/{filename}", 'w', encoding='utf-8') as f:
-            f.write(html)
+        with open(f"{RAW_HTML_DIR}/{filename}", 'wb') as f:
+            f.write(html.encode() if isinstance(html, str) else html)
+
+    def _parser_version(self, school: str) -> str:
+        """Hash of the code that parses a school's pages (custom parser and generic fallback)."""
+        if school not in self._parser_versions:
+            digest = hashlib.sha256(str(PARSE_CACHE_VERSION).encode())
+            parser = custom_parser(school)
+            if parser:
+                modules = {cls.__module__ for cls in type(parser).__mro__
+                           if cls.__module__.startswith('parsers')}
+                modules.add('parsers.spec')  # the engine running their specs
+                for module in sorted(modules):
+                    digest.update(inspect.getsource(sys.modules[module]).encode())
+            for name in ('parse_page', '_run_strategies', '_parse_tables', '_parse_cards',
+                         '_parse_year_lists', 'extract_year'):
+                digest.update(inspect.getsource(getattr(type(self), name)).encode())
+            digest.update(inspect.getsource(sys.modules[compile_selector.__module__]).encode())
+            digest.update(inspect.getsource(build_soup).encode())
+            digest.update(json.dumps([PRUNE_XPATH, GENERIC_STRATEGIES, CARD_SELECTORS, CARD_NAME_SELECTOR,
+                                      CARD_PLACEMENT_SELECTOR, CARD_FIELDS_SELECTOR]).encode())
+            self._parser_versions[school] = digest.hexdigest()[:16]
+        return self._parser_versions[school]
+
+    def _parse_cache_path(self, url: str) -> Path:
+        """Cache file for a URL's parse results (same naming as raw HTML)."""
+        return Path(PARSE_CACHE_DIR) / (hashlib.md5(url.encode()).hexdigest()[:12] + '.json')
+
+    def _cached_candidates(self, url: str, school: str) -> Optional[List[Dict]]:
+        """Candidates parsed from the page's current content, or None if not cached.
+
+        Entries are valid for the content hash recorded in scrape state and
+        the school's current parser version.
+        """
+        if url not in self._parse_cache:
+            path = self._parse_cache_path(url)
+            entry = None
+            if path.exists():
+                try:
+                    with open(path) as f:
+                        entry = json.load(f)
+                except json.JSONDecodeError:
+                    pass
+            self._parse_cache[url] = entry
+
+        entry = self._parse_cache[url]
+        if (not entry
+                or entry.get('content_hash') != self.state['pages'].get(url, {}).get('hash')
+                or entry.get('parser_version') != self._parser_version(school)):
+            return None
+        return entry['candidates']
+
+    def _cache_candidates(self, url: str, school: str, candidates: List[Dict], via: str = 'requests'):
+        """Store parse results for the page's current content hash."""
+        content_hash = self.state['pages'].get(url, {}).get('hash')
+        if not content_hash:
+            return
+        entry = {
+            'url': url,
+            'content_hash': content_hash,
+            'parser_version': self._parser_version(school),
+            'via': via,
+            'candidates': candidates,
+        }
+        path = self._parse_cache_path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(entry, f)
+        self._parse_cache[url] = entry
 
     def _get_selenium_driver(self):
         """Lazy-initialize Selenium WebDriver with anti-detection measures."""
         if self.driver is None:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            from selenium.webdriver.chrome.service import Service
+            from webdriver_manager.chrome import ChromeDriverManager
+
             options = Options()
             options.add_argument('--headless=new')  # New headless mode
             options.add_argument('--no-sandbox')
@@ -295,100 +710,231 @@ class EconPhDScraper:
             self.driver.quit()
             self.driver = None
 
+    def _host_down(self, url: str) -> bool:
+        """Whether url's host failed this run or its circuit breaker is open."""
+        host = urlparse(url).netloc.lower()
+        if host in self._unreachable:
+            print(f"  [BREAKER] {host} unreachable this run, skipping")
+            return True
+        open_until = self.state.get('hosts', {}).get(host, {}).get('open_until')
+        if open_until and datetime.now() < datetime.fromisoformat(open_until):
+            print(f"  [BREAKER] {host} down, not retried until {open_until[:16]}")
+            return True
+        return False
+
+    def _record_host_failure(self, url: str, error: str, unreachable: bool = False):
+        """Count a network failure against url's host, opening its breaker after BREAKER_FAILURES.
+
+        The host's other pages are still tried this run after a transient
+        failure (a timeout); it is skipped once refused or unresolvable
+        (unreachable), or after BREAKER_FAILURES failures in a row.
+        """
+        host = urlparse(url).netloc.lower()
+        self._run_failures[host] = self._run_failures.get(host, 0) + 1
+        if unreachable or self._run_failures[host] >= BREAKER_FAILURES:
+            self._unreachable.add(host)
+        entry = self.state.setdefault('hosts', {}).setdefault(host, {})
+        now = datetime.now()
+        entry['failures'] = entry.get('failures', 0) + 1
+        entry['history'] = (entry.get('history', []) + [[now.isoformat(), error]])[-MAX_HOST_HISTORY:]
+        if entry['failures'] >= BREAKER_FAILURES:
+            # Still failing after a cool-down (half-open): trip again, for longer
+            entry['trips'] = entry.get('trips', 0) + 1
+            minutes = min(BREAKER_COOLDOWN_MINUTES * 2 ** (entry['trips'] - 1), BREAKER_MAX_COOLDOWN_MINUTES)
+            entry['open_until'] = (now + timedelta(minutes=minutes)).isoformat()
+            print(f"  [BREAKER] {host} failed {entry['failures']} times in a row, "
+                  f"skipping it for {minutes / 60:g}h")
+
+    def _record_host_success(self, url: str):
+        """Close url's host breaker (its failure history is kept)."""
+        self._run_failures.pop(urlparse(url).netloc.lower(), None)
+        entry = self.state.get('hosts', {}).get(urlparse(url).netloc.lower())
+        if entry and entry.get('failures'):
+            entry.update({'failures': 0, 'trips': 0, 'open_until': None})
+
     def fetch_page_selenium(self, url: str, wait_for: str = None) -> Optional[BeautifulSoup]:
-        """Fetch page using Selenium for JS-rendered content with retry logic."""
-        max_retries = 3
+        """Fetch page using Selenium for JS-rendered content with retry logic.
 
-        for attempt in range(max_retries):
-            try:
-                print(f"  [Selenium] Fetching (attempt {attempt + 1}): {url}")
-                driver = self._get_selenium_driver()
-                driver.get(url)
-
-                # Wait for page load
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-
-                # Wait for specific element if specified
-                if wait_for:
-                    try:
-                        WebDriverWait(driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, wait_for))
-                        )
-                    except Exception as e:
-                        print(f"  [Selenium] Wait for element timeout: {e}")
-
-                # Extra wait for JS rendering
-                time.sleep(3)
-
-                page_source = driver.page_source
-
-                # Check if page has actual content
-                if len(page_source) < 1000:
-                    print(f"  [Selenium] Page too small ({len(page_source)} chars), retrying...")
-                    time.sleep(2)
-                    continue
+        Never tried for hosts that are down (see _host_down) or had a network
+        failure this run; a browser network error counts as a host failure
+        and ends the retries.
+        """
+        if self._host_down(url) or self._run_failures.get(urlparse(url).netloc.lower()):
+            return None
 
-                # Cache the HTML
-                self._save_raw_html(url, page_source)
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        with self.tracer.span('selenium', url=url, ok=False) as span:
+            max_retries = 3
+
+            for attempt in range(max_retries):
+                span['attempts'] = attempt + 1
+                try:
+                    print(f"  [Selenium] Fetching (attempt {attempt + 1}): {url}")
+                    driver = self._get_selenium_driver()
+                    driver.get(url)
+
+                    # Wait for page load
+                    WebDriverWait(driver, 15).until(
+                        EC.presence_of_element_located((By.TAG_NAME, "body"))
+                    )
+
+                    # Wait for specific element if specified
+                    if wait_for:
+                        try:
+                            WebDriverWait(driver, 10).until(
+                                EC.presence_of_element_located((By.CSS_SELECTOR, wait_for))
+                            )
+                        except Exception as e:
+                            print(f"  [Selenium] Wait for element timeout: {e}")
+
+                    # Extra wait for JS rendering
+                    time.sleep(3)
+
+                    page_source = driver.page_source
+
+                    # Check if page has actual content
+                    if len(page_source) < 1000:
+                        print(f"  [Selenium] Page too small ({len(page_source)} chars), retrying...")
+                        time.sleep(2)
+                        continue
 
-                return BeautifulSoup(page_source, 'lxml')
+                    self._record_host_success(url)
+                    span['ok'] = True
+                    # Cache the HTML
+                    self._save_raw_html(url, page_source)
+
+                    return build_soup(page_source.encode(), 'charset=utf-8')
+
+                except Exception as e:
+                    print(f"  [Selenium] Attempt {attempt + 1} failed: {e}")
+                    if 'net::ERR_' in str(e):
+                        # DNS, refused, timed out: retrying in a browser won't help
+                        self._record_host_failure(url, str(e).split('\n')[0][:200], unreachable=any(
+                            code in str(e) for code in ('ERR_NAME_NOT_RESOLVED', 'ERR_CONNECTION_REFUSED')))
+                        return None
+                    if attempt == max_retries - 1:
+                        return None
+                    time.sleep(2)
 
-            except Exception as e:
-                print(f"  [Selenium] Attempt {attempt + 1} failed: {e}")
-                if attempt == max_retries - 1:
-                    return None
-                time.sleep(2)
+            return None
 
-        return None
+    def _request(self, url: str) -> tuple:
+        """GET url within its host's limits (see HostLimiter), classifying failures.
 
-    def fetch_page(self, url: str) -> tuple[Optional[BeautifulSoup], bool]:
+        Returns:
+            Tuple of (response or None, needs_selenium: bool)
+        """
+        if self._host_down(url):
+            return None, False
+        with self.tracer.span('request', url=url, host=urlparse(url).netloc.lower()) as span:
+            queued = time.monotonic()
+            with self.limiter.slot(url):
+                # Failures are recorded before the slot is released, so requests
+                # waiting on the same host see them
+                if self._host_down(url):
+                    return None, False
+                started = time.monotonic()
+                span['wait'] = round(started - queued, 4)
+                try:
+                    response = self.session.get(url, timeout=TIMEOUT)
+                except requests.RequestException as e:
+                    # Connection refused, DNS, timeouts: the host is down, not a JS page.
+                    # A timeout may be transient; a failed connection is not
+                    self.limiter.record(url, time.monotonic() - started, None)
+                    print(f"  Error fetching {url}: {e}")
+                    self._record_host_failure(url, type(e).__name__, unreachable=(
+                        isinstance(e, requests.ConnectionError) and not isinstance(e, requests.Timeout)))
+                    span['error'] = type(e).__name__
+                    return None, False
+                span['status'] = response.status_code
+                timing = getattr(response, 'timing', None)  # see HttpClient.request
+                if timing is not None:
+                    span.update(bytes=timing.bytes, connect=timing.connect, ttfb=timing.ttfb,
+                                download=round(timing.seconds - (timing.ttfb or 0), 4))
+                self.limiter.record(url, time.monotonic() - started, response.status_code,
+                                    retry_after_seconds(response.headers.get('retry-after')))
+                try:
+                    response.raise_for_status()
+                except requests.HTTPError as e:
+                    status = e.response.status_code if e.response is not None else None
+                    print(f"  Error fetching {url}: {e}")
+                    if status in SELENIUM_STATUSES:
+                        return None, True  # Possibly bot blocking, a browser may get through
+                    # 429 and 5xx only slow the host down (HostLimiter.record):
+                    # its next request waits for the lower limit and any Retry-After
+                    return None, False
+                self._record_host_success(url)
+        return response, False
+
+    def fetch_page(self, url: str, school: str = None,
+                   fetched: Optional[tuple] = None) -> tuple[Optional[BeautifulSoup], bool]:
         """Fetch and parse a webpage with change detection.
 
+        When school is given, an unchanged page is only skipped if its parse
+        results are cached (see _cached_candidates); otherwise it is returned
+        for re-parsing. fetched is a _request result already in hand.
+
         Returns:
             Tuple of (BeautifulSoup or None, needs_selenium: bool)
         """
-        try:
-            time.sleep(1)  # Rate limiting
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            html = response.text
-
-            # Detect empty or JS-rendered pages that need Selenium
-            js_markers = ['loading...', 'please enable javascript', 'noscript',
-                          'javascript is required', 'this page requires javascript']
-            html_lower = html.lower()
+        response, needs_selenium = fetched or self._request(url)
+        if response is None:
+            return None, needs_selenium
 
-            if len(html) < 1000:
-                print(f"  [INFO] Page too small ({len(html)} chars), needs Selenium")
-                return None, True
+        html = response.content  # bytes: decoded once, by lxml in build_soup
 
-            if any(marker in html_lower for marker in js_markers):
-                print(f"  [INFO] JS-required markers detected, needs Selenium")
-                return None, True
+        # Check if content changed (skip if unchanged and not forcing). Pages
+        # that need Selenium are hashed too: their browser parse is cached
+        # against the static page's hash
+        new_hash = self._hash_content(html)
+        old_hash = self.state['pages'].get(url, {}).get('hash')
+        self._record_check(url, changed=old_hash is not None and old_hash != new_hash)
 
-            # Check if content changed (skip if unchanged and not forcing)
-            new_hash = self._hash_content(html)
-            old_hash = self.state['pages'].get(url, {}).get('hash')
-
-            if not self.force and old_hash == new_hash:
+        if not self.force and old_hash == new_hash:
+            if school is None or self._cached_candidates(url, school) is not None:
                 print(f"  [SKIP] No changes detected")
                 return None, False  # Skip processing unchanged pages
+            print(f"  [INFO] Unchanged but no cached parse, re-parsing")
 
-            # Update state
-            self.state['pages'][url] = {
-                'hash': new_hash,
-                'last_scraped': datetime.now().isoformat()
-            }
-
-            # Cache raw HTML for debugging
-            self._save_raw_html(url, html)
+        # Update state (keeping the page's remembered parse strategies)
+        self.state['pages'].setdefault(url, {}).update({
+            'hash': new_hash,
+            'last_scraped': datetime.now().isoformat()
+        })
 
-            return BeautifulSoup(html, 'lxml'), False
-        except requests.RequestException as e:
-            print(f"  Error fetching {url}: {e}")
-            return None, True  # Network error, try Selenium
+        # Detect empty or JS-rendered pages that need Selenium
+        js_markers = [b'loading...', b'please enable javascript', b'noscript',
+                      b'javascript is required', b'this page requires javascript']
+        html_lower = html.lower()
+
+        if len(html) < 1000:
+            print(f"  [INFO] Page too small ({len(html)} bytes), needs Selenium")
+            return None, True
+
+        if any(marker in html_lower for marker in js_markers):
+            print(f"  [INFO] JS-required markers detected, needs Selenium")
+            return None, True
+
+        # Cache raw HTML for debugging
+        self._save_raw_html(url, html)
+
+        with self.tracer.span('build_soup', url=url, bytes=len(html)):
+            soup = build_soup(html, response.headers.get('content-type', ''))
+        return soup, False
+
+    def _record_check(self, url: str, changed: bool):
+        """Add a fetch to the page's change history and update its refresh interval."""
+        page = self.state['pages'].setdefault(url, {})
+        now = datetime.now().isoformat()
+        page.setdefault('first_checked', now)
+        page['last_fetched'] = now
+        page['checks'] = page.get('checks', 0) + 1
+        if changed:
+            page['changes'] = (page.get('changes', []) + [now])[-MAX_CHANGES_KEPT:]
+        page['refresh_days'] = round(page_refresh_days(page), 2)
 
     def is_tech_placement(self, placement: str) -> bool:
         """Check if a placement is at a tech company AND not academia."""
@@ -417,29 +963,64 @@ class EconPhDScraper:
             return int('20' + matches[0])
         return None
 
-    def parse_page(self, soup: BeautifulSoup, school: str) -> List[Dict]:
-        """Parse page using custom parser if available, otherwise generic strategies."""
-        candidates = []
+    def parse_page(self, soup: BeautifulSoup, school: str, url: str = None) -> List[Dict]:
+        """Parse page using custom parser if available, otherwise generic strategies.
 
+        With url, the strategies that produced candidates for the page last
+        time are remembered in scrape state and run alone; the exhaustive
+        pass only runs for new pages, on --force, or when they stop yielding
+        (a layout change).
+        """
+        with self.tracer.span('parse', school=school, url=url) as span:
+            page = self.state['pages'].setdefault(url, {}) if url else {}
+            remembered = page.get('strategies')
+            if remembered and not self.force:
+                candidates, _ = self._run_strategies(soup, school, only=remembered)
+                if candidates and len(candidates) >= page.get('strategy_yield', 0) * LAYOUT_CHANGE_RATIO:
+                    print(f"  Using remembered strategies: {', '.join(remembered)}")
+                    span.update(strategies=remembered, remembered=True, candidates=len(candidates))
+                    return candidates
+                print(f"  Remembered strategies found {len(candidates)} candidates "
+                      f"(last time {page.get('strategy_yield', 0)}), layout changed: trying all")
+
+            candidates, produced = self._run_strategies(soup, school)
+            if url:
+                page['strategies'] = produced
+                page['strategy_yield'] = len(candidates)
+            span.update(strategies=produced, remembered=False, candidates=len(candidates))
+            return candidates
+
+    def _run_strategies(self, soup: BeautifulSoup, school: str,
+                        only: Optional[List[str]] = None) -> tuple[List[Dict], List[str]]:
+        """Run custom-parser strategies, then generic ones if those find nothing.
+
+        Strategy names are 'custom:<name>' (see SchoolParser.STRATEGIES) and
+        'generic:<name>' (GENERIC_STRATEGIES); only restricts the run to them.
+
+        Returns:
+            Tuple of (candidates, names of the strategies that produced any)
+        """
         # Try custom parser first if available for this school
-        if school in CUSTOM_PARSERS:
+        parser = custom_parser(school)
+        if parser and (only is None or any(n.startswith('custom:') for n in only)):
             print(f"  Using custom parser for {school}")
-            candidates = CUSTOM_PARSERS[school].parse(soup)
-            if candidates:
-                return candidates
+            custom_only = None if only is None else [n[len('custom:'):] for n in only if n.startswith('custom:')]
+            candidates, names = parser.run_strategies(soup, custom_only)
+            if candidates or only is not None:
+                return candidates, [f'custom:{name}' for name in names]
             print(f"  Custom parser returned 0 results, falling back to generic")
 
-        # Generic strategies
-        # Strategy 1: Tables
-        candidates.extend(self._parse_tables(soup, school))
-
-        # Strategy 2: Structured cards/articles
-        candidates.extend(self._parse_cards(soup, school))
-
-        # Strategy 3: Year-grouped lists
-        candidates.extend(self._parse_year_lists(soup, school))
-
-        return candidates
+        # Generic strategies: tables, structured cards/articles, year-grouped lists
+        candidates = []
+        produced = []
+        for name in GENERIC_STRATEGIES:
+            if only is not None and f'generic:{name}' not in only:
+                continue
+            found = getattr(self, f'_parse_{name}')(soup, school)
+            if found:
+                produced.append(f'generic:{name}')
+            candidates.extend(found)
+        return candidates, produced
 
     def _parse_tables(self, soup: BeautifulSoup, school: str) -> List[Dict]:
         """Parse placement tables."""
@@ -483,86 +1064,69 @@ class EconPhDScraper:
         return candidates
 
     def _parse_cards(self, soup: BeautifulSoup, school: str) -> List[Dict]:
-        """Parse candidate cards/articles with expanded selectors."""
-        candidates = []
-        # Expanded selectors based on actual school HTML structures
-        selectors = [
-            # Standard CMS selectors
-            '.views-row', '.node', 'article', '.person', '.candidate',
-            '.faculty-member', '.profile', '.person-teaser', '.cu-person',
-            # Stanford (Drupal with HB cards)
-            '.hb-card', '.hb-card--horizontal',
-            # MIT (figure/figcaption structure)
-            'figure.caption', 'figure[role="group"]',
-            # Additional common patterns
-            '.profile-card', '.student-profile', '.graduate-profile',
-            '.component_item', '.person-grid-item', '.faculty-grid-item',
-            '.student-card', '.job-candidate',
-            # Drupal-specific
-            '.view-content > div', '.field-collection-item',
-            # Generic attribute selectors
-            'div[class*="person"]', 'div[class*="candidate"]', 'div[class*="profile"]',
-            # List items with rich content
-            'li.person', 'li.candidate',
-        ]
+        """Parse candidate cards/articles with expanded selectors.
+
+        One walk over the page matches every tag against CARD_SELECTORS;
+        each card is visited once, in the order the selectors used to be
+        tried one by one (first matching selector, then document order), so
+        nested and overlapping matches give the same results without
+        re-querying the page per selector.
+        """
+        selectors, name_pattern, placement_pattern, fields_pattern = _card_patterns()
+        cards = []  # (selector rank, document position, element)
+        for position, el in enumerate(el for el in soup.descendants if isinstance(el, Tag)):
+            for rank, matches in enumerate(selectors):
+                if matches(el):
+                    cards.append((rank, position, el))
+                    break
+        cards.sort(key=lambda card: card[:2])
 
+        candidates = []
         seen_names = set()  # Avoid duplicates
+        garbage_markers = ['click on', 'building', 'stanford way', 'website',
+                           'campus map', 'connect with', 'phone', 'email']
 
-        for selector in selectors:
-            for card in soup.select(selector):
-                # Expanded name element selectors
-                name_elem = card.select_one(
-                    'h2 a, h3 a, h4 a, h2, h3, h4, .title a, .name a, .title, .name, '
-                    'figcaption a, .hb-card__title a, .hb-card__title, '
-                    '.field--name-title a, .component_title_link'
-                )
-                if not name_elem:
-                    continue
-
-                name = name_elem.get_text(strip=True)
-                if not name or len(name) < 3 or len(name) > 100:
-                    continue
-                # Skip garbage
-                garbage_markers = ['click on', 'building', 'stanford way', 'website',
-                                   'campus map', 'connect with', 'phone', 'email']
-                if any(marker in name.lower() for marker in garbage_markers):
-                    continue
-                # Skip if already seen
-                if name.lower() in seen_names:
-                    continue
-                seen_names.add(name.lower())
-
-                # Expanded placement selectors
-                placement_elem = card.select_one(
-                    '.placement, .position, .field--name-field-placement, '
-                    '.field--name-field-initial-placement, .employer, .company, '
-                    '.hb-card__subtitle, .job-placement'
-                )
-                placement = placement_elem.get_text(strip=True) if placement_elem else ""
-
-                # Expanded research fields selectors
-                fields_elem = card.select_one(
-                    '.field--name-field-research-areas, .research, .interests, '
-                    '.research-interests, .fields, .specialization, '
-                    '.field--name-field-research-interests'
-                )
-                fields = fields_elem.get_text(strip=True) if fields_elem else ""
-
-                year = self.extract_year(card.get_text())
-                if year and (year < 2020 or year > 2025):
-                    continue
-
-                candidates.append({
-                    'name': name,
-                    'school': school,
-                    'graduation_year': year or datetime.now().year,
-                    'research_fields': fields,
-                    'initial_placement': placement,
-                    'initial_role': '',
-                    'current_placement': '',
-                    'current_role': '',
-                    'linkedin_url': ''
-                })
+        name_texts = {}  # nested cards usually share their name element
+        for _, _, card in cards:
+            name_elem = select_one(card, name_pattern)
+            if not name_elem:
+                continue
+
+            if id(name_elem) not in name_texts:
+                name_texts[id(name_elem)] = name_elem.get_text(strip=True)
+            name = name_texts[id(name_elem)]
+            if not name or len(name) < 3 or len(name) > 100:
+                continue
+            # Skip garbage
+            name_lower = name.lower()
+            if any(marker in name_lower for marker in garbage_markers):
+                continue
+            # Skip if already seen
+            if name_lower in seen_names:
+                continue
+            seen_names.add(name_lower)
+
+            placement_elem = select_one(card, placement_pattern)
+            placement = placement_elem.get_text(strip=True) if placement_elem else ""
+
+            fields_elem = select_one(card, fields_pattern)
+            fields = fields_elem.get_text(strip=True) if fields_elem else ""
+
+            year = self.extract_year(card.get_text())
+            if year and (year < 2020 or year > 2025):
+                continue
+
+            candidates.append({
+                'name': name,
+                'school': school,
+                'graduation_year': year or datetime.now().year,
+                'research_fields': fields,
+                'initial_placement': placement,
+                'initial_role': '',
+                'current_placement': '',
+                'current_role': '',
+                'linkedin_url': ''
+            })
 
         return candidates
 
@@ -601,73 +1165,279 @@ class EconPhDScraper:
 
         return candidates
 
+    def scrape_pdf(self, school: str, url: str) -> List[Dict]:
+        """Fetch and parse one PDF source (cached by content hash, see pdf_parser)."""
+        with self.tracer.span('pdf', school=school, url=url) as span:
+            try:
+                from pdf_parser import PDFPlacementParser
+                parser = PDFPlacementParser(school, page_workers=PDF_PAGE_WORKERS)
+                candidates = parser.parse_url(url, force=self.force)
+            except Exception as e:
+                print(f"  [PDF] {school} PDF failed: {e}")
+                span['error'] = str(e)[:200]
+                candidates = []
+            span['candidates'] = len(candidates)
+        return candidates
+
+    def _pdf_candidates(self, school: str, config: dict) -> List[Dict]:
+        """Candidates from a school's PDF sources, waiting on background fetches if started."""
+        futures = self._pdf_futures.pop(school, None)
+        if futures is None:
+            results = [self.scrape_pdf(school, url) for url in config.get('pdfs', [])]
+        else:
+            results = [future.result() for future in futures]
+        return [c for result in results for c in result]
+
+    def _refresh_days(self, url: str, config: dict) -> float:
+        """The school's refresh_days, or with due_only the page's own interval if longer."""
+        refresh_days = config.get('refresh_days', 0)
+        if self.due_only:
+            refresh_days = max(refresh_days, page_refresh_days(self.state['pages'].get(url, {})))
+        return refresh_days
+
+    def _is_fresh(self, url: str, school: str, refresh_days: float) -> bool:
+        """Whether a page was fetched within refresh_days and its parse is cached."""
+        last_fetched = self.state['pages'].get(url, {}).get('last_fetched')
+        if self.force or not refresh_days or not last_fetched:
+            return False
+        age = datetime.now() - datetime.fromisoformat(last_fetched)
+        return age.total_seconds() < refresh_days * 86400 and self._cached_candidates(url, school) is not None
+
     def scrape_school(self, school: str, config: dict) -> List[Dict]:
-        """Scrape all URLs for a school."""
+        """Scrape all URLs for a school, recording per-URL and per-school timings."""
+        with self.tracer.span('school', school=school, pages=len(config['urls'])) as span:
+            tech_candidates = self._scrape_school(school, config)
+            span['candidates'] = len(tech_candidates)
+        return tech_candidates
+
+    def _scrape_school(self, school: str, config: dict) -> List[Dict]:
         print(f"\nScraping {school}...")
+        started = time.monotonic()
         all_candidates = []
         urls_needing_selenium = []
+        all_cached = True  # every page served from the parse cache
+        all_fresh = True  # no page fetched: nothing learned about timings
+
+        refresh_days = {url: self._refresh_days(url, config) for url in config['urls']}
+        fresh = {url: self._is_fresh(url, school, refresh_days[url]) for url in config['urls']}
+        fetched = self._fetch_all([url for url in config['urls'] if not fresh[url]])
 
         for url in config['urls']:
+            if fresh[url]:
+                candidates = self._cached_candidates(url, school)
+                print(f"  [FRESH] {url}: {len(candidates)} candidates, "
+                      f"fetched less than {refresh_days[url]:g} day(s) ago")
+                all_candidates.extend(candidates)
+                continue
             print(f"  Fetching: {url}")
-            soup, needs_selenium = self.fetch_page(url)
+            all_fresh = False
+            url_started = time.monotonic()
+            result, request_seconds = fetched[url]
+            soup, needs_selenium = self.fetch_page(url, school, fetched=result)
 
             if needs_selenium:
                 urls_needing_selenium.append(url)
+                all_cached = False
+                candidates = []
             elif soup:
-                candidates = self.parse_page(soup, school)
+                candidates = self.parse_page(soup, school, url)
                 print(f"  Found {len(candidates)} candidates")
+                self._cache_candidates(url, school, candidates)
                 all_candidates.extend(candidates)
+                all_cached = False
+            else:
+                candidates = self._cached_candidates(url, school) or []
+                print(f"  [CACHE] {len(candidates)} candidates from previous parse")
+                all_candidates.extend(candidates)
+            self._record_page(url, request_seconds + time.monotonic() - url_started, len(candidates))
 
         # Try Selenium for URLs that need it (JS-rendered, empty responses, errors)
         if urls_needing_selenium:
             print(f"  Trying Selenium for {len(urls_needing_selenium)} URL(s)...")
             for url in urls_needing_selenium:
-                soup = self.fetch_page_selenium(url)
+                url_started = time.monotonic()
+                soup = self.fetch_page_selenium(url, config.get('wait_for'))
+                candidates = self.parse_page(soup, school, url) if soup else []
                 if soup:
-                    candidates = self.parse_page(soup, school)
                     print(f"  [Selenium] Found {len(candidates)} candidates")
+                    # Cached against the static page's hash (see fetch_page)
+                    self._cache_candidates(url, school, candidates, via='selenium')
                     all_candidates.extend(candidates)
+                self._record_page(url, time.monotonic() - url_started, len(candidates), add=True)
+
+        # PDF sources are authoritative when they yield candidates
+        pdf_candidates = self._pdf_candidates(school, config)
+        if pdf_candidates:
+            print(f"  [PDF] Using {len(pdf_candidates)} candidates from PDF source(s)")
+            all_candidates = pdf_candidates
 
         # If still no candidates, try Selenium on all URLs as last resort
-        if len(all_candidates) == 0 and not urls_needing_selenium:
+        # (not when every page was cached: the last run already tried this)
+        if len(all_candidates) == 0 and not urls_needing_selenium and not all_cached:
             print(f"  No results with requests, trying Selenium on all URLs...")
             for url in config['urls']:
-                soup = self.fetch_page_selenium(url)
+                url_started = time.monotonic()
+                soup = self.fetch_page_selenium(url, config.get('wait_for'))
+                candidates = self.parse_page(soup, school) if soup else []
                 if soup:
-                    candidates = self.parse_page(soup, school)
                     print(f"  [Selenium] Found {len(candidates)} candidates")
+                    # Cached against the static page's hash, so an unchanged page
+                    # next run reuses these without launching a browser
+                    self._cache_candidates(url, school, candidates, via='selenium')
                     all_candidates.extend(candidates)
+                self._record_page(url, time.monotonic() - url_started, len(candidates), add=True)
 
         # Filter for tech placements
         tech_candidates = [c for c in all_candidates if self.is_tech_placement(c.get('initial_placement', ''))]
         print(f"  Tech placements: {len(tech_candidates)}")
 
+        if not all_fresh or config.get('pdfs'):
+            self._record_school(school, time.monotonic() - started, len(tech_candidates))
         return tech_candidates
 
-    def scrape_all(self) -> pd.DataFrame:
-        """Scrape all schools and return consolidated DataFrame."""
-        all_candidates = []
+    def _fetch_all(self, urls: List[str]) -> Dict[str, tuple]:
+        """Request urls concurrently within host limits: url -> (_request result, seconds)."""
+        def timed(url):
+            started = time.monotonic()
+            result = self._request(url)
+            return result, time.monotonic() - started
+
+        if len(urls) < 2:
+            return {url: timed(url) for url in urls}
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(len(urls), FETCH_WORKERS)) as pool:
+            return dict(zip(urls, pool.map(timed, urls)))
+
+    def _record_page(self, url: str, seconds: float, found: int, add: bool = False):
+        """Record a page's fetch/parse time and candidate count (add: a Selenium retry)."""
+        page = self.state['pages'].setdefault(url, {})
+        if add:
+            seconds += page.get('seconds', 0)
+        page.update({'seconds': round(seconds, 2), 'candidates': found})
+
+    def _record_school(self, school: str, seconds: float, found: int):
+        """Fold a school's run time into its average and record its tech yield."""
+        entry = self.state.setdefault('schools', {}).get(school, {})
+        if 'seconds' in entry:
+            seconds = TIMING_WEIGHT * seconds + (1 - TIMING_WEIGHT) * entry['seconds']
+        self.state['schools'][school] = {
+            'seconds': round(seconds, 2),
+            'candidates': found,
+            'last_scraped': datetime.now().isoformat(),
+        }
+
+    def due_pages(self, schools: Dict[str, dict]) -> List[str]:
+        """URLs a scrape of schools would fetch (those not fresh)."""
+        return [url for school, config in schools.items() for url in config['urls']
+                if not self._is_fresh(url, school, self._refresh_days(url, config))]
+
+    def estimate_seconds(self, school: str, config: dict) -> float:
+        """Expected run time of a school: 0 when all its pages are fresh, else its recorded average."""
+        if not config.get('pdfs') and all(
+                self._is_fresh(url, school, self._refresh_days(url, config)) for url in config['urls']):
+            return 0.0
+        return self.state.get('schools', {}).get(school, {}).get('seconds', DEFAULT_SCHOOL_SECONDS)
+
+    def schedule(self, schools: Dict[str, dict], budget: Optional[float] = None) -> tuple:
+        """Order schools longest-first, deferring low-value refreshes past the budget.
+
+        Schools never scraped always run. Refreshes are kept in order of value
+        per estimated second, value being (last tech yield + 1) x days since
+        the school was last scraped, while their estimates fit in the budget.
 
-        try:
-            for school, config in SCHOOLS.items():
-                candidates = self.scrape_school(school, config)
-                all_candidates.extend(candidates)
-        finally:
-            # Clean up Selenium driver
-            self._close_driver()
-            # Save state for incremental scraping
-            self._save_state()
-
-        # Deduplicate by name + school
-        df = pd.DataFrame(all_candidates)
-        if not df.empty:
-            df = df.drop_duplicates(subset=['name', 'school'])
+        Returns:
+            Tuple of ({school: config} to run, longest first; [deferred schools])
+        """
+        estimates = {school: self.estimate_seconds(school, config) for school, config in schools.items()}
+        history = self.state.get('schools', {})
+        if budget is None:
+            run = list(schools)
+        else:
+            run = [school for school in schools if school not in history]
+            now = datetime.now()
+
+            def value_per_second(school):
+                age = now - datetime.fromisoformat(history[school]['last_scraped'])
+                value = (history[school].get('candidates', 0) + 1) * age.total_seconds() / 86400
+                return value / max(estimates[school], 1)
+
+            used = sum(estimates[school] for school in run)
+            for school in sorted((s for s in schools if s in history), key=value_per_second, reverse=True):
+                if used + estimates[school] <= budget:
+                    run.append(school)
+                    used += estimates[school]
+        run.sort(key=lambda school: estimates[school], reverse=True)
+        return {school: schools[school] for school in run}, [s for s in schools if s not in run]
+
+    def scrape_all(self, schools: Optional[Dict[str, dict]] = None,
+                   deadline: Optional[float] = None, resume: bool = True) -> 'pd.DataFrame':
+        """Scrape all schools (or the given subset) and return consolidated DataFrame.
+
+        Schools run longest-first. With a deadline (seconds), refreshes that do
+        not fit are deferred (see schedule), as are schools whose estimate no
+        longer fits in the time left; self.deferred lists them.
+
+        Each school's candidates go to self.sink as it finishes, and the frame
+        is read back from it. If the last run was interrupted, the schools it
+        finished are not scraped again (unless resume is False).
+        """
+        schools = SCHOOLS if schools is None else schools
+        started = time.monotonic()
+        resumed = [school for school in self.sink.start(resume) if school in schools]
+        if resumed:
+            print(f"[RESUME] {len(resumed)} school(s) already scraped by the interrupted run in {self.sink.path}")
+        run, self.deferred = self.schedule(
+            {school: config for school, config in schools.items() if school not in resumed}, deadline)
+        for school in self.deferred:
+            print(f"[DEFERRED] {school}: refresh does not fit in the {deadline / 60:.0f} min budget")
+        completed = list(resumed)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=PDF_WORKERS) as pdf_pool:
+            # Start PDF downloads/extraction up front so they overlap HTML fetching
+            self._pdf_futures = {
+                school: [pdf_pool.submit(self.scrape_pdf, school, url) for url in config['pdfs']]
+                for school, config in run.items() if config.get('pdfs')
+            }
+            try:
+                for school, config in run.items():
+                    if deadline is not None:
+                        left = deadline - (time.monotonic() - started)
+                        estimate = self.estimate_seconds(school, config)
+                        if estimate > left:
+                            print(f"\n[DEFERRED] {school}: needs ~{estimate:.0f}s, {max(left, 0):.0f}s left")
+                            for future in self._pdf_futures.pop(school, []):
+                                future.cancel()
+                            self.deferred.append(school)
+                            continue
+                    self.sink.add(school, self.scrape_school(school, config))
+                    completed.append(school)
+                self.sink.finish()
+            finally:
+                # Clean up Selenium driver
+                self._close_driver()
+                self.state['last_schedule'] = {
+                    'finished': datetime.now().isoformat(),
+                    'deadline': deadline,
+                    'seconds': round(time.monotonic() - started, 1),
+                    'completed': completed,
+                    'resumed': resumed,
+                    'deferred': self.deferred,
+                }
+                # Save state for incremental scraping
+                self._save_state()
+
+        df = self.sink.frame(schools)
 
         print(f"\n{'='*50}")
+        print(f"Completed {len(completed)} of {len(schools)} schools in {time.monotonic() - started:.0f}s")
+        if self.deferred:
+            print(f"Deferred {len(self.deferred)}: {', '.join(self.deferred)}")
         print(f"Total tech placements found: {len(df)}")
         return df
 
-    def save(self, df: pd.DataFrame, output_path: str):
+    def save(self, df: 'pd.DataFrame', output_path: str):
         """Save results to CSV with normalized company names."""
         # Create backup before overwriting
         output_file = Path(output_path)
@@ -686,24 +1456,9 @@ class EconPhDScraper:
         print(f"Saved to {output_path}")
 
 
-def main():
-    parser = argparse.ArgumentParser(description='Scrape economics PhD placement data')
-    parser.add_argument('--force', '-f', action='store_true',
-                        help='Force re-scrape all pages, ignoring cache')
-    args = parser.parse_args()
-
-    print(f"{'='*50}")
-    print("Economics PhD → Tech Placement Scraper")
-    print(f"Force mode: {args.force}")
-    print(f"{'='*50}")
-
-    scraper = EconPhDScraper(force=args.force)
-    df = scraper.scrape_all()
-
+def print_summary(df: 'pd.DataFrame'):
+    """Print per-school and top-placement summary of a scrape."""
     if not df.empty:
-        scraper.save(df, 'data/candidates.csv')
-
-        # Print summary
         print(f"\n{'='*50}")
         print("SUMMARY BY SCHOOL:")
         print(df.groupby('school').size().sort_values(ascending=False))
@@ -721,5 +1476,93 @@ def main():
         print("- All pages unchanged since last run (use --force to re-scrape)")
 
 
+def main():
+    parser = argparse.ArgumentParser(description='Scrape economics PhD placement data')
+    parser.add_argument('--force', '-f', action='store_true',
+                        help='Force re-scrape all pages, ignoring cache')
+    parser.add_argument('--schools', nargs='+', metavar='SCHOOL',
+                        help=f'Only scrape these schools (names as in {SCHOOLS_FILE.name})')
+    parser.add_argument('--shard', type=parse_shard, metavar='I/N',
+                        help=f'Scrape slice I of N of the schools, writing to {SHARD_DIR}/')
+    parser.add_argument('--merge', action='store_true',
+                        help=f'Combine the shard outputs in {SHARD_DIR}/ into data/candidates.csv')
+    parser.add_argument('--deadline', type=parse_duration, metavar='DURATION',
+                        help='Time budget (e.g. 45m, 2h): schools run longest-first and '
+                             'refreshes that do not fit are deferred to a later run')
+    parser.add_argument('--due-only', action='store_true',
+                        help='Only fetch pages due for a refresh by their observed change rate')
+    parser.add_argument('--restart', action='store_true',
+                        help='Scrape every school again instead of resuming an interrupted run '
+                             '(implied by --force)')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='Write timing spans (requests, parsing, Selenium, PDFs) to FILE as '
+                             'JSON lines and print where the time went (see tracing.py)')
+    args = parser.parse_args()
+
+    output = 'data/candidates.csv'
+    if args.merge:
+        try:
+            df = merge_shards()
+        except FileNotFoundError as e:
+            parser.error(str(e))
+        EconPhDScraper().save(df, output)
+        print_summary(df)
+        return
+
+    try:
+        schools = select_schools(SCHOOLS, args.schools, args.shard)
+    except KeyError as e:
+        parser.error(e.args[0])
+    state_file = sink_file = None
+    if args.shard:
+        output, state_file = shard_paths(args.shard)
+        sink_file = str(Path(output).with_suffix('.jsonl'))
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+
+    print(f"{'='*50}")
+    print("Economics PhD → Tech Placement Scraper")
+    print(f"Force mode: {args.force}")
+    if args.schools or args.shard:
+        shard = f" (shard {args.shard[0]}/{args.shard[1]})" if args.shard else ''
+        print(f"Schools: {len(schools)} of {len(SCHOOLS)}{shard}")
+    if args.deadline:
+        print(f"Deadline: {args.deadline / 60:.0f} min")
+    if args.trace:
+        print(f"Tracing to: {args.trace}")
+    tracer = Tracer(args.trace)
+    scraper = EconPhDScraper(force=args.force, state_file=state_file, due_only=args.due_only, tracer=tracer,
+                             sink_file=sink_file)
+    if args.due_only:
+        pages = sum(len(config['urls']) for config in schools.values())
+        print(f"Due pages: {len(scraper.due_pages(schools))} of {pages}")
+    print(f"{'='*50}")
+
+    df = scraper.scrape_all(schools, deadline=args.deadline, resume=not (args.restart or args.force))
+
+    # Deferred schools keep their rows from the last full output
+    completed = [school for school in schools if school not in scraper.deferred]
+    previous = 'data/candidates.csv'
+    if Path(previous).exists() and ((args.schools and not args.shard) or scraper.deferred):
+        import pandas as pd
+        existing = pd.read_csv(previous)
+        if args.schools and not args.shard:
+            # Replace only the scraped schools' rows
+            kept = existing[~existing['school'].isin(completed)]
+        else:
+            kept = existing[existing['school'].isin(scraper.deferred)]
+        df = pd.concat([kept, df], ignore_index=True)
+
+    if args.shard:
+        # Written even when empty, so --merge can tell the shard finished
+        scraper.save(df if not df.empty else df.reindex(columns=['name', 'school']), output)
+    elif not df.empty:
+        scraper.save(df, output)
+
+    print_summary(df)
+    if args.trace:
+        tracer.close()
+        print_report(tracer.spans)
+
+
 if __name__ == "__main__":
     main()
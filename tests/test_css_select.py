@@ -0,0 +1,40 @@
+"""Tests for the compiled CSS selector subset used by the generic card parser."""
+
+import sys
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from css_select import compile_selector, select, select_one  # noqa: E402
+
+PAGE = """<html><body>
+<div class="view-content">
+  <div class="views-row"><article class="node person-teaser">
+    <h3><a href="/jane">Jane Doe</a></h3><div class="field--name-field-placement">Google</div>
+  </article></div>
+  <div class="views-row"><figure role="group"><figcaption><a>John Roe</a></figcaption></figure></div>
+</div>
+<section data-year="2024"><ul><li class="person">Ana Lopez - Amazon</li></ul></section>
+<div class="Person profile-card">Wei Chen</div>
+</body></html>"""
+
+SELECTORS = [
+    '.views-row', 'article', 'figure[role="group"]', '.view-content > div',
+    'div[class*="person"]', 'li.person', '[data-year]', 'h2 a, h3 a, figcaption a, .title',
+    'section ul > li', 'body > div > div article h3', '.profile-card.Person',
+    # Not in the compiled subset: fall back to soupsieve
+    'a[href^="/"]', 'h3 + div', 'li:first-child',
+]
+
+
+def test_compiled_selectors_match_soupsieve():
+    """Verify compiled predicates select the same tags as soupsieve."""
+    soup = BeautifulSoup(PAGE, 'lxml')
+    for selector in SELECTORS:
+        matches = compile_selector(selector)
+        assert select(soup, matches) == soup.select(selector), selector
+        for el in soup.find_all(True):
+            assert select_one(el, matches) == el.select_one(selector), selector
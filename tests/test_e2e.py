@@ -42,3 +42,33 @@ def test_charts_generates_files():
         filepath = CHARTS_DIR / filename
         assert filepath.exists(), f"Missing chart: {filename}"
         assert filepath.stat().st_size > 0, f"Empty chart: {filename}"
+
+
+def test_charts_parallel_matches_serial():
+    """Verify parallel rendering writes the same files as a serial run."""
+    serial = subprocess.run([sys.executable, ROOT / "charts.py", "--force"], capture_output=True, text=True)
+    assert serial.returncode == 0, f"charts.py failed: {serial.stderr}"
+    serial_bytes = {p.name: p.read_bytes() for p in CHARTS_DIR.glob("*.png")}
+
+    parallel = subprocess.run(
+        [sys.executable, ROOT / "charts.py", "--jobs", "2", "--force"],
+        capture_output=True,
+        text=True,
+    )
+    assert parallel.returncode == 0, f"charts.py --jobs 2 failed: {parallel.stderr}"
+    # Everything before the timing report must match
+    assert parallel.stdout.split("Rebuilt")[0] == serial.stdout.split("Rebuilt")[0]
+
+    for name, content in serial_bytes.items():
+        assert (CHARTS_DIR / name).read_bytes() == content, f"Chart differs: {name}"
+
+
+def test_charts_skips_unchanged():
+    """Verify a second run redraws nothing when data and code are unchanged."""
+    first = subprocess.run([sys.executable, ROOT / "charts.py"], capture_output=True, text=True)
+    assert first.returncode == 0, f"charts.py failed: {first.stderr}"
+
+    second = subprocess.run([sys.executable, ROOT / "charts.py"], capture_output=True, text=True)
+    assert second.returncode == 0, f"charts.py failed: {second.stderr}"
+    assert "Rebuilt 0 of" in second.stdout
+    assert "heatmap.png (unchanged)" in second.stdout
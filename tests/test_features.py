@@ -0,0 +1,54 @@
+"""Tests for the shared derived-features frame."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from features import build_features, load_features  # noqa: E402
+
+
+def _sample() -> pd.DataFrame:
+    return pd.DataFrame({
+        'name': ['A One', 'Korkut', 'C Three', 'D Four'],
+        'school': ['MIT', 'Yale', 'MIT', 'NYU'],
+        'graduation_year': [2018, 2020, 2022, 2023],
+        'initial_placement': ['Amazon', 'Uber', 'Amazon', 'Google'],
+        'current_company': ['Amazon ', None, 'Meta', '0'],
+        'current_role': ['Senior Economist', 'Principal Consultant', 'Director of Science', ''],
+        'research_fields': ['IO, Economics, Labor', None, 'Macro', ''],
+        'work_focus': ['Pricing', 'Unknown', None, None],
+        'team': ['Marketplace', 'Ads', None, None],
+    })
+
+
+def test_build_features_derived_columns():
+    """Derived columns follow the row-wise rules used by charts and analyses."""
+    f = build_features(_sample())
+
+    assert f['moved'].tolist() == [False, False, True, False]
+    assert f['current_co'].tolist()[1] == 'Uber'
+    assert f['seniority'].tolist() == ['Senior', 'Entry/IC', 'Director', None]
+    assert f['company_size'].tolist() == [2, 1, 2, 1]
+    assert f['field_list'].tolist() == [['IO', 'Labor'], [], ['Macro'], []]
+    assert f['work_text'].tolist() == ['Pricing Marketplace', 'Unknown Ads', None, None]
+    assert f['work_phrase_text'].tolist() == ['Pricing', 'Ads', None, None]
+
+
+def test_load_features_caches_by_file_hash(tmp_path, monkeypatch):
+    """Same file content hits the cache; changed content is recomputed."""
+    import features
+    monkeypatch.setattr(features, 'CACHE_DIR', tmp_path / 'cache')
+
+    csv = tmp_path / 'candidates.csv'
+    _sample().to_csv(csv, index=False)
+
+    first = load_features(csv, persist=True)
+    assert load_features(csv, persist=True) is first
+    assert list((tmp_path / 'cache').glob('features_candidates_*.pkl'))
+
+    _sample().iloc[:2].to_csv(csv, index=False)
+    assert len(load_features(csv)) == 2
@@ -0,0 +1,63 @@
+"""Tests for the shared HTTP client."""
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from http_client import HttpClient  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    """Local HTTP/1.1 server recording client ports; /flaky fails with 503 once."""
+    ports = []
+    failed = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            ports.append(self.client_address[1])
+            status = 200
+            if self.path == '/flaky' and not failed:
+                failed.append(self.path)
+                status = 503
+            body = b'x' * 2000
+            self.send_response(status)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Retry-After', '0')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}", ports
+    httpd.shutdown()
+
+
+def test_connections_are_reused_and_transient_errors_retried(server):
+    """Verify keep-alive reuses one connection, a 503 is retried and each request is timed."""
+    base, ports = server
+    client = HttpClient()
+    for path in ('/a', '/b', '/flaky'):
+        response = client.get(base + path)
+        assert response.status_code == 200 and len(response.content) == 2000
+
+    assert len(ports) == 4 and len(set(ports)) == 1  # the 503 retry included
+    assert [(t.url[-2:], t.status, t.bytes) for t in client.timings] == [
+        ('/a', 200, 2000), ('/b', 200, 2000), ('ky', 200, 2000)]
+    assert client.timings[0].connect > 0 and client.timings[1].connect == 0  # setup paid once
+    assert 0 < client.timings[1].ttfb <= client.timings[1].seconds
+    with client.get(base + '/big', stream=True) as response:
+        assert b''.join(response.iter_content(chunk_size=512)) == b'x' * 2000
+    assert client.timings[-1].bytes is None
+    assert client.summary()[base.split('//')[1]]['requests'] == 4
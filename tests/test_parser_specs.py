@@ -0,0 +1,62 @@
+"""Tests for the parser registry and declarative specs."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from parsers import CUSTOM_PARSERS, SchoolParser  # noqa: E402
+
+PAGE = """<html><body>
+<h3>2023 Placements</h3>
+<table>
+<tr><th>Student</th><th>Research</th><th>Initial Placement</th></tr>
+<tr><td>Jane Doe</td><td>IO</td><td>Amazon</td></tr>
+</table>
+<h3>Job Market</h3>
+<table><tr><th>Name</th><th>Year</th><th>Placement</th></tr><tr><td>John Roe</td><td>2022</td><td>Google</td></tr></table>
+<div class="person"><h3>Maria Khan</h3><p class="placement">Uber 2024</p></div>
+<div class="person"><h3>Economics Department</h3></div>
+<details><summary>Class of 2021</summary><ul><li>Wei Chen - Federal Reserve</li></ul></details>
+</body></html>"""
+
+
+def test_specs_extract_tables_cards_and_sections():
+    """Verify spec strategies find columns by keyword, apply heading years and skip words."""
+    soup = BeautifulSoup(PAGE, 'lxml')
+    duke, produced = CUSTOM_PARSERS['Duke'].run_strategies(soup)
+    assert [(c['name'], c['initial_placement'], c['graduation_year']) for c in duke] == [
+        ('Jane Doe', 'Amazon', 2024), ('John Roe', 'Google', 2022),  # no year: default
+        ('Maria Khan', 'Uber 2024', 2024), ('Wei Chen', 'Federal Reserve', 2021)]
+    assert produced == ['tables', 'cards', 'year_sections']
+    assert duke[0]['research_fields'] == 'IO'
+
+    # Columbia's tables take the year of the <h3> before them, even without one
+    columbia = CUSTOM_PARSERS['Columbia'].run_strategies(soup, only=['tables'])[0]
+    assert [(c['name'], c['graduation_year']) for c in columbia] == [('Jane Doe', 2023), ('John Roe', 2022)]
+
+
+def test_bad_spec_fails_when_class_is_defined():
+    """Verify misspelled spec parameters are rejected at import, not on first parse."""
+    with pytest.raises(ValueError, match='skip_word'):
+        class BadParser(SchoolParser):
+            STRATEGIES = (('cards', '.person', {'kind': 'card', 'skip_word': ['x']}),)
+            school_name = 'Bad'
+
+
+def test_registry_imports_parsers_on_first_use():
+    """Verify importing the package loads no school module until one is looked up."""
+    code = (
+        "import sys, parsers\n"
+        "loaded = lambda: sorted(m for m in sys.modules if m.startswith('parsers.') and m[8:] not in ('base', 'spec'))\n"
+        "assert loaded() == [] and 'Duke' in parsers.CUSTOM_PARSERS and len(parsers.available_schools()) == 24\n"
+        "assert parsers.get_parser('Duke') is parsers.CUSTOM_PARSERS['Duke'] and parsers.get_parser('Rice') is None\n"
+        "print(loaded())\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "['parsers.duke']"
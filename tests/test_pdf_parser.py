@@ -0,0 +1,181 @@
+"""Tests for cached PDF downloads and extraction."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+import pdf_parser  # noqa: E402
+
+PDF_BYTES = b'%PDF-1.4 fake placement history'
+
+
+class FakeResponse:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        self.headers = {'content-type': 'application/pdf', 'etag': '"v1"'}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        yield PDF_BYTES[:10]
+        yield PDF_BYTES[10:]
+
+
+def test_unchanged_pdf_reuses_download_and_candidates(tmp_path, monkeypatch):
+    """Verify a 304 response reuses the cached file and extracted candidates."""
+    monkeypatch.setattr(pdf_parser, 'PDF_CACHE_DIR', tmp_path)
+    requests_seen = []
+
+    def fake_get(url, headers, **kwargs):
+        requests_seen.append(headers)
+        return FakeResponse(304 if headers.get('If-None-Match') == '"v1"' else 200)
+
+    parsed = []
+
+    def fake_iter_candidates(self, path):
+        parsed.append(Path(path).read_bytes())
+        return iter([{'name': 'Jane Doe', 'initial_placement': 'Amazon'}])
+
+    monkeypatch.setattr(pdf_parser.get_client(), 'get', fake_get)
+    monkeypatch.setattr(pdf_parser.PDFPlacementParser, 'iter_candidates', fake_iter_candidates)
+
+    parser = pdf_parser.PDFPlacementParser('Test U')
+    first = parser.parse_url('https://example.edu/placements.pdf')
+    second = parser.parse_url('https://example.edu/placements.pdf')
+
+    assert first == second == [{'name': 'Jane Doe', 'initial_placement': 'Amazon'}]
+    assert parsed == [PDF_BYTES]  # extracted once, from the streamed file
+    assert requests_seen[1] == {'If-None-Match': '"v1"'}
+
+
+def test_failed_parse_is_retried_and_non_pdf_downloads_are_not_cached(tmp_path, monkeypatch):
+    """Verify a parse error caches no results and an HTML body never enters the PDF cache."""
+    monkeypatch.setattr(pdf_parser, 'PDF_CACHE_DIR', tmp_path)
+    monkeypatch.setattr(pdf_parser.get_client(), 'get', lambda url, headers, **kwargs: FakeResponse(200))
+    attempts = []
+
+    def flaky_iter_candidates(self, path):
+        attempts.append(path)
+        if len(attempts) == 1:
+            raise RuntimeError('transient extraction failure')
+        return iter([{'name': 'Jane Doe', 'initial_placement': 'Amazon'}])
+
+    monkeypatch.setattr(pdf_parser.PDFPlacementParser, 'iter_candidates', flaky_iter_candidates)
+    parser = pdf_parser.PDFPlacementParser('Test U')
+    assert parser.parse_url('https://example.edu/placements.pdf') == []
+    assert parser.parse_url('https://example.edu/placements.pdf') == [{'name': 'Jane Doe', 'initial_placement': 'Amazon'}]
+    assert len(attempts) == 2
+
+    class HTMLResponse(FakeResponse):
+        def iter_content(self, chunk_size):
+            yield b'<html>Sign in to Box</html>'
+
+    monkeypatch.setattr(pdf_parser.get_client(), 'get', lambda url, headers, **kwargs: HTMLResponse(200))
+    assert parser.fetch_pdf_file('https://example.edu/other.pdf') is None
+    assert not list(tmp_path.glob('*.part'))
+    assert 'https://example.edu/other.pdf' not in parser._load_index()
+
+
+def _write_pdf(path: Path, pages: list):
+    """Write a text-only PDF, one list of lines per page."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    with matplotlib.rc_context({'pdf.fonttype': 42}), PdfPages(path) as pdf:
+        for lines in pages:
+            fig = plt.figure(figsize=(8.5, 11))
+            for i, line in enumerate(lines):
+                fig.text(0.1, 0.9 - i * 0.04, line, fontsize=10)
+            pdf.savefig(fig)
+            plt.close(fig)
+
+
+def test_page_parallel_extraction_carries_sections_across_pages(tmp_path, monkeypatch):
+    """Verify year/section state crosses page breaks and parallel matches serial."""
+    path = tmp_path / 'placements.pdf'
+    _write_pdf(path, [
+        ['2023 – 2024', 'Private Sector', 'Amazon (2) labor economics Jane Doe'],
+        ['Google industrial organization John Roe'],  # continues the section
+        ['Academic Positions', 'Google macro Not Counted'],
+    ])
+    monkeypatch.setattr(pdf_parser, 'MIN_PARALLEL_PAGES', 1)
+
+    serial = pdf_parser.PDFPlacementParser('Test U').parse_pdf(path)
+    parallel = pdf_parser.PDFPlacementParser('Test U', page_workers=2).parse_pdf(path)
+
+    assert [(c['name'], c['graduation_year']) for c in serial] == [('Jane Doe', 2023), ('John Roe', 2023)]
+    assert parallel == serial
+
+
+def test_text_first_matches_full_extraction(tmp_path):
+    """Verify skipping table detection on unruled pages changes no candidates."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    path = tmp_path / 'mixed.pdf'
+    with PdfPages(path) as pdf:
+        fig, ax = plt.subplots(figsize=(8.5, 11))
+        ax.axis('off')
+        ax.table(cellText=[['Name', 'Year', 'Placement'], ['Jane Doe', '2022', 'Google']], loc='center')
+        pdf.savefig(fig)
+        plt.close(fig)
+    text_path = tmp_path / 'text.pdf'
+    _write_pdf(text_path, [['2023 – 2024', 'Private Sector', 'Amazon (2) labor economics John Roe']])
+
+    for source in (path, text_path):
+        full = pdf_parser._extract_pages(str(source), 0, None, text_first=False)
+        fast = pdf_parser._extract_pages(str(source), 0, None, text_first=True)
+        parser = pdf_parser.PDFPlacementParser('Test U')
+        assert [bool(tables) for tables, _ in fast] == [bool(tables) for tables, _ in full]
+        assert parser.parse_pages(fast) == parser.parse_pages(full)
+        assert parser.parse_pages(fast)
+
+
+def test_candidates_stream_page_by_page(tmp_path, monkeypatch):
+    """Verify candidates are yielded before later pages are extracted."""
+    path = tmp_path / 'placements.pdf'
+    _write_pdf(path, [['2023 – 2024', 'Private Sector', f'Amazon labor Person{i} Doe'] for i in range(3)])
+
+    extracted = []
+    iter_pages = pdf_parser.iter_pages
+
+    def tracking_iter_pages(*args, **kwargs):
+        for page in iter_pages(*args, **kwargs):
+            extracted.append(page)
+            yield page
+
+    monkeypatch.setattr(pdf_parser, 'iter_pages', tracking_iter_pages)
+    candidates = pdf_parser.PDFPlacementParser('Test U').iter_candidates(path)
+
+    assert next(candidates)['name'] == 'Person0 Doe'
+    assert len(extracted) == 1
+    assert [c['name'] for c in candidates] == ['Person1 Doe', 'Person2 Doe']
+
+
+def test_parse_text_single_pass_formats():
+    """Verify longest company prefix wins and separator matches skip names already found."""
+    parser = pdf_parser.PDFPlacementParser('Test U')
+    text = '\n'.join([
+        '2023 – 2024',
+        'Private Sector',
+        'Squarepoint Capital macro Jane Doe',
+        'Jane Doe - Google',  # already found in the company-first format
+        'John Roe - Amazon',
+        'John Roe: Meta',  # duplicate within the separator format
+    ])
+    candidates = parser._parse_text(text)
+    assert [(c['name'], c['initial_placement']) for c in candidates] == [
+        ('Jane Doe', 'Squarepoint'), ('John Roe', 'Amazon')]
@@ -0,0 +1,92 @@
+"""Tests for the pipeline orchestrator's skipping and frame handoff."""
+
+import sys
+from functools import partial
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from pipeline import run_pipeline, stage_dependencies  # noqa: E402
+
+
+def _load(src, out, frames):
+    df = pd.read_csv(src)
+    df['x'] = df['x'] * 2
+    df.to_csv(out, index=False)
+    # Marker column that only exists in memory, never on disk
+    return {out: df.assign(in_memory=True)}
+
+
+def _total(inp, out, frames):
+    df = frames[inp]
+    pd.DataFrame({'total': [df['x'].sum()], 'in_memory': ['in_memory' in df.columns]}).to_csv(out, index=False)
+    return {}
+
+
+def _count(inp, out, frames):
+    pd.DataFrame({'count': [len(frames[inp])]}).to_csv(out, index=False)
+    return {}
+
+
+def _stages(tmp_path: Path) -> dict:
+    src, a, b, c = (str(tmp_path / name) for name in ('src.csv', 'a.csv', 'b.csv', 'c.csv'))
+    return {
+        'load': {'inputs': [src], 'outputs': [a], 'run': partial(_load, src, a)},
+        'total': {'inputs': [a], 'outputs': [b], 'run': partial(_total, a, b)},
+        'count': {'inputs': [a], 'outputs': [c], 'run': partial(_count, a, c)},
+    }
+
+
+def test_pipeline_skips_unchanged_stages(tmp_path):
+    """Verify stages rerun only when their inputs or outputs change."""
+    pd.DataFrame({'x': [1, 2, 3]}).to_csv(tmp_path / 'src.csv', index=False)
+    stages = _stages(tmp_path)
+    state = tmp_path / 'state.json'
+
+    assert stage_dependencies(stages) == {'load': [], 'total': ['load'], 'count': ['load']}
+
+    results = run_pipeline(stages, state_path=state)
+    assert {name: status for name, (status, _) in results.items()} == {
+        'load': 'ran', 'total': 'ran', 'count': 'ran'}
+    total = pd.read_csv(tmp_path / 'b.csv')
+    assert total['total'][0] == 12
+    assert total['in_memory'][0]  # frame was handed over, not re-read from disk
+
+    results = run_pipeline(stages, state_path=state)
+    assert all(status == 'unchanged' for status, _ in results.values())
+
+    # Deleting an output reruns only the stage that wrote it
+    (tmp_path / 'c.csv').unlink()
+    results = run_pipeline(stages, state_path=state)
+    assert [name for name, (status, _) in results.items() if status == 'ran'] == ['count']
+
+    # Changing the source reruns everything downstream
+    pd.DataFrame({'x': [1, 2, 3, 4]}).to_csv(tmp_path / 'src.csv', index=False)
+    results = run_pipeline(stages, jobs=2, state_path=state)
+    assert all(status == 'ran' for status, _ in results.values())
+    assert pd.read_csv(tmp_path / 'b.csv')['total'][0] == 20
+    assert pd.read_csv(tmp_path / 'c.csv')['count'][0] == 4
+
+
+def test_pipeline_blocks_downstream_of_failure(tmp_path):
+    """Verify a failing stage blocks its dependents without aborting the run."""
+    stages = _stages(tmp_path)  # src.csv missing, so 'load' raises
+    results = run_pipeline(stages, state_path=tmp_path / 'state.json')
+    assert results['load'][0] == 'failed'
+    assert results['total'][0] == 'blocked'
+    assert results['count'][0] == 'blocked'
+
+
+def test_outputs_a_stage_did_not_write_do_not_force_reruns(tmp_path):
+    """Verify an output left unwritten (e.g. a chart without data) still counts as current."""
+    pd.DataFrame({'x': [1]}).to_csv(tmp_path / 'src.csv', index=False)
+    stages = _stages(tmp_path)
+    stages['count']['outputs'].append(str(tmp_path / 'never_written.png'))
+    state = tmp_path / 'state.json'
+
+    run_pipeline(stages, state_path=state)
+    results = run_pipeline(stages, state_path=state)
+    assert all(status == 'unchanged' for status, _ in results.values())
@@ -0,0 +1,398 @@
+"""Tests for incremental scraping with the parse-result cache."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+import scraper  # noqa: E402
+
+PAGE = """<html><body>
+<table>
+<tr><th>Name</th><th>Fields</th><th>Placement</th></tr>
+<tr><td>Jane Doe</td><td>IO</td><td>Amazon 2024</td></tr>
+<tr><td>John Roe</td><td>Labor</td><td>Princeton University 2024</td></tr>
+</table>
+""" + "<p>filler</p>" * 200 + "</body></html>"
+
+
+class FakeResponse:
+    text = PAGE
+    status_code = 200
+    headers = {'content-type': 'text/html; charset=utf-8'}
+
+    @property
+    def content(self):
+        return self.text.encode()
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def isolated(tmp_path, monkeypatch):
+    """Point scraper state and caches at tmp_path and stub out network and sleeps."""
+    monkeypatch.setattr(scraper, 'SCRAPE_STATE_FILE', str(tmp_path / 'state.json'))
+    monkeypatch.setattr(scraper, 'RAW_HTML_DIR', str(tmp_path / 'raw'))
+    monkeypatch.setattr(scraper, 'PARSE_CACHE_DIR', str(tmp_path / 'parsed'))
+    monkeypatch.setattr(scraper, 'CANDIDATE_SINK', str(tmp_path / 'candidates.jsonl'))
+    monkeypatch.setattr(scraper.time, 'sleep', lambda seconds: None)
+
+
+def _scraper(monkeypatch):
+    s = scraper.EconPhDScraper()
+    monkeypatch.setattr(s.session, 'get', lambda url, timeout: FakeResponse())
+    return s
+
+
+def test_unchanged_pages_served_from_parse_cache(isolated, monkeypatch):
+    """Verify an unchanged page keeps its candidates without re-parsing or Selenium."""
+    config = {'urls': ['https://example.edu/placement']}
+
+    first = _scraper(monkeypatch)
+    candidates = first.scrape_school('Nowhere State', config)
+    first._save_state()
+    assert [c['name'] for c in candidates] == ['Jane Doe']
+
+    second = _scraper(monkeypatch)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unchanged page should not be re-parsed or rendered")
+
+    monkeypatch.setattr(second, 'parse_page', fail)
+    monkeypatch.setattr(second, 'fetch_page_selenium', fail)
+    assert second.scrape_school('Nowhere State', config) == candidates
+
+
+def test_js_rendered_page_parse_is_cached_against_static_page(isolated, monkeypatch):
+    """Verify a page rendered with Selenium is not rendered again while its static HTML is unchanged."""
+    config = {'urls': ['https://example.edu/placement']}
+    monkeypatch.setattr(FakeResponse, 'text', '<html><body>Loading...</body></html>')
+
+    first = _scraper(monkeypatch)
+    monkeypatch.setattr(first, 'fetch_page_selenium', lambda url, wait_for: scraper.build_soup(PAGE.encode()))
+    candidates = first.scrape_school('Nowhere State', config)
+    first._save_state()
+    assert [c['name'] for c in candidates] == ['Jane Doe']
+    assert first.state['pages'][config['urls'][0]]['strategies'] == ['generic:tables']
+
+    second = _scraper(monkeypatch)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unchanged JS page should be served from the parse cache")
+
+    monkeypatch.setattr(second, 'parse_page', fail)
+    monkeypatch.setattr(second, 'fetch_page_selenium', fail)
+    assert second.scrape_school('Nowhere State', config) == candidates
+
+
+def test_remembered_strategy_runs_alone_until_layout_changes(isolated, monkeypatch):
+    """Verify a page's productive strategy is reused and the full pass returns on a layout change."""
+    config = {'urls': ['https://example.edu/placement']}
+    first = _scraper(monkeypatch)
+    first.scrape_school('Nowhere State', config)
+    first._save_state()
+    assert first.state['pages'][config['urls'][0]]['strategies'] == ['generic:tables']
+
+    # New content, same layout: only the table strategy runs
+    second = _scraper(monkeypatch)
+    monkeypatch.setattr(FakeResponse, 'text', PAGE.replace('Jane Doe', 'Jane Q Doe'))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unproductive strategies should be skipped")
+
+    monkeypatch.setattr(second, '_parse_cards', fail)
+    monkeypatch.setattr(second, '_parse_year_lists', fail)
+    assert [c['name'] for c in second.scrape_school('Nowhere State', config)] == ['Jane Q Doe']
+    second._save_state()
+
+    # Table replaced by cards: the remembered strategy finds nothing, so all run
+    third = _scraper(monkeypatch)
+    cards = '<div class="person"><h3>Jane Doe</h3><p class="placement">Google 2024</p></div>'
+    monkeypatch.setattr(FakeResponse, 'text', PAGE.split('<table>')[0] + cards + PAGE.split('</table>')[1])
+    assert [c['name'] for c in third.scrape_school('Nowhere State', config)] == ['Jane Doe']
+    assert third.state['pages'][config['urls'][0]]['strategies'] == ['generic:cards']
+
+
+def test_build_soup_prunes_page_chrome_and_decodes_bytes():
+    """Verify menus, scripts and page headers are dropped but card headers and encodings kept."""
+    html = """<html><head><meta charset="windows-1252"><script>var x = 1;</script></head><body>
+    <header><nav><ul><li>Jane Menu - Google</li></ul></nav></header>
+    <form class="search"><input name="q"></form>
+    <article class="person"><header><h3>Jos\xe9 Garc\xeda</h3></header><p class="placement">Google</p></article>
+    <footer><ul><li>Contact - Amazon</li></ul></footer>
+    </body></html>"""
+    soup = scraper.build_soup(html.encode('windows-1252'))
+
+    assert soup.select('script, nav, form, footer') == []
+    assert soup.select_one('article h3').get_text() == 'Jos\xe9 Garc\xeda'
+    s = scraper.EconPhDScraper.__new__(scraper.EconPhDScraper)
+    assert [c['name'] for c in s._parse_year_lists(soup, 'X') + s._parse_cards(soup, 'X')] == ['Jos\xe9 Garc\xeda']
+
+
+def test_recently_fetched_pages_are_not_refetched(isolated, monkeypatch):
+    """Verify pages fetched within refresh_days come from the parse cache without a request."""
+    config = {'urls': ['https://example.edu/placement'], 'refresh_days': 1}
+    first = _scraper(monkeypatch)
+    candidates = first.scrape_school('Nowhere State', config)
+    first._save_state()
+
+    second = scraper.EconPhDScraper()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("fresh page should not be fetched")
+
+    monkeypatch.setattr(second.session, 'get', fail)
+    assert second.scrape_school('Nowhere State', config) == candidates
+
+
+def test_shards_partition_schools_and_merge(tmp_path):
+    """Verify shards split the registry deterministically and --merge needs every shard."""
+    import pandas as pd
+
+    schools = {f'School {i}': {'urls': [f'https://s{i}.edu']} for i in range(10)}
+    shards = [scraper.select_schools(schools, shard=(i, 3)) for i in (1, 2, 3)]
+    assert sorted(name for shard in shards for name in shard) == sorted(schools)
+    assert [len(shard) for shard in shards] == [4, 3, 3]
+    reordered = dict(reversed(list(schools.items())))
+    assert [scraper.select_schools(reordered, shard=(i, 3)) for i in (1, 2, 3)] == shards
+
+    row = {'name': 'Jane Doe', 'school': 'School 1', 'initial_placement': 'Amazon'}
+    pd.DataFrame([row]).to_csv(tmp_path / 'candidates-1-of-2.csv', index=False)
+    with pytest.raises(FileNotFoundError, match='Missing shard'):
+        scraper.merge_shards(tmp_path)
+    pd.DataFrame([row, dict(row, name='John Roe')]).to_csv(tmp_path / 'candidates-2-of-2.csv', index=False)
+    assert sorted(scraper.merge_shards(tmp_path)['name']) == ['Jane Doe', 'John Roe']
+
+
+def test_scrapers_sharing_a_state_file_keep_each_others_pages(isolated, monkeypatch):
+    """Verify saving state merges this scraper's pages into the file instead of overwriting it."""
+    first, second = _scraper(monkeypatch), _scraper(monkeypatch)
+    first.scrape_school('Nowhere State', {'urls': ['https://example.edu/a']})
+    second.scrape_school('Nowhere State', {'urls': ['https://example.edu/b']})
+    first._save_state()
+    second._save_state()
+    assert sorted(scraper.EconPhDScraper().state['pages']) == ['https://example.edu/a', 'https://example.edu/b']
+
+
+def test_schedule_runs_longest_first_and_defers_low_value_refreshes(isolated, monkeypatch):
+    """Verify recorded timings order schools and a budget defers the least valuable refreshes."""
+    s = _scraper(monkeypatch)
+    s.scrape_school('Nowhere State', {'urls': ['https://example.edu/placement']})
+    assert s.state['pages']['https://example.edu/placement']['candidates'] == 2
+    assert s.state['schools']['Nowhere State']['candidates'] == 1
+
+    week_ago, yesterday = '2020-01-01T00:00:00', '2020-01-07T00:00:00'
+    s.state['schools'] = {
+        'Slow': {'seconds': 300, 'candidates': 14, 'last_scraped': week_ago},
+        'Stale': {'seconds': 60, 'candidates': 1, 'last_scraped': week_ago},
+        'Recent': {'seconds': 60, 'candidates': 1, 'last_scraped': yesterday},
+    }
+    schools = {name: {'urls': [f'https://{name}.edu']} for name in ('Recent', 'New', 'Stale', 'Slow')}
+    run, deferred = s.schedule(schools)
+    assert list(run) == ['Slow', 'Recent', 'Stale', 'New'] and deferred == []
+
+    run, deferred = s.schedule(schools, budget=400)
+    assert list(run) == ['Slow', 'Stale', 'New'] and deferred == ['Recent']
+
+
+def test_refresh_interval_follows_observed_changes(isolated, monkeypatch):
+    """Verify pages track their changes and --due-only skips those not due yet."""
+    from datetime import datetime, timedelta
+
+    now = datetime(2025, 6, 1)
+    ago = lambda days: (now - timedelta(days=days)).isoformat()  # noqa: E731
+    yearly = {'first_checked': ago(400), 'changes': [ago(300)]}
+    weekly = {'first_checked': ago(400), 'changes': [ago(d) for d in range(2, 60, 7)]}
+    assert scraper.page_refresh_days(yearly, now) == scraper.MAX_REFRESH_DAYS
+    assert 3 < scraper.page_refresh_days(weekly, now) < 4
+    assert scraper.page_refresh_days({}, now) == scraper.MIN_REFRESH_DAYS
+
+    config = {'urls': ['https://example.edu/placement']}
+    first = _scraper(monkeypatch)
+    first.scrape_school('Nowhere State', config)
+    monkeypatch.setattr(FakeResponse, 'text', PAGE.replace('Jane Doe', 'Jane Q Doe'))
+    first.scrape_school('Nowhere State', config)
+    page = first.state['pages'][config['urls'][0]]
+    assert page['checks'] == 2 and len(page['changes']) == 1
+    page['changes'], page['first_checked'] = [], ago(1000)  # long unchanged
+    first._save_state()
+
+    assert _scraper(monkeypatch).due_pages({'Nowhere State': config}) == config['urls']
+    assert scraper.EconPhDScraper(due_only=True).due_pages({'Nowhere State': config}) == []
+
+
+def test_dead_host_trips_breaker_without_browser_retries(isolated, monkeypatch):
+    """Verify network failures skip Selenium and the host's other pages, and open its breaker."""
+    import requests
+
+    config = {'urls': ['https://down.edu/a', 'https://down.edu/b']}
+    calls = []
+
+    def refuse(url, timeout):
+        calls.append(url)
+        raise requests.ConnectionError('refused')
+
+    def no_browser(*args, **kwargs):
+        raise AssertionError("a dead host should not reach Selenium")
+
+    for run in range(scraper.BREAKER_FAILURES):
+        s = scraper.EconPhDScraper()
+        monkeypatch.setattr(s.session, 'get', refuse)
+        monkeypatch.setattr(s, '_get_selenium_driver', no_browser)
+        assert s.scrape_school('Down State', config) == []
+        s._save_state()
+    assert len(calls) == scraper.BREAKER_FAILURES  # one request per run
+    assert s.state['hosts']['down.edu']['open_until']
+
+    # Open: not contacted at all until the cool-down ends
+    s = scraper.EconPhDScraper()
+    monkeypatch.setattr(s.session, 'get', refuse)
+    s.scrape_school('Down State', config)
+    assert len(calls) == scraper.BREAKER_FAILURES
+
+    # Back up after the cool-down: one success closes the breaker
+    s.state['hosts']['down.edu']['open_until'] = '2020-01-01T00:00:00'
+    monkeypatch.setattr(s.session, 'get', lambda url, timeout: FakeResponse())
+    s.scrape_school('Down State', config)
+    assert s.state['hosts']['down.edu']['failures'] == 0
+    assert len(s.state['hosts']['down.edu']['history']) == scraper.BREAKER_FAILURES
+
+
+def test_timeouts_skip_a_host_only_after_repeated_failures(isolated, monkeypatch):
+    """Verify one timeout leaves the host's other pages fetched and BREAKER_FAILURES in a row skip it."""
+    import requests
+
+    config = {'urls': [f'https://slow.edu/{page}' for page in 'abcde']}
+    calls = []
+
+    def timeout_once(url, timeout):
+        calls.append(url)
+        if len(calls) == 1:
+            raise requests.ReadTimeout('timed out')
+        return FakeResponse()
+
+    s = _scraper(monkeypatch)
+    monkeypatch.setattr(s.session, 'get', timeout_once)
+    s.scrape_school('Slow State', config)
+    assert sorted(calls) == config['urls']
+    assert 'slow.edu' not in s._unreachable
+
+    def always_timeout(url, timeout):
+        calls.append(url)
+        raise requests.ReadTimeout('timed out')
+
+    calls.clear()
+    s = _scraper(monkeypatch)
+    monkeypatch.setattr(s.session, 'get', always_timeout)
+    assert s.scrape_school('Slow State', {'urls': [f'https://slower.edu/{page}' for page in 'abcde']}) == []
+    assert len(calls) == scraper.BREAKER_FAILURES
+    assert 'slower.edu' in s._unreachable
+
+
+def test_host_limiter_adapts_to_latency_errors_and_retry_after(monkeypatch):
+    """Verify healthy responses raise a host's limit and 429s, 5xx and latency spikes cut it."""
+    waits = []
+    monkeypatch.setattr(scraper.time, 'sleep', waits.append)
+    state = {}
+    limiter = scraper.HostLimiter(state)
+    url = 'https://example.edu/placement'
+
+    for _ in range(4):
+        with limiter.slot(url):
+            limiter.record(url, 0.2, 200)
+    assert state['hosts']['example.edu']['limit'] == 2.0
+    # Start times are reserved REQUEST_INTERVAL / limit apart (sleep is stubbed, so waits add up)
+    gaps = [round(b - a, 2) for a, b in zip(waits, waits[1:])]
+    assert waits[0] == 0 and gaps == [1.0, 0.8, 0.67]
+
+    limiter.record(url, 5.0, 200)  # latency spike
+    limiter.record(url, 0.2, 503)
+    assert state['hosts']['example.edu']['limit'] == 0.5
+    limiter.record(url, 0.2, 429, retry_after=scraper.retry_after_seconds('30'))
+    assert state['hosts']['example.edu']['limit'] == 0.25
+    waits.clear()
+    with limiter.slot(url):
+        pass
+    assert 29 < waits[0] <= 30
+    assert scraper.retry_after_seconds('Wed, 21 Oct 2015 07:28:00 GMT') == 0
+
+
+def test_rate_limited_host_is_paused_not_dropped(isolated, monkeypatch):
+    """Verify a 429 with Retry-After delays the host's next request instead of skipping the host."""
+    class TooManyRequests(FakeResponse):
+        status_code = 429
+        headers = {'retry-after': '5'}
+
+        def raise_for_status(self):
+            import requests
+            raise requests.HTTPError('429 Too Many Requests', response=self)
+
+    sent = []
+    waits = []
+    s = _scraper(monkeypatch)
+    monkeypatch.setattr(s.session, 'get', lambda url, timeout: sent.append(url) or (
+        TooManyRequests() if '/a' in url else FakeResponse()))
+    monkeypatch.setattr(scraper.time, 'sleep', waits.append)
+
+    limited = [f'https://h.edu/a{i}' for i in range(scraper.BREAKER_FAILURES)]
+    for url in limited:
+        assert s._request(url) == (None, False)
+    response, needs_selenium = s._request('https://h.edu/b')
+    assert response is not None and not needs_selenium
+    assert sent == limited + ['https://h.edu/b']
+    assert waits[-1] > 4  # waited out Retry-After (and the lowered limit's pace)
+    assert s.state['hosts']['h.edu']['limit'] < 1 and not s._unreachable
+
+
+def test_trace_records_spans_per_school_and_url(isolated, monkeypatch, tmp_path, capsys):
+    """Verify a traced scrape writes nested JSON-line spans and reports them."""
+    from tracing import Tracer, load_spans, print_report, summarize
+    tracer = Tracer(str(tmp_path / 'trace.jsonl'))
+    s = scraper.EconPhDScraper(tracer=tracer)
+    monkeypatch.setattr(s.session, 'get', lambda url, timeout: FakeResponse())
+    s.scrape_school('Nowhere State', {'urls': ['https://example.edu/placement']})
+    tracer.close()
+
+    spans = load_spans(tracer.path)
+    assert [span['name'] for span in spans] == ['request', 'build_soup', 'parse', 'school']
+    school = spans[-1]
+    assert school['candidates'] == 1 and school['parent'] is None
+    assert spans[1]['parent'] == spans[2]['parent'] == school['id']
+    assert spans[0]['status'] == 200 and spans[2]['strategies'] == ['generic:tables']
+
+    summary = summarize(spans)
+    assert summary['schools'][0][0] == 'Nowhere State'
+    assert summary['urls'][0][0] == 'https://example.edu/placement'
+    print_report(spans)
+    assert 'SLOWEST SCHOOLS' in capsys.readouterr().out
+
+
+def test_interrupted_run_resumes_from_candidate_sink(isolated, monkeypatch):
+    """Verify finished schools are sinked as they complete and a rerun skips them."""
+    schools = {name: {'urls': [f'https://{name}.edu/placement']} for name in ('a', 'b', 'c')}
+    scraped = []
+
+    def scrape_school(school, config):
+        if school == 'b' and not scraped.count('b'):
+            scraped.append(school)
+            raise KeyboardInterrupt
+        scraped.append(school)
+        return [{'name': f'Jane {school}', 'school': school, 'initial_placement': 'Amazon'}]
+
+    first = _scraper(monkeypatch)
+    monkeypatch.setattr(first, 'schedule', lambda schools, budget: (schools, []))
+    monkeypatch.setattr(first, 'scrape_school', scrape_school)
+    with pytest.raises(KeyboardInterrupt):
+        first.scrape_all(schools)
+    assert first.sink.resumable() == ['a']
+
+    second = _scraper(monkeypatch)
+    monkeypatch.setattr(second, 'scrape_school', scrape_school)
+    df = second.scrape_all(schools)
+    assert sorted(scraped[2:]) == ['b', 'c']  # 'a' came from the sink
+    assert sorted(df['school']) == ['a', 'b', 'c']
+    assert second.sink.resumable() == []
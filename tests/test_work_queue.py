@@ -0,0 +1,49 @@
+"""Tests for the scrape/enrich work queue."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from work_queue import SQLiteQueue, open_queue, run_worker  # noqa: E402
+
+
+def test_expired_lease_is_reclaimed_and_result_committed_once(tmp_path):
+    """Verify a crashed worker's job goes to another worker and its late result is discarded."""
+    queue = SQLiteQueue(str(tmp_path / 'jobs.sqlite'))
+    assert queue.enqueue('scrape', 'MIT', {'school': 'MIT'})
+    assert not queue.enqueue('scrape', 'MIT', {'school': 'MIT'})
+
+    crashed = queue.claim('a', ['scrape'], lease_seconds=0)  # lease already expired
+    # Another process on the same file takes the job over
+    other = open_queue(f"sqlite:///{tmp_path / 'jobs.sqlite'}")
+    job = other.claim('b', ['scrape', 'enrich'])
+    assert (job.key, job.attempt) == ('MIT', 2) and other.claim('c', ['scrape']) is None
+
+    assert not queue.complete(crashed, ['stale'])
+    assert other.complete(job, [{'name': 'Jane Doe'}])
+    assert not other.complete(job, ['again'])
+    assert queue.results('scrape') == {'MIT': [{'name': 'Jane Doe'}]}
+    assert not queue.enqueue('scrape', 'MIT', {'school': 'MIT'})
+    assert queue.enqueue('scrape', 'MIT', {'school': 'MIT'}, again=True)
+    assert queue.status() == {'scrape': {'pending': 1}}
+
+
+def test_failed_jobs_are_retried_until_max_attempts(tmp_path):
+    """Verify handler errors release the job for a retry and give up after max_attempts."""
+    queue = SQLiteQueue(str(tmp_path / 'jobs.sqlite'), max_attempts=3, retry_delay=0)
+    queue.enqueue('enrich', 'Yale|Jane Doe', {'name': 'Jane Doe'})
+    queue.enqueue('enrich', 'Yale|John Roe', {'name': 'John Roe'})
+    calls = []
+
+    def enrich(payload):
+        calls.append(payload['name'])
+        if payload['name'] == 'John Roe' or calls.count('Jane Doe') < 2:
+            raise RuntimeError('rate limited')
+        return {'current_company': 'Amazon'}
+
+    assert run_worker(queue, {'enrich': enrich}, worker='w') == 1
+    assert calls.count('Jane Doe') == 2 and calls.count('John Roe') == 3
+    assert queue.results('enrich') == {'Yale|Jane Doe': {'current_company': 'Amazon'}}
+    assert queue.errors() == [('enrich', 'Yale|John Roe', 'RuntimeError: rate limited')]
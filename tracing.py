@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Span tracing for scrape runs.
+
+A span is one timed step (a school, a request, a parse, ...) written as a
+JSON line when it ends: its name, start time, seconds and attributes such
+as url, school, status or bytes. Spans nest per thread (each has its
+parent's id), and print_report() summarizes them: time by phase, slowest
+schools and URLs, and the request breakdown (connect, time to first byte,
+download).
+
+Usage:
+    python scraper.py --trace data/trace.jsonl   # trace a scrape and print the report
+    python tracing.py data/trace.jsonl           # report on a saved trace
+"""
+import argparse
+import itertools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+# Spans measuring one phase of the work (the rest are containers, like 'school')
+PHASES = ['request', 'build_soup', 'parse', 'selenium', 'pdf']
+
+
+class Tracer:
+    """Collects spans, writing each to path as a JSON line (disabled without a path)."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.spans: List[dict] = []
+        self._file = open(path, 'w') if path else None
+        self._lock = threading.Lock()
+        self._local = threading.local()  # stack of open span ids
+        self._ids = itertools.count(1)
+
+    @property
+    def enabled(self) -> bool:
+        return self._file is not None
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """Time the block as a span; the yielded dict takes more attributes."""
+        span = {'name': name, **attrs}
+        if not self.enabled:
+            yield span
+            return
+        stack = self._local.__dict__.setdefault('stack', [])
+        span['id'] = next(self._ids)
+        span['parent'] = stack[-1] if stack else None
+        span['start'] = round(time.time(), 3)
+        stack.append(span['id'])
+        started = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span['error'] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span['seconds'] = round(time.perf_counter() - started, 4)
+            stack.pop()
+            with self._lock:
+                self.spans.append(span)
+                self._file.write(json.dumps(span, default=str) + '\n')
+                self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def load_spans(path: str) -> List[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def summarize(spans: List[dict], top: int = 10) -> Dict[str, object]:
+    """Time by phase, slowest schools and URLs, and request timing averages."""
+    phases = {name: 0.0 for name in PHASES}
+    urls: Dict[str, Dict[str, float]] = {}
+    for span in spans:
+        if span['name'] in phases:
+            phases[span['name']] += span['seconds']
+            if span.get('url'):
+                url = urls.setdefault(span['url'], {'total': 0.0})
+                url[span['name']] = url.get(span['name'], 0.0) + span['seconds']
+                url['total'] += span['seconds']
+
+    schools = sorted((s for s in spans if s['name'] == 'school'), key=lambda s: s['seconds'], reverse=True)
+    requests = [s for s in spans if s['name'] == 'request' and s.get('status')]
+
+    def mean(key):
+        values = [s[key] for s in requests if s.get(key) is not None]
+        return round(sum(values) / len(values), 4) if values else None
+
+    return {
+        'phases': {name: round(seconds, 2) for name, seconds in phases.items()},
+        'schools': [(s['school'], s['seconds'], s.get('candidates')) for s in schools[:top]],
+        'urls': sorted(((url, {k: round(v, 2) for k, v in t.items()}) for url, t in urls.items()),
+                       key=lambda item: item[1]['total'], reverse=True)[:top],
+        'requests': {
+            'count': len(requests),
+            'reused_connections': sum(1 for s in requests if s.get('connect') == 0),
+            'connect': mean('connect'), 'ttfb': mean('ttfb'), 'download': mean('download'),
+            'wait': mean('wait'), 'bytes': mean('bytes') and round(mean('bytes')),
+        },
+    }
+
+
+def print_report(spans: List[dict], top: int = 10):
+    """Print summarize() as a readable report."""
+    summary = summarize(spans, top)
+    total = sum(summary['phases'].values()) or 1
+
+    print(f"\n{'='*50}")
+    print("TIME BY PHASE:")
+    for name, seconds in sorted(summary['phases'].items(), key=lambda item: item[1], reverse=True):
+        print(f"  {name:<12} {seconds:>8.1f}s  {100 * seconds / total:5.1f}%")
+
+    print(f"\n{'='*50}")
+    print("SLOWEST SCHOOLS:")
+    for school, seconds, candidates in summary['schools']:
+        print(f"  {seconds:>8.1f}s  {school} ({candidates} tech placements)")
+
+    print(f"\n{'='*50}")
+    print("SLOWEST URLS:")
+    for url, times in summary['urls']:
+        split = ', '.join(f"{name} {seconds:.1f}s" for name, seconds in times.items() if name != 'total')
+        print(f"  {times['total']:>8.1f}s  {url} ({split})")
+
+    r = summary['requests']
+    if r['count']:
+        print(f"\n{'='*50}")
+        print(f"REQUESTS: {r['count']}, {r['reused_connections']} on reused connections")
+        print(f"  mean connect {r['connect']}s, time to first byte {r['ttfb']}s, download {r['download']}s, "
+              f"waiting for host limit {r['wait']}s, {r['bytes']} bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize a scrape trace (JSON lines)')
+    parser.add_argument('trace', help='Trace file written with scraper.py --trace')
+    parser.add_argument('--top', type=int, default=10, help='Schools and URLs to list')
+    args = parser.parse_args()
+    print_report(load_spans(args.trace), args.top)
+
+
+if __name__ == "__main__":
+    main()
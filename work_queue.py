@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Work queue for running scrape and enrichment jobs on many workers.
+
+A job is one school to scrape or one candidate to enrich, keyed by
+(kind, key) so enqueueing the same work twice is a no-op. Workers on any
+number of processes or machines claim jobs under a lease, renew it while
+they run, and commit the result. A worker that crashes stops renewing, its
+lease expires and another worker picks the job up. Failed jobs are retried
+with backoff up to max_attempts. A result is only committed by the worker
+holding the job's current lease, and only once.
+
+The default backend is a SQLite file (put it on a shared filesystem for
+several machines); other backends implement JobQueue and are added with
+register_backend, then chosen with --queue scheme://location.
+
+Usage:
+    python work_queue.py enqueue scrape [--schools MIT Harvard]
+    python work_queue.py enqueue enrich
+    python work_queue.py work [--kinds scrape]  # on each machine, as often as wanted
+    python work_queue.py status
+    python work_queue.py collect scrape         # results -> data/candidates.csv
+    python work_queue.py collect enrich         # results -> data/candidates_enriched.csv
+"""
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+QUEUE_URL = 'sqlite:///data/jobs.sqlite'
+KINDS = ['scrape', 'enrich']
+LEASE_SECONDS = 600  # renewed every third of this while a job runs
+MAX_ATTEMPTS = 3
+RETRY_DELAY = 30  # seconds before the first retry, doubled for each later one
+
+CANDIDATES = 'data/candidates.csv'
+ENRICHED = 'data/candidates_enriched.csv'
+
+
+class Job(NamedTuple):
+    id: int
+    kind: str
+    key: str
+    payload: Any
+    attempt: int  # identifies the lease: a re-claimed job has a new attempt
+    worker: str
+
+
+class JobQueue:
+    """Queue backend interface."""
+
+    def enqueue(self, kind: str, key: str, payload: Any, again: bool = False) -> bool:
+        """Add a job unless (kind, key) exists; again re-runs a finished one. True if queued."""
+        raise NotImplementedError
+
+    def claim(self, worker: str, kinds: List[str], lease_seconds: float = LEASE_SECONDS) -> Optional[Job]:
+        """Lease the next due job (pending, or leased with the lease expired)."""
+        raise NotImplementedError
+
+    def renew(self, job: Job, lease_seconds: float = LEASE_SECONDS) -> bool:
+        """Extend the job's lease. False if the lease was lost."""
+        raise NotImplementedError
+
+    def complete(self, job: Job, result: Any) -> bool:
+        """Commit the job's result. False (and nothing written) if the lease was lost."""
+        raise NotImplementedError
+
+    def fail(self, job: Job, error: str) -> bool:
+        """Release the job for a retry, or mark it failed after max attempts."""
+        raise NotImplementedError
+
+    def results(self, kind: str) -> Dict[str, Any]:
+        """Committed results of kind, by key."""
+        raise NotImplementedError
+
+    def status(self) -> Dict[str, Dict[str, int]]:
+        """Job counts per kind and state."""
+        raise NotImplementedError
+
+    def errors(self) -> List[tuple]:
+        """(kind, key, error) of failed jobs."""
+        raise NotImplementedError
+
+
+class SQLiteQueue(JobQueue):
+    """Queue in a SQLite file; each change is a single atomic statement."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY,
+            kind TEXT NOT NULL,
+            key TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            state TEXT NOT NULL DEFAULT 'pending',  -- pending, leased, done, failed
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL,
+            available_at REAL NOT NULL,
+            worker TEXT,
+            lease_expires REAL,
+            result TEXT,
+            error TEXT,
+            UNIQUE (kind, key)
+        )
+    """
+    # The job's current lease: a re-claimed job has another worker or attempt
+    HELD = "id = ? AND state = 'leased' AND worker = ? AND attempts = ?"
+
+    def __init__(self, path: str, max_attempts: int = MAX_ATTEMPTS, retry_delay: float = RETRY_DELAY):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.db = sqlite3.connect(path, timeout=60, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()  # the connection is shared with the lease renewal thread
+        self.db.execute(self.SCHEMA)
+
+    def _rows(self, sql: str, params=()) -> list:
+        with self._lock:
+            return self.db.execute(sql, params).fetchall()
+
+    def _update(self, sql: str, params=()) -> int:
+        """Run a write and return the number of rows it changed."""
+        with self._lock:
+            return self.db.execute(sql, params).rowcount
+
+    def enqueue(self, kind, key, payload, again=False) -> bool:
+        sql = """INSERT INTO jobs (kind, key, payload, max_attempts, available_at)
+                 VALUES (?, ?, ?, ?, ?)
+                 ON CONFLICT (kind, key) DO """
+        if again:
+            sql += """UPDATE SET payload = excluded.payload, state = 'pending', attempts = 0,
+                      available_at = excluded.available_at, result = NULL, error = NULL
+                      WHERE state IN ('done', 'failed')"""
+        else:
+            sql += "NOTHING"
+        return self._update(sql, (kind, key, json.dumps(payload), self.max_attempts, time.time())) > 0
+
+    def claim(self, worker, kinds, lease_seconds=LEASE_SECONDS) -> Optional[Job]:
+        now = time.time()
+        # Jobs whose last allowed attempt crashed are not handed out again
+        self._update("""UPDATE jobs SET state = 'failed', error = 'lease expired (worker ' || worker || ')'
+                        WHERE state = 'leased' AND lease_expires <= ? AND attempts >= max_attempts""", (now,))
+        marks = ', '.join('?' * len(kinds))
+        rows = self._rows(f"""
+            UPDATE jobs SET state = 'leased', worker = ?, lease_expires = ?, attempts = attempts + 1
+            WHERE id = (
+                SELECT id FROM jobs
+                WHERE kind IN ({marks})
+                  AND ((state = 'pending' AND available_at <= ?) OR (state = 'leased' AND lease_expires <= ?))
+                ORDER BY available_at, id LIMIT 1)
+            RETURNING id, kind, key, payload, attempts""",
+            (worker, now + lease_seconds, *kinds, now, now))
+        if not rows:
+            return None
+        job_id, kind, key, payload, attempt = rows[0]
+        return Job(job_id, kind, key, json.loads(payload), attempt, worker)
+
+    def renew(self, job, lease_seconds=LEASE_SECONDS) -> bool:
+        return self._update(f"UPDATE jobs SET lease_expires = ? WHERE {self.HELD}",
+                            (time.time() + lease_seconds, job.id, job.worker, job.attempt)) > 0
+
+    def complete(self, job, result) -> bool:
+        return self._update(f"UPDATE jobs SET state = 'done', result = ?, error = NULL WHERE {self.HELD}",
+                            (json.dumps(result, default=str), job.id, job.worker, job.attempt)) > 0
+
+    def fail(self, job, error) -> bool:
+        delay = self.retry_delay * 2 ** (job.attempt - 1)
+        return self._update(f"""
+            UPDATE jobs SET state = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'pending' END,
+                            available_at = ?, error = ?, worker = NULL, lease_expires = NULL
+            WHERE {self.HELD}""", (time.time() + delay, error, job.id, job.worker, job.attempt)) > 0
+
+    def results(self, kind) -> Dict[str, Any]:
+        rows = self._rows("SELECT key, result FROM jobs WHERE kind = ? AND state = 'done' ORDER BY id", (kind,))
+        return {key: json.loads(result) for key, result in rows}
+
+    def status(self) -> Dict[str, Dict[str, int]]:
+        counts = {}
+        for kind, state, n in self._rows("SELECT kind, state, COUNT(*) FROM jobs GROUP BY kind, state"):
+            counts.setdefault(kind, {})[state] = n
+        return counts
+
+    def errors(self) -> List[tuple]:
+        return self._rows("SELECT kind, key, error FROM jobs WHERE state = 'failed' ORDER BY id")
+
+
+# scheme -> backend class, constructed with the URL's location
+BACKENDS: Dict[str, Callable[[str], JobQueue]] = {'sqlite': SQLiteQueue}
+
+
+def register_backend(scheme: str, backend: Callable[[str], JobQueue]):
+    """Make a JobQueue implementation available as --queue scheme://location."""
+    BACKENDS[scheme] = backend
+
+
+def open_queue(url: str = QUEUE_URL) -> JobQueue:
+    """Open a queue by URL: 'sqlite:///data/jobs.sqlite' (or a plain path), 'scheme://...'."""
+    scheme, sep, location = url.partition('://')
+    if not sep:
+        return SQLiteQueue(url)
+    if scheme not in BACKENDS:
+        raise ValueError(f"Unknown queue backend {scheme!r}; expected one of {sorted(BACKENDS)}")
+    if scheme == 'sqlite':
+        location = location[1:]  # sqlite:///relative/path, sqlite:////absolute/path
+    return BACKENDS[scheme](location)
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def run_worker(queue: JobQueue, handlers: Dict[str, Callable[[Any], Any]], worker: Optional[str] = None,
+               lease_seconds: float = LEASE_SECONDS, poll: Optional[float] = None,
+               max_jobs: Optional[int] = None) -> int:
+    """Claim and run jobs until the queue has none due (or, with poll, forever).
+
+    handlers maps job kind -> function(payload) returning a JSON-serializable
+    result. Returns the number of results committed.
+    """
+    worker = worker or default_worker_id()
+    committed = 0
+    done = 0
+    while max_jobs is None or done < max_jobs:
+        job = queue.claim(worker, list(handlers), lease_seconds)
+        if job is None:
+            if poll is None:
+                break
+            time.sleep(poll)
+            continue
+        done += 1
+        print(f"[{worker}] {job.kind} {job.key} (attempt {job.attempt})")
+
+        # Renew the lease while the handler runs; a dead worker stops renewing
+        stop = threading.Event()
+
+        def renew():
+            while not stop.wait(lease_seconds / 3):
+                if not queue.renew(job, lease_seconds):
+                    return
+        renewer = threading.Thread(target=renew, daemon=True)
+        renewer.start()
+        try:
+            result = handlers[job.kind](job.payload)
+        except Exception as e:
+            queue.fail(job, f"{type(e).__name__}: {e}")
+            print(f"  [FAILED] {type(e).__name__}: {e}")
+            continue
+        finally:
+            stop.set()
+            renewer.join()
+        if queue.complete(job, result):
+            committed += 1
+        else:
+            print(f"  [LOST LEASE] result discarded, {job.key} was taken over by another worker")
+    return committed
+
+
+# =============================================================================
+# Scrape and enrich jobs
+# =============================================================================
+
+def enrich_key(row) -> str:
+    """Job key of a candidate row: school and name, the columns candidates are unique by."""
+    return f"{row['school']}|{row['name']}"
+
+
+def enqueue_scrape(queue: JobQueue, schools: Dict[str, dict], again: bool = False) -> int:
+    """Queue one job per school, longest first by recorded duration so no slow school runs last."""
+    from scraper import EconPhDScraper
+    ordered, _ = EconPhDScraper().schedule(schools)
+    return sum(queue.enqueue('scrape', school, {'school': school}, again=again) for school in ordered)
+
+
+def enqueue_enrich(queue: JobQueue, df, force: bool = False, again: bool = False) -> int:
+    """Queue one job per candidate not yet enriched."""
+    from enricher import is_already_enriched
+    from normalize import normalize_company
+
+    queued = 0
+    for _, row in df.iterrows():
+        if not force and is_already_enriched(row, check_work_focus=False):
+            continue
+        payload = json.loads(row.to_json())  # NaN -> None
+        payload['initial_placement'] = normalize_company(row.get('initial_placement', ''))
+        queued += queue.enqueue('enrich', enrich_key(row), payload, again=again)
+    return queued
+
+
+class JobRunner:
+    """Handlers for scrape and enrich jobs, reusing one scraper per worker."""
+
+    def __init__(self, force: bool = False, include_scholar: bool = True, due_only: bool = False):
+        self.force = force
+        self.due_only = due_only
+        self.include_scholar = include_scholar
+        self._scraper = None
+
+    def scrape(self, payload: dict) -> List[Dict]:
+        from scraper import SCHOOLS, EconPhDScraper
+        if self._scraper is None:
+            self._scraper = EconPhDScraper(force=self.force, due_only=self.due_only)
+        try:
+            return self._scraper.scrape_school(payload['school'], SCHOOLS[payload['school']])
+        finally:
+            # Merged into the shared state file after every school
+            self._scraper._save_state()
+
+    def enrich(self, payload: dict) -> dict:
+        import pandas as pd
+        from enricher import enrich_candidate
+        return enrich_candidate(pd.Series(payload), include_scholar=self.include_scholar)
+
+    def close(self):
+        if self._scraper is not None:
+            self._scraper._close_driver()
+
+
+def collect_scrape(queue: JobQueue, output: str = CANDIDATES) -> 'pd.DataFrame':
+    """Write scrape results to output, replacing only the scraped schools' rows."""
+    import pandas as pd
+    from scraper import EconPhDScraper
+
+    results = queue.results('scrape')
+    if not results:
+        print("No scrape results to collect")
+        return pd.DataFrame()
+    df = pd.DataFrame([c for candidates in results.values() for c in candidates])
+    if not df.empty:
+        df = df.drop_duplicates(subset=['name', 'school'])
+    if Path(output).exists():
+        existing = pd.read_csv(output)
+        df = pd.concat([existing[~existing['school'].isin(results)], df], ignore_index=True)
+    if not df.empty:
+        EconPhDScraper().save(df, output)
+    print(f"Collected {len(results)} school(s), {len(df)} candidates")
+    return df
+
+
+def collect_enrich(queue: JobQueue, output: str = ENRICHED) -> 'pd.DataFrame':
+    """Apply enrich results to the enriched candidates (or candidates.csv) and write output."""
+    import pandas as pd
+    from enricher import add_enrichment_columns, apply_enrichment
+    from normalize import normalize_company
+
+    df = pd.read_csv(output if Path(output).exists() else CANDIDATES)
+    df['initial_placement'] = df['initial_placement'].apply(normalize_company)
+    add_enrichment_columns(df)
+    results = queue.results('enrich')
+    applied = 0
+    for idx, row in df.iterrows():
+        info = results.get(enrich_key(row))
+        if info is not None:
+            apply_enrichment(df, idx, info)
+            applied += 1
+    df.to_csv(output, index=False)
+    print(f"Applied {applied} of {len(results)} enrichment result(s) to {output}")
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Queue scrape/enrich jobs and run workers for them')
+    parser.add_argument('--queue', default=QUEUE_URL, help=f'Queue URL (default: {QUEUE_URL})')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    enqueue = commands.add_parser('enqueue', help='Add jobs')
+    enqueue.add_argument('kind', choices=KINDS)
+    enqueue.add_argument('--schools', nargs='+', metavar='SCHOOL', help='Only these schools (scrape)')
+    enqueue.add_argument('--force', action='store_true', help='Also candidates already enriched (enrich)')
+    enqueue.add_argument('--again', action='store_true', help='Re-run jobs that already finished')
+
+    work = commands.add_parser('work', help='Run jobs until none are due')
+    work.add_argument('--kinds', nargs='+', choices=KINDS, default=KINDS)
+    work.add_argument('--worker', help='Worker id (default: host:pid)')
+    work.add_argument('--lease', type=float, default=LEASE_SECONDS, help='Lease length in seconds')
+    work.add_argument('--poll', type=float, help='Keep waiting for jobs, checking every POLL seconds')
+    work.add_argument('--force', action='store_true', help='Force re-scrape, ignoring the page cache')
+    work.add_argument('--no-scholar', action='store_true', help='Skip Google Scholar enrichment')
+    work.add_argument('--due-only', action='store_true', help='Only fetch pages due for a refresh')
+
+    commands.add_parser('status', help='Show job counts and failures')
+
+    collect = commands.add_parser('collect', help='Write committed results to the CSVs')
+    collect.add_argument('kind', choices=KINDS)
+    args = parser.parse_args()
+
+    try:
+        queue = open_queue(args.queue)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.command == 'enqueue':
+        if args.kind == 'scrape':
+            from scraper import SCHOOLS, select_schools
+            try:
+                schools = select_schools(SCHOOLS, args.schools)
+            except KeyError as e:
+                parser.error(e.args[0])
+            queued = enqueue_scrape(queue, schools, again=args.again)
+        else:
+            import pandas as pd
+            df = pd.read_csv(ENRICHED if Path(ENRICHED).exists() and not args.force else CANDIDATES)
+            queued = enqueue_enrich(queue, df, force=args.force, again=args.again)
+        print(f"Queued {queued} {args.kind} job(s)")
+
+    elif args.command == 'work':
+        include_scholar = False
+        if 'enrich' in args.kinds:
+            from enricher import PERPLEXITY_API_KEY, get_scholarly
+            if not PERPLEXITY_API_KEY:
+                parser.error("PERPLEXITY_API_KEY not set (needed for enrich jobs; use --kinds scrape)")
+            include_scholar = not args.no_scholar and get_scholarly() is not None
+        runner = JobRunner(force=args.force, include_scholar=include_scholar, due_only=args.due_only)
+        handlers = {kind: getattr(runner, kind) for kind in args.kinds}
+        try:
+            committed = run_worker(queue, handlers, worker=args.worker, lease_seconds=args.lease, poll=args.poll)
+        finally:
+            runner.close()
+        print(f"\n{'='*50}")
+        print(f"Committed {committed} result(s)")
+
+    elif args.command == 'status':
+        for kind, counts in sorted(queue.status().items()):
+            print(f"{kind}: " + ', '.join(f"{n} {state}" for state, n in sorted(counts.items())))
+        for kind, key, error in queue.errors():
+            print(f"  [FAILED] {kind} {key}: {error}")
+
+    else:
+        (collect_scrape if args.kind == 'scrape' else collect_enrich)(queue)
+
+
+if __name__ == "__main__":
+    main()